@@ -0,0 +1,408 @@
+"""
+登革熱疫情資料系統 - 效能測試
+量測地圖建置,GeoJSON 讀取與座標轉換,誘卵器彙總,JSON 序列化與 HTTP 請求延遲,
+資料量相關的項目使用 LargeScaleGenerator 產生的不同規模模擬資料;
+結果存成 JSON (含 git commit),可以與之前的結果比較找出效能退步
+
+    python benchmark.py                                  # 全部項目
+    python benchmark.py --scales 1 10 --only json_dumps  # 指定規模與項目
+    python benchmark.py --compare                        # 與上一次的結果比較,退步時結束代碼為 1
+"""
+
+import argparse
+import inspect
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    BENCHMARK_CONFIG, COORDINATE_SYSTEM, DISTRICT_BOUNDARIES_GEOJSON, PROJECT_ROOT, SYNTHETIC_DATA_CONFIG
+)
+
+# [(名稱, 函數, 是否依資料規模執行, 重複次數的設定鍵)]
+BENCHMARKS = []
+
+
+def benchmark(name, sized=False, repeat_key="repeat"):
+    """
+    註冊效能測試項目的裝飾器
+
+    被註冊的函數收到模擬資料 (sized=False 時為 None),回傳要計時的函數;
+    也可以是產生器,yield 要計時的函數,之後的程式碼在計時結束後執行 (釋放資源)
+
+    Args:
+        name: 項目名稱
+        sized: 是否對每個規模的模擬資料各執行一次
+        repeat_key: BENCHMARK_CONFIG 中決定重複次數的鍵
+    """
+    def decorator(func):
+        BENCHMARKS.append((name, func, sized, repeat_key))
+        return func
+    return decorator
+
+
+def summarize(samples):
+    """計時結果的統計值 (毫秒)"""
+    ms = np.asarray(samples) * 1000
+    return {
+        "runs": len(samples),
+        "min": round(float(ms.min()), 3),
+        "median": round(float(np.median(ms)), 3),
+        "mean": round(float(ms.mean()), 3),
+        "p95": round(float(np.percentile(ms, 95)), 3),
+        "max": round(float(ms.max()), 3),
+    }
+
+
+def measure(func, repeat, warmup=1):
+    """執行 warmup 次後計時 repeat 次,回傳每次的秒數"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def load_dataset(scale, seed=None):
+    """
+    取得指定規模的模擬資料,已產生過時直接使用
+
+    Returns:
+        {"dir": 資料目錄, "scale": 規模, "counts": 各項資料筆數}
+    """
+    from generate_random_data import LargeScaleGenerator
+
+    seed = SYNTHETIC_DATA_CONFIG["seed"] if seed is None else seed
+    directory = os.path.join(str(SYNTHETIC_DATA_CONFIG["output_dir"]), f"scale-{scale:g}-seed-{seed}")
+    marker = os.path.join(directory, "COMPLETE")
+    if os.path.exists(marker):
+        with open(marker, "r", encoding="utf-8") as f:
+            counts = json.load(f)
+    else:
+        print(f"產生規模 {scale:g} 的模擬資料...")
+        counts = LargeScaleGenerator(scale=scale, seed=seed).write_all(directory)
+        with open(marker, "w", encoding="utf-8") as f:
+            json.dump(counts, f)
+    return {"dir": directory, "scale": scale, "counts": counts}
+
+
+def _latest_day(history):
+    table = history.query(start=history.partitions()[-1] + "-01")
+    return np.datetime64(np.asarray(table.columns["last_check"]).max(), "D").astype(object)
+
+
+# -----------------------------------------------------------------------------
+# 地圖建置 (與資料規模無關)
+# -----------------------------------------------------------------------------
+
+@benchmark("geojson_read_reproject")
+def bench_geojson_read(_):
+    """讀取行政區 GeoJSON 並轉換座標,不使用幾何快取"""
+    from data.process_map import DistrictSource
+
+    return lambda: DistrictSource(DISTRICT_BOUNDARIES_GEOJSON, COORDINATE_SYSTEM, cache_dir=None).load()
+
+
+@benchmark("geojson_read_cached")
+def bench_geojson_cached(_):
+    """由幾何快取載入行政區"""
+    from data.process_map import DistrictSource
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        yield lambda: DistrictSource(DISTRICT_BOUNDARIES_GEOJSON, COORDINATE_SYSTEM, cache_dir).load()
+
+
+@benchmark("map_build")
+def bench_map_build(_):
+    """以已載入的行政區產生地圖 (folium 產生 HTML)"""
+    from data.process_map import DistrictSource, build_map, default_build_config
+
+    config = default_build_config()
+    source = DistrictSource(config["geojson_path"], config["coordinate_system"], None).load()
+    return lambda: build_map(config, source)
+
+
+# -----------------------------------------------------------------------------
+# 資料處理 (依模擬資料規模)
+# -----------------------------------------------------------------------------
+
+@benchmark("ovitrap_history_query", sized=True)
+def bench_history_query(dataset):
+    """查詢所有行政區最近 8 週的誘卵器紀錄"""
+    from ovitrap_history import OvitrapHistory
+
+    history = OvitrapHistory(os.path.join(dataset["dir"], "history", "ovitraps"))
+    end = _latest_day(history)
+    return lambda: history.query(start=end - timedelta(weeks=8), end=end)
+
+
+@benchmark("ovitrap_weekly_aggregation", sized=True)
+def bench_weekly_aggregation(dataset):
+    """每個行政區最近 8 週的每週卵數統計"""
+    from generate_random_data import DengueDataGenerator
+    from ovitrap_history import OvitrapHistory
+
+    history = OvitrapHistory(os.path.join(dataset["dir"], "history", "ovitraps"))
+    end = _latest_day(history)
+    districts = DengueDataGenerator().tainan_districts
+    return lambda: [history.weekly_egg_counts(district, weeks=8, end=end) for district in districts]
+
+
+@benchmark("ovitrap_risk_aggregation", sized=True)
+def bench_risk_aggregation(dataset):
+    """以 risk_engine 彙總一年的誘卵器紀錄為 (行政區 x 週) 的統計表"""
+    from generate_random_data import DengueDataGenerator
+    from ovitrap_history import OvitrapHistory
+    from risk_engine import aggregate
+
+    history = OvitrapHistory(os.path.join(dataset["dir"], "history", "ovitraps"))
+    end = _latest_day(history)
+    table = history.query(start=end - timedelta(days=365), end=end)
+    labels = np.asarray(table.categories["district"], dtype=object)
+    frame = pd.DataFrame({
+        "district": labels[np.asarray(table.columns["district"])],
+        "date": np.asarray(table.columns["last_check"]),
+        "egg_count": np.asarray(table.columns["egg_count"]),
+    })
+    population = pd.Series(DengueDataGenerator().population_base)
+    return lambda: aggregate(frame, population, count="egg_count", freq="W-SUN")
+
+
+@benchmark("incremental_summary", sized=True)
+def bench_incremental_summary(dataset):
+    """由村里,誘卵器與行政區資料重新計算行政區摘要"""
+    from incremental_summary import DistrictSummaries
+
+    paths = [os.path.join(dataset["dir"], name) for name in ("village_list.csv", "ovitrap_data.json", "district_data.json")]
+    return lambda: DistrictSummaries.from_files(*paths).flush()
+
+
+@benchmark("spatial_join", sized=True)
+def bench_spatial_join(dataset):
+    """判斷誘卵器所在的行政區"""
+    from columnar_store import load_table
+    from spatial_join import load_locator
+
+    locator = load_locator()
+    table = load_table("ovitraps", os.path.join(dataset["dir"], "columnar"))
+    lng, lat = np.asarray(table.columns["lng"]), np.asarray(table.columns["lat"])
+    return lambda: locator.locate(lng, lat)
+
+
+@benchmark("json_dumps", sized=True)
+def bench_json_dumps(dataset):
+    """serializers.dumps() 序列化誘卵器資料"""
+    from serializers import dumps, read_json
+
+    records = read_json(os.path.join(dataset["dir"], "ovitrap_data.json"))
+    return lambda: dumps(records)
+
+
+@benchmark("json_dumps_stdlib", sized=True)
+def bench_json_dumps_stdlib(dataset):
+    """標準函式庫 json 序列化誘卵器資料 (對照組)"""
+    from serializers import read_json
+
+    records = read_json(os.path.join(dataset["dir"], "ovitrap_data.json"))
+    return lambda: json.dumps(records, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+@benchmark("json_loads", sized=True)
+def bench_json_loads(dataset):
+    """serializers.loads() 解析誘卵器資料"""
+    from serializers import loads
+
+    with open(os.path.join(dataset["dir"], "ovitrap_data.json"), "rb") as f:
+        body = f.read()
+    return lambda: loads(body)
+
+
+# -----------------------------------------------------------------------------
+# HTTP 請求延遲 (程式內的 ASGI 客戶端,不經過網路)
+# -----------------------------------------------------------------------------
+
+def _client():
+    from fastapi.testclient import TestClient
+
+    import main
+
+    return TestClient(main.app)
+
+
+@benchmark("http_index", repeat_key="requests")
+def bench_http_index(_):
+    """GET / (快取的地圖 HTML)"""
+    with _client() as client:
+        yield lambda: client.get("/").raise_for_status()
+
+
+@benchmark("http_update_map")
+def bench_http_update_map(_):
+    """GET /api/update-map (強制重建地圖並等待完成)"""
+    with _client() as client:
+        yield lambda: client.get("/api/update-map").raise_for_status()
+
+
+def run_benchmark(func, dataset, repeat):
+    """執行單一項目,回傳統計值"""
+    if inspect.isgeneratorfunction(func):
+        generator = func(dataset)
+        timed = next(generator)
+        try:
+            return summarize(measure(timed, repeat))
+        finally:
+            generator.close()
+    return summarize(measure(func(dataset), repeat))
+
+
+def _git(*args):
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=str(PROJECT_ROOT), capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scales=None, only=None, config=None):
+    """
+    執行效能測試
+
+    Args:
+        scales: 模擬資料規模,預設為 config["scales"]
+        only: 只執行這些項目,None 表示全部
+        config: 設定,預設為 BENCHMARK_CONFIG
+
+    Returns:
+        結果 dict,results 為 {項目: {規模: 統計值}},與資料規模無關的項目規模為 "-"
+    """
+    if config is None:
+        config = BENCHMARK_CONFIG
+    scales = config["scales"] if scales is None else scales
+    from serializers import BACKEND
+
+    results = {}
+    datasets = {}
+    for name, func, sized, repeat_key in BENCHMARKS:
+        if only and name not in only:
+            continue
+        results[name] = {}
+        for scale in scales if sized else [None]:
+            if sized and scale not in datasets:
+                datasets[scale] = load_dataset(scale)
+            stats = run_benchmark(func, datasets.get(scale), config[repeat_key])
+            key = f"{scale:g}" if sized else "-"
+            results[name][key] = stats
+            print(f"{name:<28} {key:>6} 中位數 {stats['median']:>10.3f} ms  p95 {stats['p95']:>10.3f} ms")
+
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "json_backend": BACKEND,
+        "datasets": {f"{scale:g}": dataset["counts"] for scale, dataset in datasets.items()},
+        "results": results,
+    }
+
+
+def save_results(report, results_dir=None):
+    """將結果寫入 results_dir/<時間>-<commit>.json"""
+    results_dir = str(results_dir if results_dir is not None else BENCHMARK_CONFIG["results_dir"])
+    os.makedirs(results_dir, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(results_dir, f"{stamp}-{report['commit'] or 'unknown'}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def previous_results(results_dir=None, exclude=None):
+    """最近一次的結果檔案路徑,沒有時為 None"""
+    results_dir = str(results_dir if results_dir is not None else BENCHMARK_CONFIG["results_dir"])
+    if not os.path.isdir(results_dir):
+        return None
+    paths = sorted(
+        os.path.join(results_dir, name) for name in os.listdir(results_dir) if name.endswith(".json")
+    )
+    paths = [path for path in paths if path != exclude]
+    return paths[-1] if paths else None
+
+
+def compare(current, baseline, threshold=None):
+    """
+    比較兩次結果的中位數
+
+    Args:
+        current: 本次結果
+        baseline: 比較對象
+        threshold: 變慢超過此比例視為退步,預設為 BENCHMARK_CONFIG["regression_threshold"]
+
+    Returns:
+        (退步的項目, 所有比較結果),每項為 (項目, 規模, 之前的中位數, 本次的中位數, 比例),只含兩邊都有的項目
+    """
+    if threshold is None:
+        threshold = BENCHMARK_CONFIG["regression_threshold"]
+    rows = []
+    for name, by_scale in current["results"].items():
+        for scale, stats in by_scale.items():
+            before = baseline["results"].get(name, {}).get(scale)
+            if before is None or before["median"] <= 0:
+                continue
+            rows.append((name, scale, before["median"], stats["median"], stats["median"] / before["median"]))
+    return [row for row in rows if row[4] > 1 + threshold], rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="登革熱疫情資料系統效能測試")
+    parser.add_argument("--scales", type=float, nargs="+", help="模擬資料規模,預設為 BENCHMARK_CONFIG['scales']")
+    parser.add_argument("--only", nargs="+", help="只執行這些項目")
+    parser.add_argument("--repeat", type=int, help="每個項目的計時次數,預設為 BENCHMARK_CONFIG['repeat']")
+    parser.add_argument("--compare", nargs="?", const="latest", help="與指定的結果檔 (預設為上一次的結果) 比較")
+    parser.add_argument("--list", action="store_true", help="列出所有項目")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, func, sized, _ in BENCHMARKS:
+            print(f"{name:<28} {'依規模' if sized else '':<6} {inspect.getdoc(func)}")
+        return 0
+    if args.only:
+        unknown = set(args.only) - {name for name, _, _, _ in BENCHMARKS}
+        if unknown:
+            parser.error(f"未知的項目: {', '.join(sorted(unknown))}")
+
+    config = dict(BENCHMARK_CONFIG)
+    if args.repeat:
+        config["repeat"] = config["requests"] = args.repeat
+    report = run(args.scales, args.only, config)
+    path = save_results(report)
+    print(f"結果: {path}")
+
+    if args.compare:
+        baseline_path = previous_results(exclude=path) if args.compare == "latest" else args.compare
+        if baseline_path is None:
+            print("沒有可比較的結果")
+            return 0
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions, rows = compare(report, baseline)
+        print(f"\n與 {baseline.get('commit')} ({os.path.basename(baseline_path)}) 比較:")
+        for name, scale, before, after, ratio in rows:
+            mark = "  <- 退步" if (name, scale, before, after, ratio) in regressions else ""
+            print(f"{name:<28} {scale:>6} {before:>10.3f} -> {after:>10.3f} ms ({ratio:.2f}x){mark}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
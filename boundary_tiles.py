@@ -0,0 +1,370 @@
+"""
+登革熱疫情資料系統 - 行政區邊界多解析度預先簡化
+依縮放等級預先產生簡化過的行政區邊界,瀏覽器只需下載該縮放等級看得出差異的頂點;
+除了 GeoJSON 之外也產生共用邊界只存一次的量化 TopoJSON,並預先壓縮成 gzip/brotli
+
+單獨執行時會將各等級輸出到 BOUNDARY_LEVELS_DIR:
+    python boundary_tiles.py
+"""
+
+import hashlib
+import math
+import os
+import sys
+
+import geopandas as gpd
+import shapely
+
+from config import (
+    BOUNDARY_CONFIG, BOUNDARY_LEVELS_DIR, COORDINATE_SYSTEM, DISTRICT_BOUNDARIES_GEOJSON
+)
+from compression import ENCODING_SUFFIXES, choose_encoding, compress_variants
+from serializers import dumps
+
+# 縮放等級 0 時赤道上每像素的公尺數 (Web Mercator, 256px 圖磚)
+METERS_PER_PIXEL_Z0 = 156543.03392804097
+
+# 各輸出格式的 Content-Type
+BOUNDARY_MEDIA_TYPES = {
+    "geojson": "application/geo+json",
+    "topojson": "application/json",
+}
+
+
+def tolerance_for_zoom(zoom, latitude, pixel_tolerance=1.0):
+    """
+    計算某縮放等級下的簡化容許誤差 (公尺)
+
+    Args:
+        zoom: 縮放等級
+        latitude: 資料所在緯度,用來修正 Web Mercator 的比例
+        pixel_tolerance: 容許誤差的像素數
+    """
+    return pixel_tolerance * METERS_PER_PIXEL_Z0 * math.cos(math.radians(latitude)) / (2 ** zoom)
+
+
+def precision_for_zoom(zoom):
+    """經緯度保留的小數位數,誤差不超過該縮放等級半個像素"""
+    degrees_per_pixel = 360.0 / (256 * 2 ** zoom)
+    return max(0, math.ceil(-math.log10(degrees_per_pixel / 2)))
+
+
+def simplify_boundaries(gdf, tolerance, projected_crs):
+    """
+    在平面座標下簡化行政區邊界,相鄰區域的共用邊界只會被簡化一次,不會產生縫隙或重疊
+
+    Args:
+        gdf: 行政區 GeoDataFrame
+        tolerance: 容許誤差 (公尺),0 表示不簡化
+        projected_crs: 以公尺為單位的平面座標系統
+
+    Returns:
+        與輸入相同座標系統的 GeoDataFrame
+    """
+    if tolerance <= 0:
+        return gdf
+
+    projected = gdf.geometry.to_crs(projected_crs)
+    geometries = projected.values
+    if hasattr(shapely, "coverage_simplify"):
+        # shapely 2.1+ (GEOS 3.12+) 以整體覆蓋面的方式簡化,保留拓撲關係
+        simplified = shapely.coverage_simplify(geometries, tolerance)
+    else:
+        simplified = shapely.simplify(geometries, tolerance, preserve_topology=True)
+
+    return gdf.set_geometry(
+        gpd.GeoSeries(simplified, index=gdf.index, crs=projected_crs).to_crs(gdf.crs)
+    )
+
+
+def _round_coordinates(coordinates, digits):
+    """遞迴四捨五入 GeoJSON 座標"""
+    if isinstance(coordinates[0], (int, float)):
+        return [round(value, digits) for value in coordinates]
+    return [_round_coordinates(part, digits) for part in coordinates]
+
+
+def to_compact_geojson(gdf, digits):
+    """
+    將 GeoDataFrame 轉為精簡的 GeoJSON 位元組
+
+    Args:
+        gdf: 經緯度座標的 GeoDataFrame
+        digits: 座標保留的小數位數
+    """
+    fields = [col for col in gdf.columns if col != gdf.geometry.name]
+    features = []
+    for properties, geometry in zip(gdf[fields].to_dict("records"), gdf.geometry):
+        if geometry is None or geometry.is_empty:
+            continue
+        mapped = shapely.geometry.mapping(geometry)
+        features.append({
+            "type": "Feature",
+            "properties": properties,
+            "geometry": {
+                "type": mapped["type"],
+                "coordinates": _round_coordinates(mapped["coordinates"], digits),
+            },
+        })
+
+    collection = {"type": "FeatureCollection", "features": features}
+    return dumps(collection)
+
+
+def _quantized_rings(polygon, origin, step):
+    """將多邊形的外環與內環量化為整數座標,去掉重複的頂點與退化的環"""
+    rings = []
+    for ring in [polygon.exterior, *polygon.interiors]:
+        coords = shapely.get_coordinates(ring)
+        points = [(round((x - origin[0]) / step), round((y - origin[1]) / step)) for x, y in coords[:-1]]
+        deduped = [point for i, point in enumerate(points) if point != points[i - 1]]
+        if len(deduped) < 3:
+            if not rings:
+                # 外環退化時整個多邊形在此解析度下看不見
+                return []
+            continue
+        rings.append(deduped)
+    return rings
+
+
+class _ArcBuilder:
+    """在多個環之間找出共用的邊界線段,每段只保存一次"""
+
+    def __init__(self):
+        self.arcs = []
+        self._index = {}
+
+    def _arc_index(self, points):
+        key = tuple(points)
+        if key in self._index:
+            return self._index[key]
+        reverse = key[::-1]
+        if reverse in self._index:
+            # TopoJSON 以 ~i 表示反向使用第 i 段
+            return ~self._index[reverse]
+        self._index[key] = len(self.arcs)
+        self.arcs.append(points)
+        return len(self.arcs) - 1
+
+    @staticmethod
+    def _rotate_to_min(points):
+        start = points.index(min(points))
+        return points[start:] + points[:start]
+
+    def ring_arcs(self, ring, junctions):
+        """將環在交會點切開,回傳各段的 arc 編號"""
+        cuts = [i for i, point in enumerate(ring) if point in junctions]
+        if not cuts:
+            # 沒有交會點的環 (例如孤島) 以最小的點為起點,另一區反向的同一個環也會對應到同一段
+            rotated = self._rotate_to_min(ring)
+            return [self._arc_index(rotated + rotated[:1])]
+
+        start = cuts[0]
+        rotated = ring[start:] + ring[:start] + [ring[start]]
+        offsets = [i - start for i in cuts] + [len(ring)]
+        return [self._arc_index(rotated[a:b + 1]) for a, b in zip(offsets, offsets[1:])]
+
+
+def _find_junctions(rings):
+    """相鄰頂點組合不只一種的點即為多個區域邊界交會之處"""
+    neighbors = {}
+    junctions = set()
+    for ring in rings:
+        count = len(ring)
+        for i, point in enumerate(ring):
+            previous, following = ring[i - 1], ring[(i + 1) % count]
+            pair = (previous, following) if previous < following else (following, previous)
+            seen = neighbors.setdefault(point, pair)
+            if seen != pair:
+                junctions.add(point)
+    return junctions
+
+
+def to_topojson(gdf, zoom, object_name="districts"):
+    """
+    將 GeoDataFrame 轉為量化的 TopoJSON 位元組
+
+    相鄰行政區的共用邊界只保存一次,座標量化為該縮放等級半個像素的整數格點並以差值編碼,
+    瀏覽器以 topojson-client 的 topojson.feature() 還原為 GeoJSON
+
+    Args:
+        gdf: 經緯度座標的 GeoDataFrame
+        zoom: 縮放等級,決定量化的格點大小
+        object_name: objects 中的名稱
+    """
+    fields = [col for col in gdf.columns if col != gdf.geometry.name]
+    step = 360.0 / (256 * 2 ** zoom) / 2
+    minx, miny, _, _ = gdf.total_bounds
+    origin = (minx, miny)
+
+    shapes = []
+    for properties, geometry in zip(gdf[fields].to_dict("records"), gdf.geometry):
+        if geometry is None or geometry.is_empty:
+            continue
+        polygons = [geometry] if geometry.geom_type == "Polygon" else list(geometry.geoms)
+        quantized = [rings for rings in (_quantized_rings(polygon, origin, step) for polygon in polygons) if rings]
+        if quantized:
+            shapes.append((properties, quantized))
+
+    junctions = _find_junctions([ring for _, polygons in shapes for rings in polygons for ring in rings])
+    builder = _ArcBuilder()
+    geometries = []
+    for properties, polygons in shapes:
+        arcs = [[builder.ring_arcs(ring, junctions) for ring in rings] for rings in polygons]
+        if len(arcs) == 1:
+            geometries.append({"type": "Polygon", "arcs": arcs[0], "properties": properties})
+        else:
+            geometries.append({"type": "MultiPolygon", "arcs": arcs, "properties": properties})
+
+    # 第一個點為絕對座標,其後為與前一點的差值
+    encoded = []
+    for arc in builder.arcs:
+        deltas = [list(arc[0])]
+        for (x0, y0), (x1, y1) in zip(arc, arc[1:]):
+            deltas.append([x1 - x0, y1 - y0])
+        encoded.append(deltas)
+
+    topology = {
+        "type": "Topology",
+        "transform": {"scale": [step, step], "translate": [minx, miny]},
+        "objects": {object_name: {"type": "GeometryCollection", "geometries": geometries}},
+        "arcs": encoded,
+    }
+    return dumps(topology)
+
+
+def build_boundary_levels(gdf, config=None, coordinate_system=None):
+    """
+    產生所有縮放等級的簡化邊界
+
+    Args:
+        gdf: 經緯度座標的行政區 GeoDataFrame
+        config: 多解析度設定,預設為 BOUNDARY_CONFIG
+        coordinate_system: 座標系統設定,預設為 COORDINATE_SYSTEM
+
+    Returns:
+        {縮放等級: {格式: 位元組}},格式為 'geojson' 與 'topojson' (config["topojson"] 為 True 時)
+    """
+    if config is None:
+        config = BOUNDARY_CONFIG
+    if coordinate_system is None:
+        coordinate_system = COORDINATE_SYSTEM
+
+    minx, miny, maxx, maxy = gdf.total_bounds
+    latitude = (miny + maxy) / 2
+
+    levels = {}
+    for zoom in sorted(config["zoom_levels"]):
+        tolerance = tolerance_for_zoom(zoom, latitude, config["pixel_tolerance"])
+        simplified = simplify_boundaries(gdf, tolerance, coordinate_system["input_crs"])
+        levels[zoom] = {"geojson": to_compact_geojson(simplified, precision_for_zoom(zoom))}
+        if config.get("topojson", True):
+            levels[zoom]["topojson"] = to_topojson(simplified, zoom)
+    return levels
+
+
+def write_boundary_levels(levels, output_dir):
+    """
+    將各等級的邊界寫入 output_dir/boundaries_z{zoom}.{格式},並附上預先壓縮的 .gz/.br 檔,
+    可直接由 nginx 等伺服器的 gzip_static 提供
+
+    Returns:
+        [(縮放等級, 格式, 路徑, 大小)],不含壓縮檔
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    for zoom, formats in levels.items():
+        for fmt, body in formats.items():
+            path = os.path.join(str(output_dir), f"boundaries_z{zoom}.{fmt}")
+            for encoding, data in compress_variants(body).items():
+                target = path + ENCODING_SUFFIXES.get(encoding, "")
+                tmp_path = f"{target}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, target)
+            written.append((zoom, fmt, path, len(body)))
+    return written
+
+
+class BoundaryStore:
+    """保存各縮放等級預先簡化好的邊界,供 API 直接從記憶體回傳"""
+
+    def __init__(self, config=None, coordinate_system=None):
+        self.config = config if config is not None else BOUNDARY_CONFIG
+        self.coordinate_system = coordinate_system if coordinate_system is not None else COORDINATE_SYSTEM
+        self.source_mtime = None
+        # {縮放等級: {格式: ({編碼: 位元組}, ETag)}},整組替換
+        self.levels = {}
+
+    def build(self, gdf):
+        """重新產生所有縮放等級,並預先壓縮"""
+        levels = {}
+        for zoom, formats in build_boundary_levels(gdf, self.config, self.coordinate_system).items():
+            levels[zoom] = {
+                fmt: (compress_variants(body), '"' + hashlib.sha256(body).hexdigest()[:32] + '"')
+                for fmt, body in formats.items()
+            }
+        self.levels = levels
+
+    def ensure_current(self, source):
+        """
+        行政區資料變動時才重新產生
+
+        Args:
+            source: 已載入的 DistrictSource
+        """
+        source.ensure_loaded()
+        if not self.levels or source.mtime != self.source_mtime:
+            self.build(source.gdf)
+            self.source_mtime = source.mtime
+
+    def level_for_zoom(self, zoom):
+        """不超過請求縮放等級的最大預先簡化等級"""
+        available = sorted(self.levels)
+        if not available:
+            return None
+        candidates = [level for level in available if level <= zoom]
+        return candidates[-1] if candidates else available[0]
+
+    def get(self, zoom, fmt="geojson", accept_encoding=None):
+        """
+        取得對應縮放等級的邊界
+
+        Args:
+            zoom: 縮放等級
+            fmt: 'geojson' 或 'topojson'
+            accept_encoding: 請求的 Accept-Encoding,決定回傳的壓縮版本
+
+        Returns:
+            (等級, 位元組, ETag, 壓縮編碼),尚未產生或沒有該格式時為 None;壓縮編碼 'identity' 表示未壓縮
+        """
+        level = self.level_for_zoom(zoom)
+        if level is None or fmt not in self.levels[level]:
+            return None
+        variants, etag = self.levels[level][fmt]
+        encoding = choose_encoding(accept_encoding, variants)
+        if encoding != "identity":
+            # 不同壓縮版本的內容不同,ETag 需要區分
+            etag = etag[:-1] + "-" + encoding + '"'
+        return level, variants[encoding], etag, encoding
+
+
+def main():
+    """產生各縮放等級的簡化邊界並輸出檔案"""
+    from data.process_map import DistrictSource
+
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else str(BOUNDARY_LEVELS_DIR)
+    source = DistrictSource(DISTRICT_BOUNDARIES_GEOJSON, COORDINATE_SYSTEM).load()
+
+    original_size = os.path.getsize(DISTRICT_BOUNDARIES_GEOJSON)
+    levels = build_boundary_levels(source.gdf)
+    for zoom, fmt, path, size in write_boundary_levels(levels, output_dir):
+        gzip_size = os.path.getsize(path + ENCODING_SUFFIXES["gzip"]) if os.path.exists(path + ENCODING_SUFFIXES["gzip"]) else size
+        print(
+            f"縮放等級 {zoom} {fmt}: {size / 1024:.1f} KB,gzip {gzip_size / 1024:.1f} KB "
+            f"(原始 {original_size / 1024:.1f} KB) -> {path}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+"""
+登革熱疫情資料系統 - 欄式資料儲存
+誘卵器,行政區統計與天氣資料以欄為單位存成 NumPy .npy 檔,載入時以 mmap 直接對應到記憶體,
+不需要逐筆解析 JSON;瀏覽器使用的 JSON 只是由欄式資料衍生的精簡輸出
+
+每個資料表是 COLUMNAR_DIR/<資料表>/<版本>/ 下的一組檔案:
+    schema.json     欄位型別,類別欄位的類別清單與筆數
+    <欄位>.npy      欄位資料
+寫入完成後才切換 CURRENT 指標,讀取中的舊版本不受影響
+"""
+
+import json
+import os
+import shutil
+import time
+import uuid
+
+import numpy as np
+
+from config import COLUMNAR_CONFIG, COLUMNAR_DIR
+from models import MODELS, from_arrays
+from serializers import RECORD_SCHEMAS, read_json, validate_records, write_json
+
+# 資料表名稱 -> [(欄位, 型別, JSON 中的路徑)]
+# 型別: int, float, str, category (以整數代碼儲存), date, datetime (到分鐘)
+TABLE_SCHEMAS = {
+    "ovitraps": [
+        ("district", "category", ("district",)),
+        ("ovitrap_id", "str", ("ovitrap_id",)),
+        ("egg_count", "int", ("egg_count",)),
+        ("lat", "float", ("location", "lat")),
+        ("lng", "float", ("location", "lng")),
+        ("status", "category", ("status",)),
+        ("last_check", "date", ("last_check",)),
+    ],
+    "districts": [
+        ("id", "int", ("id",)),
+        ("name", "str", ("name",)),
+        ("population", "int", ("population",)),
+        ("dengue_cases", "int", ("dengue_cases",)),
+        ("risk_level", "category", ("risk_level",)),
+        ("last_update", "datetime", ("last_update",)),
+        ("value", "int", ("value",)),
+        ("rate_per_10k", "float", ("rate_per_10k",)),
+    ],
+    "weather": [
+        ("temperature", "float", ("temperature",)),
+        ("humidity", "int", ("humidity",)),
+        ("rainfall", "float", ("rainfall",)),
+        ("update_time", "datetime", ("update_time",)),
+    ],
+}
+
+NUMPY_DTYPES = {
+    "int": np.int64,
+    "float": np.float64,
+    "date": "datetime64[D]",
+    "datetime": "datetime64[m]",
+}
+
+
+def _get_path(record, path):
+    for key in path:
+        record = record[key]
+    return record
+
+
+def _set_path(record, path, value):
+    for key in path[:-1]:
+        record = record.setdefault(key, {})
+    record[path[-1]] = value
+
+
+def records_to_columns(records, schema):
+    """
+    將 JSON 紀錄轉成欄式資料
+
+    Args:
+        records: dict 清單,或 models.py 的紀錄型別清單 (屬性名稱即欄位名稱)
+        schema: TABLE_SCHEMAS 中的欄位定義
+
+    Returns:
+        (欄位資料 {欄位: ndarray}, 類別清單 {欄位: [類別]})
+    """
+    columns = {}
+    categories = {}
+    typed = bool(records) and not isinstance(records[0], dict)
+    for name, kind, path in schema:
+        if typed:
+            values = [getattr(record, name) for record in records]
+        else:
+            values = [_get_path(record, path) for record in records]
+        if kind == "category":
+            # 類別依出現順序編號,代碼以最小的整數型別儲存
+            labels = list(dict.fromkeys(values))
+            lookup = {label: code for code, label in enumerate(labels)}
+            dtype = np.int8 if len(labels) < 2 ** 7 else np.int32
+            columns[name] = np.array([lookup[value] for value in values], dtype=dtype)
+            categories[name] = labels
+        elif kind == "str":
+            columns[name] = np.array(values, dtype=str)
+        elif kind in ("date", "datetime"):
+            # "2025-09-25 10:52" -> NumPy 需要 ISO 格式的 "T"
+            columns[name] = np.array([value.replace(" ", "T") for value in values], dtype=NUMPY_DTYPES[kind])
+        else:
+            columns[name] = np.array(values, dtype=NUMPY_DTYPES[kind])
+    return columns, categories
+
+
+def _format_temporal(array, kind):
+    unit = "D" if kind == "date" else "m"
+    return [value.replace("T", " ") for value in np.datetime_as_string(array, unit=unit).tolist()]
+
+
+class ColumnTable:
+    """欄式資料表,欄位為 ndarray (以 mmap 載入時不會複製資料)"""
+
+    def __init__(self, name, columns, categories, schema=None, version=None):
+        self.name = name
+        self.columns = columns
+        self.categories = categories
+        self.schema = schema if schema is not None else TABLE_SCHEMAS[name]
+        self.version = version
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    @property
+    def kinds(self):
+        return {name: kind for name, kind, _ in self.schema}
+
+    def decoded(self, name):
+        """取得欄位值,類別欄位轉回文字"""
+        if name in self.categories:
+            return np.asarray(self.categories[name], dtype=object)[self.columns[name]]
+        return self.columns[name]
+
+    def to_pandas(self):
+        """轉成 pandas DataFrame,數值欄位直接使用原本的 ndarray"""
+        import pandas as pd
+
+        data = {}
+        for name, array in self.columns.items():
+            if name in self.categories:
+                data[name] = pd.Categorical.from_codes(array, self.categories[name])
+            else:
+                data[name] = array
+        return pd.DataFrame(data, copy=False)
+
+    def to_records(self, rows=None, fields=None):
+        """
+        轉回與原本 JSON 相同結構的 dict 清單
+
+        Args:
+            rows: 列索引 (ndarray 或 slice),None 表示全部
+            fields: 要輸出的欄位,None 表示全部
+        """
+        selected = [entry for entry in self.schema if fields is None or entry[0] in fields]
+        values = self._decode(rows, selected)
+
+        records = []
+        for row in zip(*values):
+            record = {}
+            for (_, _, path), value in zip(selected, row):
+                _set_path(record, path, value)
+            records.append(record)
+        return records
+
+    def to_models(self, rows=None):
+        """
+        轉成 models.py 的紀錄型別清單
+
+        Args:
+            rows: 列索引 (ndarray 或 slice),None 表示全部
+        """
+        values = self._decode(rows, self.schema)
+        return from_arrays(MODELS[self.name], {name: column for (name, _, _), column in zip(self.schema, values)})
+
+    def _decode(self, rows, selected):
+        """將選取的欄位解碼為 Python 值的清單 (類別代碼轉回名稱,日期轉回字串)"""
+        values = []
+        for name, kind, _ in selected:
+            array = self.columns[name] if rows is None else self.columns[name][rows]
+            if name in self.categories:
+                labels = self.categories[name]
+                values.append([labels[code] for code in array.tolist()])
+            elif kind in ("date", "datetime"):
+                values.append(_format_temporal(array, kind))
+            else:
+                values.append(array.tolist())
+        return values
+
+
+def _table_dir(name, base_dir):
+    return os.path.join(str(base_dir), name)
+
+
+def current_version(name, base_dir=COLUMNAR_DIR):
+    """資料表目前的版本,尚未寫入時回傳 None"""
+    try:
+        with open(os.path.join(_table_dir(name, base_dir), "CURRENT"), "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def save_columns(directory, columns, categories, schema, extra=None):
+    """
+    將欄位資料寫入新目錄,先寫入同層的暫存目錄,完成後才改名為 directory
+
+    Args:
+        directory: 輸出目錄,不可已存在
+        columns: {欄位: ndarray}
+        categories: {欄位: [類別]}
+        schema: 欄位定義
+        extra: 另外寫入 schema.json 的資訊
+    """
+    parent = os.path.dirname(directory)
+    os.makedirs(parent, exist_ok=True)
+    staging_dir = os.path.join(parent, f".staging-{uuid.uuid4().hex}")
+    os.makedirs(staging_dir)
+    for column, array in columns.items():
+        np.save(os.path.join(staging_dir, f"{column}.npy"), array, allow_pickle=False)
+    meta = {
+        "columns": [[column, kind] for column, kind, _ in schema],
+        "categories": categories,
+        "rows": len(next(iter(columns.values()))) if columns else 0,
+    }
+    if extra:
+        meta.update(extra)
+    with open(os.path.join(staging_dir, "schema.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(staging_dir, directory)
+
+
+def load_columns(directory, name, mmap=True):
+    """
+    讀取 save_columns() 寫入的目錄
+
+    Returns:
+        (ColumnTable, schema.json 的內容)
+    """
+    with open(os.path.join(directory, "schema.json"), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+
+    paths = {column: path for column, _, path in TABLE_SCHEMAS.get(name, [])}
+    schema = [(column, kind, paths.get(column, (column,))) for column, kind in meta["columns"]]
+    columns = {
+        column: np.load(os.path.join(directory, f"{column}.npy"), mmap_mode="r" if mmap else None)
+        for column, _ in meta["columns"]
+    }
+    return ColumnTable(name, columns, meta["categories"], schema), meta
+
+
+def concat_tables(tables):
+    """
+    依序串接多個結構相同的資料表,各自的類別代碼會對應到合併後的類別清單
+
+    Args:
+        tables: ColumnTable 清單 (至少一個)
+    """
+    first = tables[0]
+    if len(tables) == 1:
+        return first
+
+    categories = {}
+    for name in first.categories:
+        categories[name] = list(dict.fromkeys(label for table in tables for label in table.categories[name]))
+
+    columns = {}
+    for name in first.columns:
+        parts = []
+        for table in tables:
+            array = table.columns[name]
+            if name in categories:
+                lookup = {label: code for code, label in enumerate(categories[name])}
+                mapping = np.array([lookup[label] for label in table.categories[name]], dtype=np.int32)
+                array = mapping[array] if len(mapping) else array.astype(np.int32)
+            parts.append(array)
+        columns[name] = np.concatenate(parts)
+    return ColumnTable(first.name, columns, categories, first.schema)
+
+
+def write_table(name, records, base_dir=COLUMNAR_DIR, config=None):
+    """
+    將紀錄寫成新版本的欄式資料表
+
+    Args:
+        name: 資料表名稱 (TABLE_SCHEMAS 的鍵)
+        records: dict 清單或 models.py 的紀錄型別清單
+        base_dir: 欄式資料目錄
+        config: 儲存設定,預設為 COLUMNAR_CONFIG
+
+    Returns:
+        ColumnTable
+    """
+    columns, categories = records_to_columns(records, TABLE_SCHEMAS[name])
+    return write_columns(name, columns, categories, base_dir, config)
+
+
+def write_columns(name, columns, categories, base_dir=COLUMNAR_DIR, config=None):
+    """
+    將已是欄式的資料寫成新版本的資料表,大量資料不需要先建立逐筆紀錄
+
+    Args:
+        name: 資料表名稱 (TABLE_SCHEMAS 的鍵)
+        columns: {欄位: ndarray},格式與 records_to_columns() 的輸出相同
+        categories: {欄位: [類別]}
+        base_dir: 欄式資料目錄
+        config: 儲存設定,預設為 COLUMNAR_CONFIG
+
+    Returns:
+        ColumnTable
+    """
+    if config is None:
+        config = COLUMNAR_CONFIG
+
+    schema = TABLE_SCHEMAS[name]
+    table_dir = _table_dir(name, base_dir)
+    now = time.time()
+    # 時間在前,依名稱排序即為新舊順序;同一毫秒內的兩次寫入以亂數後綴區分,避免目錄衝突
+    version = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}{int(now * 1000) % 1000:03d}-{uuid.uuid4().hex[:8]}"
+    save_columns(os.path.join(table_dir, version), columns, categories, schema)
+
+    tmp_path = os.path.join(table_dir, f"CURRENT.{uuid.uuid4().hex}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(version)
+    os.replace(tmp_path, os.path.join(table_dir, "CURRENT"))
+
+    _prune_versions(table_dir, version, config["keep_versions"])
+    return ColumnTable(name, columns, categories, schema, version)
+
+
+def _prune_versions(table_dir, current, keep_versions):
+    """刪除超過保留數量的舊版本 (已 mmap 的檔案在關閉前仍可讀取)"""
+    versions = sorted(
+        entry for entry in os.listdir(table_dir)
+        if not entry.startswith(".") and os.path.isdir(os.path.join(table_dir, entry))
+    )
+    for entry in versions[:-keep_versions] if keep_versions > 0 else versions:
+        if entry != current:
+            shutil.rmtree(os.path.join(table_dir, entry), ignore_errors=True)
+
+
+def load_table(name, base_dir=COLUMNAR_DIR, mmap=None):
+    """
+    載入目前版本的欄式資料表
+
+    Args:
+        name: 資料表名稱
+        base_dir: 欄式資料目錄
+        mmap: 是否以 mmap 載入,預設依 COLUMNAR_CONFIG["mmap"]
+
+    Returns:
+        ColumnTable,資料表不存在時拋出 FileNotFoundError
+    """
+    if mmap is None:
+        mmap = COLUMNAR_CONFIG["mmap"]
+
+    version = current_version(name, base_dir)
+    if version is None:
+        raise FileNotFoundError(f"找不到欄式資料表: {name}")
+
+    table, _ = load_columns(os.path.join(_table_dir(name, base_dir), version), name, mmap)
+    table.version = version
+    return table
+
+
+def write_json_view(table, path, single=False):
+    """
+    輸出給瀏覽器使用的精簡 JSON (不縮排,不含多餘空白)
+
+    Args:
+        table: ColumnTable
+        path: 輸出檔案路徑
+        single: 只有一筆資料時是否輸出為物件而非陣列 (天氣資料)
+    """
+    records = table.to_records()
+    data = records[0] if single and records else records
+    write_json(path, data)
+    return path
+
+
+def import_json(name, json_path, base_dir=COLUMNAR_DIR, single=False):
+    """
+    由既有的 JSON 檔建立欄式資料表
+
+    Args:
+        name: 資料表名稱
+        json_path: JSON 檔案路徑
+        single: JSON 是否為單一物件 (天氣資料)
+    """
+    data = read_json(json_path)
+    if name in RECORD_SCHEMAS:
+        validate_records(data, name)
+    return write_table(name, [data] if single else data, base_dir)
+
+
+def main():
+    """由 data 目錄中現有的 JSON 檔建立欄式資料表"""
+    from config import DISTRICT_DATA_JSON, OVITRAP_DATA_JSON, WEATHER_DATA_JSON
+
+    for name, json_path, single in (
+        ("ovitraps", OVITRAP_DATA_JSON, False),
+        ("districts", DISTRICT_DATA_JSON, False),
+        ("weather", WEATHER_DATA_JSON, True),
+    ):
+        table = import_json(name, json_path, single=single)
+        print(f"{name}: {len(table)} 筆 -> {_table_dir(name, COLUMNAR_DIR)}/{table.version}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+登革熱疫情資料系統 - 預先壓縮
+回應內容在產生時就壓縮成 gzip (與 brotli,有安裝時),請求時依 Accept-Encoding 直接回傳對應的版本,
+不需要每次請求重新壓縮
+"""
+
+import gzip
+
+from config import COMPRESSION_CONFIG
+
+try:
+    import brotli
+except ImportError:  # brotli 為選用套件
+    brotli = None
+
+# 伺服器偏好的順序
+PREFERRED_ENCODINGS = ("br", "gzip")
+
+# 壓縮後的檔案副檔名
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def compress_variants(body, config=None):
+    """
+    產生各種壓縮版本
+
+    Args:
+        body: 原始位元組
+        config: 壓縮設定,預設為 COMPRESSION_CONFIG
+
+    Returns:
+        {"identity": 原始位元組, "gzip": ..., "br": ...},只保留比原始內容小的版本
+    """
+    if config is None:
+        config = COMPRESSION_CONFIG
+
+    variants = {"identity": body}
+    if len(body) < config["min_size"]:
+        return variants
+
+    # mtime=0 讓相同內容的壓縮結果完全相同
+    compressed = {"gzip": gzip.compress(body, compresslevel=config["gzip_level"], mtime=0)}
+    if brotli is not None:
+        compressed["br"] = brotli.compress(body, quality=config["brotli_quality"])
+
+    for encoding, data in compressed.items():
+        if len(data) < len(body):
+            variants[encoding] = data
+    return variants
+
+
+def parse_accept_encoding(header):
+    """
+    解析 Accept-Encoding
+
+    Returns:
+        {編碼: q 值}
+    """
+    accepted = {}
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+def choose_encoding(header, available):
+    """
+    依 Accept-Encoding 選擇要回傳的版本
+
+    Args:
+        header: 請求的 Accept-Encoding
+        available: 已有的版本 (compress_variants() 的鍵)
+
+    Returns:
+        編碼名稱,'identity' 表示不壓縮
+    """
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = "identity", 0.0
+    for encoding in PREFERRED_ENCODINGS:
+        if encoding not in available:
+            continue
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
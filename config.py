@@ -27,6 +27,7 @@ APP_DESCRIPTION = "台南市登革熱疫情監控與視覺化系統"
 DATA_DIR = PROJECT_ROOT / "data"
 TEMPLATE_DIR = PROJECT_ROOT / "template"
 WEB_DIR = PROJECT_ROOT / "web"
+CACHE_DIR = PROJECT_ROOT / "cache"  # 可重新產生的快取資料,不會被資料更新清除
 
 # 檔案路徑
 BUCKET_JSON = DATA_DIR / "bucket.json"
@@ -37,13 +38,23 @@ DISTRICTS_SUMMARY_JSON = DATA_DIR / "districts_summary.json"
 OVITRAP_DATA_JSON = DATA_DIR / "ovitrap_data.json"
 WEATHER_DATA_JSON = DATA_DIR / "weather_data.json"
 VILLAGE_LIST_CSV = DATA_DIR / "village_list.csv"
+DATASET_MANIFEST_JSON = CACHE_DIR / "dataset_manifest.json"  # 資料集名稱與 JSON 網址的對照快取
+DATASETS_DIR = DATA_DIR / "datasets"  # 每個資料集各自的下載檔案
+DATASET_STAGING_DIR = CACHE_DIR / "staging"  # 下載中的資料集,比對後才取代正式檔案
+COLUMNAR_DIR = DATA_DIR / "columnar"  # 欄式資料 (誘卵器,行政區統計,天氣)
+OVITRAP_HISTORY_DIR = DATA_DIR / "history" / "ovitraps"  # 誘卵器歷史資料,依月份分區
 
 # 地圖相關檔案
 MAP_TEMP_HTML = TEMPLATE_DIR / "map_temp.html"
 MAP_HTML = TEMPLATE_DIR / "map.html"
+MAP_BUILD_DIR = TEMPLATE_DIR / "builds"  # 版本化的地圖產物目錄
 SCRIPT_JS = TEMPLATE_DIR / "script.js"
 DISTRICT_BOUNDARIES_GEOJSON = DATA_DIR / "district_boundaries.geojson"
 TAINAN_TOWN_SHP = DATA_DIR / "tainan_town.shp"
+BOUNDARY_LEVELS_DIR = DATA_DIR / "boundaries"  # 各縮放等級的簡化邊界
+GEOMETRY_CACHE_DIR = CACHE_DIR / "geometry"  # 轉換座標後的行政區幾何快取
+STATIC_ASSETS_DIR = CACHE_DIR / "assets"  # 含內容雜湊並預先壓縮的靜態檔案
+PROFILE_DIR = CACHE_DIR / "profiles"  # 請求的效能分析結果 (DEBUG_CONFIG["enable_profiling"])
 
 # 樣式檔案
 STYLE_CSS = WEB_DIR / "style.css"
@@ -69,6 +80,19 @@ STATIC_MOUNTS = {
     "/template": str(TEMPLATE_DIR),
 }
 
+# 內容雜湊靜態檔案設定,檔名含內容雜湊,瀏覽器可長期快取
+STATIC_ASSETS_CONFIG = {
+    "mount": "/assets",
+    # 這些檔案會複製為含雜湊的檔名並預先壓縮;地圖頁面引用的 (script.js) 會替換為含雜湊的網址,
+    # 其餘檔案 (資料 JSON 等) 的含雜湊網址由 /api/assets 提供
+    "files": [
+        SCRIPT_JS, STYLE_CSS, DISTRICT_BOUNDARIES_GEOJSON, DENGUE_DATA_JSON,
+        DISTRICT_DATA_JSON, DISTRICTS_SUMMARY_JSON, OVITRAP_DATA_JSON, WEATHER_DATA_JSON,
+    ],
+    "max_age": 31536000,        # 含雜湊檔案的快取秒數 (一年,immutable)
+    "retain_seconds": 86400,    # 舊版本檔案保留的秒數,讓還在使用舊頁面的瀏覽器能載入
+}
+
 # =============================================================================
 # 地圖設定
 # =============================================================================
@@ -126,6 +150,30 @@ COORDINATE_SYSTEM = {
     "output_crs": "EPSG:4326",  # WGS84 (經緯度)
 }
 
+# 地圖產物建置設定
+MAP_BUILD_CONFIG = {
+    # 這些檔案變動時才會重新產生地圖,其餘請求直接使用記憶體中的快取
+    "inputs": [DISTRICT_BOUNDARIES_GEOJSON, PROCESS_MAP_SCRIPT, SCRIPT_JS, PROJECT_ROOT / "config.py"],
+    "build_on_startup": True,  # 啟動時先產生一次地圖
+    "keep_versions": 3,        # 保留的舊版本數量,讀取中的舊版本不會立即被刪除
+    "failure_backoff_seconds": 60,  # 建置失敗後,輸入未變動時在這段時間內不再因請求而重試
+}
+
+# 行政區邊界多解析度設定
+BOUNDARY_CONFIG = {
+    # 預先簡化的縮放等級,請求的縮放等級會對應到不超過它的最大等級
+    "zoom_levels": [8, 10, 12, 14, 16],
+    "pixel_tolerance": 1.0,  # 簡化誤差上限 (以該縮放等級的像素計)
+    "topojson": True,        # 同時產生共用邊界只存一次的量化 TopoJSON
+}
+
+# 預先壓縮設定 (行政區邊界與靜態檔案)
+COMPRESSION_CONFIG = {
+    "gzip_level": 9,        # gzip 壓縮等級 (1-9)
+    "brotli_quality": 11,   # brotli 壓縮品質 (0-11),需安裝 brotli 套件
+    "min_size": 256,        # 小於此位元組數的內容不壓縮
+}
+
 # =============================================================================
 # UI 設定
 # =============================================================================
@@ -243,6 +291,10 @@ DATA_SOURCES = {
     "tainan_data_url": "https://data.tainan.gov.tw/DataSet/Detail/4ad2dba4-4fed-4224-9456-c6ac776cb1cd",
     "data_titles": ["誘卵桶點位"],
     "update_interval_hours": 6,  # 每6小時更新一次
+    # 已知的資料集 JSON 網址,有設定的資料集不需要開啟瀏覽器查詢
+    "dataset_urls": {
+        "誘卵桶點位": "https://soa.tainan.gov.tw/Api/Service/Get/e8d4f9f8-5f11-4e48-9a25-1684ccce49a6",
+    },
 }
 
 # Selenium 設定
@@ -253,6 +305,50 @@ SELENIUM_CONFIG = {
     "max_retries": 10,
 }
 
+# 資料下載設定
+DOWNLOAD_CONFIG = {
+    "chunk_size": 64 * 1024,   # 每次寫入磁碟的位元組數
+    "timeout": 30,             # 連線與讀取逾時 (秒)
+    "retry_count": 3,          # 連線失敗或伺服器暫時錯誤 (429/5xx) 時的重試次數 (EXTERNAL_APIS 未設定時使用)
+    "max_resume_attempts": 3,  # 已收到部分內容後連線中斷時,以 Range 續傳的次數
+    "pool_maxsize": 10,        # 每個主機保留的連線數
+    "max_concurrency": 4,      # 同時下載的資料集數量
+    "backoff_seconds": 1,      # 重試前的等待時間,每次重試加倍 (EXTERNAL_APIS 未設定時使用)
+    "record_prefix": "item",   # 資料紀錄在 JSON 中的位置 (ijson 語法,item 表示最外層陣列)
+}
+
+# 欄式資料儲存設定 (columnar_store.py)
+COLUMNAR_CONFIG = {
+    "mmap": True,         # 以 mmap 載入欄位,不複製資料
+    "keep_versions": 2,   # 每個資料表保留的舊版本數量
+}
+
+# 誘卵器歷史資料設定 (ovitrap_history.py)
+OVITRAP_HISTORY_CONFIG = {
+    "compact_after_segments": 8,  # 分區中的片段超過此數量時自動合併
+}
+
+# 大量模擬資料設定 (效能測試用),scale 為 1 時約為實際規模
+SYNTHETIC_DATA_CONFIG = {
+    "output_dir": CACHE_DIR / "synthetic",  # 不會覆蓋 data 目錄中的資料
+    "seed": 42,
+    "years": 3,                  # 產生的年數,每個誘卵器每週一筆紀錄
+    "villages": 650,             # scale 為 1 時的村里數
+    "ovitraps_per_village": 5,
+    "clusters_per_district": 6,  # 每個行政區的聚落數,村里集中在聚落附近
+    "cluster_sigma_m": 1500,     # 聚落範圍 (公尺,常態分布標準差)
+    "ovitrap_sigma_m": 300,      # 誘卵器與村里中心的距離 (公尺,常態分布標準差)
+}
+
+# 效能測試設定 (benchmark.py)
+BENCHMARK_CONFIG = {
+    "results_dir": PROJECT_ROOT / "benchmarks",  # 每次執行的結果 JSON,供不同版本比較
+    "scales": [0.1, 1, 10],       # 模擬資料的規模 (LargeScaleGenerator 的 scale)
+    "repeat": 5,                  # 每項測試的重複次數,取中位數比較
+    "requests": 50,               # HTTP 延遲測試的請求數
+    "regression_threshold": 0.2,  # 中位數變慢超過 20% 視為退步
+}
+
 # =============================================================================
 # 風險等級設定
 # =============================================================================
@@ -273,6 +369,14 @@ RISK_THRESHOLDS = {
     "very_low": 0,   # 極低風險:每萬人1例以下
 }
 
+# 風險等級顯示名稱
+RISK_LABELS = {
+    "high": "高風險",
+    "medium": "中風險",
+    "low": "低風險",
+    "very_low": "極低風險",
+}
+
 # =============================================================================
 # API 設定
 # =============================================================================
@@ -283,9 +387,25 @@ EXTERNAL_APIS = {
         "base_url": "https://codis.cwa.gov.tw/api/station",
         "timeout": 30,
         "retry_count": 3,
+    },
+    # 台南市開放資料平台,資料集下載時的逾時與重試設定
+    "tainan_open_data": {
+        "base_url": "https://soa.tainan.gov.tw",
+        "timeout": 60,
+        "retry_count": 3,
+        "backoff_seconds": 2,
     }
 }
 
+# 資料查詢 API 設定 (/api/ovitraps, /api/ovitraps/near, /api/districts)
+QUERY_API_CONFIG = {
+    "default_limit": 100,  # 未指定 limit 時每頁筆數
+    "max_limit": 1000,     # 每頁筆數上限
+    "near_default_k": 10,        # /api/ovitraps/near 未指定 k 與 radius 時回傳的數量
+    "near_max_k": 500,           # /api/ovitraps/near 的 k 上限
+    "near_max_radius_m": 20000,  # /api/ovitraps/near 的半徑上限 (公尺)
+}
+
 # =============================================================================
 # 快取設定
 # =============================================================================
@@ -296,6 +416,15 @@ CACHE_CONFIG = {
     "static_file_cache": True,
 }
 
+# 背景排程設定 (隨 FastAPI 啟動)
+# 資料每 DATA_SOURCES["update_interval_hours"] 更新一次,
+# 衍生產物 (地圖,邊界) 每 CACHE_CONFIG["cache_duration_hours"] 檢查一次
+SCHEDULER_CONFIG = {
+    "enabled": True,
+    "jitter_fraction": 0.1,   # 間隔隨機加減 10%,避免多個實例同時更新
+    "run_on_startup": False,  # 啟動時是否立即更新資料
+}
+
 # =============================================================================
 # 日誌設定
 # =============================================================================
@@ -330,7 +459,23 @@ DEBUG_CONFIG = {
     "debug_mode": False,
     "auto_reload": True,
     "show_error_details": True,
-    "enable_profiling": False,
+    "enable_profiling": False,  # 允許以 ?profile=1 分析單一請求 (pyinstrument 或 cProfile)
+}
+
+# =============================================================================
+# 效能監控設定
+# =============================================================================
+
+# /metrics 端點 (Prometheus 文字格式) 與地圖建置各階段計時 (metrics.py)
+METRICS_CONFIG = {
+    "enabled": True,
+    "path": "/metrics",
+    # 請求延遲直方圖的區間上限 (秒)
+    "latency_buckets": [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+    # 地圖建置階段 (讀檔、座標轉換、形心、folium 產生 HTML、寫檔) 的區間上限 (秒)
+    "stage_buckets": [0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0],
+    "profile_param": "profile",   # 開啟效能分析的查詢參數
+    "profile_keep": 20,           # 保留的效能分析結果數量
 }
 
 # =============================================================================
@@ -2,115 +2,29 @@ import geopandas as gpd
 import folium
 import sys
 import os
+import glob
+import hashlib
+import math
+import pickle
+from functools import lru_cache
+import shutil
+import time
+import uuid
+from pyproj import Transformer
 
 # 添加專案根目錄到路徑，以便導入 config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import (
     TAINAN_TOWN_SHP, MAP_CONFIG, DISTRICT_STYLE, COORDINATE_SYSTEM,
-    MAP_TEMP_HTML, MAP_HTML, SCRIPT_JS, TEMPLATE_DIR
+    MAP_TEMP_HTML, MAP_HTML, SCRIPT_JS, TEMPLATE_DIR, DISTRICT_BOUNDARIES_GEOJSON,
+    MAP_BUILD_DIR, MAP_BUILD_CONFIG, BOUNDARY_CONFIG, GEOMETRY_CACHE_DIR, STATIC_ASSETS_DIR
 )
+from boundary_tiles import simplify_boundaries, tolerance_for_zoom
+from static_assets import build_assets, rewrite_asset_urls
+from metrics import last_stage_seconds, stage
 
-# 使用包含區域名稱的 GeoJSON 檔案
-geojson_path = "district_boundaries.geojson"
-gdf = gpd.read_file(geojson_path)
-
-if gdf.crs is None:
-    gdf = gdf.set_crs(COORDINATE_SYSTEM["input_crs"])
-
-if gdf.crs.to_string() != COORDINATE_SYSTEM["output_crs"]:
-    gdf = gdf.to_crs(COORDINATE_SYSTEM["output_crs"])
-
-# 動態計算地圖中心點
-center = [gdf.geometry.centroid.y.mean(), gdf.geometry.centroid.x.mean()]
-print(f"計算出的地圖中心點: {center}")
-
-# 根據設定檔決定使用動態計算的中心點還是預設中心點
-if MAP_CONFIG["use_dynamic_center"]:
-    map_center = center
-    print(f"使用動態計算的中心點: {map_center}")
-else:
-    map_center = MAP_CONFIG["center"]
-    print(f"使用設定檔中的中心點: {map_center}")
-
-m = folium.Map(
-    location=map_center, 
-    zoom_start=MAP_CONFIG["zoom_start"],
-    zoom_control=MAP_CONFIG["zoom_control"],
-    prefer_canvas=MAP_CONFIG["prefer_canvas"]
-)
-
-fields = [col for col in gdf.columns if col != gdf.geometry.name]
-
-# 調試：打印欄位資訊
-print(f"GeoDataFrame 欄位: {list(gdf.columns)}")
-print(f"非幾何欄位: {fields}")
-if len(gdf) > 0:
-    print(f"第一筆資料的屬性: {gdf.iloc[0].to_dict()}")
-
-# 定義行政區樣式函數（所有區域預設透明，不填充）
-def style_function(feature):
-    return {
-        'color': DISTRICT_STYLE["default"]["color"],
-        'weight': DISTRICT_STYLE["default"]["weight"],
-        'fillOpacity': DISTRICT_STYLE["default"]["fill_opacity"],
-        'opacity': DISTRICT_STYLE["default"]["opacity"]
-    }
-
-# 確保 GeoDataFrame 有正確的屬性
-print("處理前的 GeoDataFrame:")
-print(gdf.head(2))
-print("Fields:", fields)
-
-# 創建 GeoJSON 圖層
-geojson_layer = folium.GeoJson(
-    gdf,
-    name="行政區",
-    style_function=style_function,
-    tooltip=folium.GeoJsonTooltip(
-        fields=fields,
-        aliases=fields
-    )
-)
-
-# 添加圖層到地圖
-geojson_layer.add_to(m)
-
-# 調試：檢查生成的 GeoJSON 資料
-import json
-geojson_data = json.loads(gdf.to_json())
-print("GeoJSON 資料範例:")
-if geojson_data['features']:
-    print("第一個 feature 的 properties:", geojson_data['features'][0]['properties'])
-    print("第一個 feature 的 name:", geojson_data['features'][0]['properties'].get('name', 'No name'))
-
-# 保存基礎地圖
-m.save(str(MAP_TEMP_HTML))
-
-# 讀取生成的HTML並提取script部分
-with open(str(MAP_TEMP_HTML), "r", encoding="utf-8") as f:
-    html_content = f.read()
-
-# 檢查是否已存在 script.js，如果存在則保留（不覆蓋）
-if not os.path.exists(SCRIPT_JS):
-    # 只在 script.js 不存在時才創建新的
-    script_start = html_content.find("<script>")
-    script_end = html_content.find("</script>") + len("</script>")
-    if script_start != -1 and script_end > script_start:
-        script_content = html_content[script_start:script_end]
-        # 保存script.js（移除<script>標籤）
-        with open(str(SCRIPT_JS), "w", encoding="utf-8") as f:
-            script_only = script_content.replace("<script>", "").replace("</script>", "")
-            # 添加緩存破壞機制到數據加載
-            script_only = script_only.replace(
-                "return fetch('data/dengue_data.json')",
-                "var timestamp = new Date().getTime(); return fetch('data/dengue_data.json?t=' + timestamp, {cache: 'no-store'})"
-            )
-            f.write(script_only)
-else:
-    print("script.js 已存在，保留現有版本以維持自定義功能")
-
-# 創建包含側邊欄的完整HTML
-full_html = """<!DOCTYPE html>
+# 包含側邊欄的完整HTML
+MAP_PAGE_HTML = """<!DOCTYPE html>
 <html>
 <head>
     
@@ -119,6 +33,7 @@ full_html = """<!DOCTYPE html>
     <script src="https://code.jquery.com/jquery-3.7.1.min.js"></script>
     <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.2.2/dist/js/bootstrap.bundle.min.js"></script>
     <script src="https://cdnjs.cloudflare.com/ajax/libs/Leaflet.awesome-markers/2.0.2/leaflet.awesome-markers.js"></script>
+    <script src="https://cdn.jsdelivr.net/npm/topojson-client@3.1.0/dist/topojson-client.min.js"></script>
     <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.css"/>
     <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.2.2/dist/css/bootstrap.min.css"/>
     <link rel="stylesheet" href="https://netdna.bootstrapcdn.com/bootstrap/3.0.0/css/bootstrap-glyphicons.css"/>
@@ -338,9 +253,370 @@ full_html = """<!DOCTYPE html>
 </html>
 """
 
-# 保存完整的HTML文件
-with open(str(MAP_HTML), "w", encoding="utf-8") as f:
-    f.write(full_html)
 
-print("地圖HTML和JavaScript已成功生成！")
-m
+def default_build_config():
+    """由 config.py 組出預設的地圖建置設定"""
+    return {
+        "geojson_path": str(DISTRICT_BOUNDARIES_GEOJSON),
+        "map_config": MAP_CONFIG,
+        "district_style": DISTRICT_STYLE,
+        "coordinate_system": COORDINATE_SYSTEM,
+        "map_temp_html": str(MAP_TEMP_HTML),
+        "map_html": str(MAP_HTML),
+        "script_js": str(SCRIPT_JS),
+        "build_dir": str(MAP_BUILD_DIR),
+        "keep_versions": MAP_BUILD_CONFIG["keep_versions"],
+        "geometry_cache_dir": str(GEOMETRY_CACHE_DIR),
+        "assets_dir": str(STATIC_ASSETS_DIR),
+    }
+
+
+@lru_cache(maxsize=None)
+def _transformer(from_crs, to_crs):
+    """建立 Transformer 需要讀取投影資料庫,相同的座標系統組合只建立一次"""
+    return Transformer.from_crs(from_crs, to_crs, always_xy=True)
+
+
+class DistrictSource:
+    """
+    預先載入並轉換好座標的行政區資料
+    常駐在伺服器中重複使用,只有 GeoJSON 檔案變動時才重新讀取
+
+    轉換後的幾何,範圍與形心另外保存在幾何快取中 (以檔案內容雜湊與座標系統為鍵),
+    重新啟動或單獨執行時不必再讀取 GeoJSON,轉換座標與計算形心
+    """
+
+    def __init__(self, geojson_path, coordinate_system, cache_dir=GEOMETRY_CACHE_DIR):
+        self.geojson_path = str(geojson_path)
+        self.coordinate_system = coordinate_system
+        self.cache_dir = str(cache_dir) if cache_dir is not None else None
+        # 平面座標 (公尺) 轉回輸出座標 (經緯度) 的轉換器
+        self.to_output = _transformer(coordinate_system["input_crs"], coordinate_system["output_crs"])
+        self.mtime = None
+        self.gdf = None
+        self.center = None
+        self.bounds = None
+        self.centroids = None
+
+    def _cache_path(self, digest):
+        name = os.path.splitext(os.path.basename(self.geojson_path))[0]
+        key = hashlib.sha256(
+            f"{digest}|{self.coordinate_system['input_crs']}|{self.coordinate_system['output_crs']}".encode("utf-8")
+        ).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{name}-{key}.pkl")
+
+    def _load_cache(self, cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"幾何快取無法讀取,重新計算: {e}")
+            return None
+
+    def _save_cache(self, cache_path, entry):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        # 同一個來源檔的舊快取已不會再用到
+        prefix = os.path.basename(cache_path).rsplit("-", 1)[0]
+        for old in glob.glob(os.path.join(self.cache_dir, f"{prefix}-*.pkl")):
+            if old != cache_path:
+                os.remove(old)
+
+    def _compute(self):
+        with stage("read"):
+            gdf = gpd.read_file(self.geojson_path)
+
+        with stage("reproject"):
+            if gdf.crs is None:
+                gdf = gdf.set_crs(self.coordinate_system["input_crs"])
+
+            if gdf.crs.to_string() != self.coordinate_system["output_crs"]:
+                gdf = gdf.to_crs(self.coordinate_system["output_crs"])
+
+        # 在平面座標下計算形心,避免用經緯度計算造成的誤差與警告
+        with stage("centroid"):
+            projected_centroids = gdf.geometry.to_crs(self.coordinate_system["input_crs"]).centroid
+            lng, lat = self.to_output.transform(projected_centroids.x.mean(), projected_centroids.y.mean())
+
+        return {
+            "gdf": gdf,
+            "center": [lat, lng],
+            "bounds": gdf.total_bounds.tolist(),
+            "centroids": projected_centroids.to_crs(self.coordinate_system["output_crs"]),
+        }
+
+    def load(self):
+        """讀取 GeoJSON 並轉換為輸出座標系統,幾何快取有效時直接使用快取"""
+        mtime = os.stat(self.geojson_path).st_mtime_ns
+
+        entry = cache_path = None
+        if self.cache_dir is not None:
+            with open(self.geojson_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            cache_path = self._cache_path(digest)
+            with stage("geometry_cache"):
+                entry = self._load_cache(cache_path)
+
+        if entry is None:
+            entry = self._compute()
+            if cache_path is not None:
+                self._save_cache(cache_path, entry)
+
+        self.gdf = entry["gdf"]
+        self.center = entry["center"]
+        self.bounds = entry["bounds"]
+        self.centroids = entry["centroids"]
+        self.mtime = mtime
+        return self
+
+    def ensure_loaded(self):
+        """檔案尚未載入或已變動時重新讀取"""
+        if self.gdf is None or os.stat(self.geojson_path).st_mtime_ns != self.mtime:
+            self.load()
+        return self
+
+
+def make_style_function(style):
+    """依樣式設定建立行政區樣式函數（所有區域預設透明，不填充）"""
+    def style_function(feature):
+        return {
+            'color': style["color"],
+            'weight': style["weight"],
+            'fillOpacity': style["fill_opacity"],
+            'opacity': style["opacity"]
+        }
+    return style_function
+
+
+def extract_script(html_content):
+    """從 folium 產生的 HTML 中取出地圖的 script 內容"""
+    script_start = html_content.find("<script>")
+    script_end = html_content.find("</script>") + len("</script>")
+    if script_start == -1 or script_end <= script_start:
+        return None
+
+    script_content = html_content[script_start:script_end]
+    script_only = script_content.replace("<script>", "").replace("</script>", "")
+    # 資料檔每次都向伺服器以 ETag 重新驗證,沒有變動時只回傳 304,不需要時間戳記破壞快取
+    return script_only.replace(
+        "return fetch('data/dengue_data.json')",
+        "return fetch('data/dengue_data.json', {cache: 'no-cache'})"
+    )
+
+
+def build_map(config=None, source=None):
+    """
+    在程式內產生地圖,不寫入任何檔案
+
+    Args:
+        config: 建置設定,預設由 default_build_config() 產生
+        source: 已載入的 DistrictSource,傳入時可省去讀檔與座標轉換
+
+    Returns:
+        產物字典,包含 map_temp_html, map_html, script_js 與 center
+    """
+    if config is None:
+        config = default_build_config()
+    if source is None:
+        source = DistrictSource(config["geojson_path"], config["coordinate_system"], config["geometry_cache_dir"])
+    source.ensure_loaded()
+
+    gdf = source.gdf
+    map_config = config["map_config"]
+
+    # 根據設定檔決定使用動態計算的中心點還是預設中心點
+    if map_config["use_dynamic_center"]:
+        map_center = source.center
+    else:
+        map_center = map_config["center"]
+
+    fields = [col for col in gdf.columns if col != gdf.geometry.name]
+
+    # 只嵌入初始縮放等級看得出差異的頂點,其他縮放等級由 /api/boundaries 提供
+    with stage("simplify"):
+        tolerance = tolerance_for_zoom(
+            math.floor(map_config["zoom_start"]), map_center[0], BOUNDARY_CONFIG["pixel_tolerance"]
+        )
+        gdf = simplify_boundaries(gdf, tolerance, config["coordinate_system"]["input_crs"])
+
+    with stage("render"):
+        m = folium.Map(
+            location=map_center,
+            zoom_start=map_config["zoom_start"],
+            zoom_control=map_config["zoom_control"],
+            prefer_canvas=map_config["prefer_canvas"]
+        )
+
+        # 創建 GeoJSON 圖層
+        geojson_layer = folium.GeoJson(
+            gdf,
+            name="行政區",
+            style_function=make_style_function(config["district_style"]["default"]),
+            tooltip=folium.GeoJsonTooltip(
+                fields=fields,
+                aliases=fields
+            )
+        )
+
+        # 添加圖層到地圖
+        geojson_layer.add_to(m)
+
+        map_temp_html = m.get_root().render()
+
+    return {
+        "map_temp_html": map_temp_html,
+        "map_html": MAP_PAGE_HTML,
+        "script_js": extract_script(map_temp_html),
+        "center": map_center,
+        "fields": fields,
+    }
+
+
+def _atomic_write(path, content):
+    """先寫入同目錄的暫存檔再以 os.replace 取代,讀取端不會讀到寫到一半的檔案"""
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def _write_script_js(artifacts, config):
+    """檢查是否已存在 script.js，如果存在則保留（不覆蓋）"""
+    if not os.path.exists(config["script_js"]):
+        if artifacts["script_js"] is not None:
+            _atomic_write(config["script_js"], artifacts["script_js"])
+    else:
+        print("script.js 已存在，保留現有版本以維持自定義功能")
+
+
+def write_artifacts(artifacts, config=None):
+    """
+    將 build_map() 的產物寫入 template 目錄
+
+    Args:
+        artifacts: build_map() 的回傳值
+        config: 建置設定,決定輸出路徑
+    """
+    if config is None:
+        config = default_build_config()
+
+    with stage("write"):
+        # 保存基礎地圖
+        _atomic_write(config["map_temp_html"], artifacts["map_temp_html"])
+
+        _write_script_js(artifacts, config)
+
+        # 保存完整的HTML文件
+        _atomic_write(config["map_html"], artifacts["map_html"])
+
+
+def publish_artifacts(artifacts, config=None):
+    """
+    將產物發佈到版本化的建置目錄,完成後才原子性地切換 CURRENT 指標
+    讀取端只會看到完整的舊版本或完整的新版本
+
+    Args:
+        artifacts: build_map() 的回傳值
+        config: 建置設定,決定建置目錄與保留版本數
+
+    Returns:
+        新版本的目錄路徑
+    """
+    if config is None:
+        config = default_build_config()
+
+    build_dir = config["build_dir"]
+    os.makedirs(build_dir, exist_ok=True)
+
+    # script.js 等靜態檔案改用含內容雜湊的網址,瀏覽器可以長期快取
+    with stage("assets"):
+        _write_script_js(artifacts, config)
+        manifest = build_assets(output_dir=config["assets_dir"])
+    artifacts = dict(artifacts, map_html=rewrite_asset_urls(artifacts["map_html"], manifest))
+
+    digest = hashlib.sha1(
+        (artifacts["map_html"] + artifacts["map_temp_html"]).encode("utf-8")
+    ).hexdigest()[:8]
+    now = time.time()
+    version = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}{int(now * 1000) % 1000:03d}-{digest}"
+    version_dir = os.path.join(build_dir, version)
+
+    with stage("write"):
+        if not os.path.isdir(version_dir):
+            # 先寫入暫存目錄,整個目錄完成後才改名為正式版本
+            staging_dir = os.path.join(build_dir, f".staging-{uuid.uuid4().hex}")
+            os.makedirs(staging_dir)
+            for name, key in (("map.html", "map_html"), ("map_temp.html", "map_temp_html")):
+                with open(os.path.join(staging_dir, name), "w", encoding="utf-8") as f:
+                    f.write(artifacts[key])
+            os.replace(staging_dir, version_dir)
+
+        _atomic_write(os.path.join(build_dir, "CURRENT"), version)
+    prune_builds(build_dir, config["keep_versions"])
+    return version_dir
+
+
+def current_artifact_path(name, config=None):
+    """
+    取得目前版本中指定產物的路徑,尚未發佈過任何版本時回傳 template 目錄中的檔案
+
+    Args:
+        name: 產物檔名,例如 'map.html'
+        config: 建置設定
+    """
+    if config is None:
+        config = default_build_config()
+
+    try:
+        with open(os.path.join(config["build_dir"], "CURRENT"), "r", encoding="utf-8") as f:
+            version = f.read().strip()
+    except FileNotFoundError:
+        version = None
+
+    if version:
+        path = os.path.join(config["build_dir"], version, name)
+        if os.path.exists(path):
+            return path
+    return os.path.join(os.path.dirname(config["map_html"]), name)
+
+
+def prune_builds(build_dir, keep_versions):
+    """刪除超過保留數量的舊版本,目前版本永遠保留"""
+    try:
+        with open(os.path.join(build_dir, "CURRENT"), "r", encoding="utf-8") as f:
+            current = f.read().strip()
+    except FileNotFoundError:
+        current = None
+
+    # 版本名稱以時間開頭,排序即為新舊順序
+    versions = sorted(
+        name for name in os.listdir(build_dir)
+        if not name.startswith(".") and os.path.isdir(os.path.join(build_dir, name))
+    )
+    for name in versions[:-keep_versions] if keep_versions > 0 else versions:
+        if name != current:
+            shutil.rmtree(os.path.join(build_dir, name), ignore_errors=True)
+
+
+def main():
+    """單獨執行時產生地圖並輸出各階段耗時"""
+    config = default_build_config()
+    source = DistrictSource(config["geojson_path"], config["coordinate_system"], config["geometry_cache_dir"]).load()
+
+    artifacts = build_map(config, source)
+    center_source = "動態計算" if config["map_config"]["use_dynamic_center"] else "設定檔"
+    print(f"{len(source.gdf)} 個行政區,地圖中心點 ({center_source}): {artifacts['center']}")
+
+    write_artifacts(artifacts, config)
+    print("地圖HTML和JavaScript已成功生成！")
+    for name, seconds in last_stage_seconds.items():
+        print(f"  {name:<16} {seconds * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
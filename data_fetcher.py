@@ -0,0 +1,423 @@
+"""
+登革熱疫情資料系統 - 資料集下載工具
+以串流方式把資料寫入磁碟,支援條件式請求 (ETag/Last-Modified) 與 Range 續傳,
+並提供逐筆讀取 JSON 紀錄的解析器,記憶體用量與檔案大小無關
+同步版本使用 requests,並行下載多個資料集時使用 httpx 的非同步版本
+"""
+
+import asyncio
+import json
+import os
+import time
+
+import httpx
+import requests
+
+from config import DOWNLOAD_CONFIG, EXTERNAL_APIS
+
+try:
+    import ijson
+except ImportError:  # 未安裝 ijson 時使用標準函式庫的逐段解析
+    ijson = None
+
+# 連線中斷,逾時等可以重試 (並以 Range 續傳) 的錯誤,同步 (requests) 與非同步 (httpx) 版本
+RETRYABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.Timeout,
+    httpx.TransportError,
+)
+
+# 值得重試的 HTTP 狀態碼
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def is_retryable(error):
+    """下載錯誤是否值得重試:連線錯誤,或狀態碼在 RETRYABLE_STATUS 中的 HTTP 錯誤"""
+    if isinstance(error, RETRYABLE_ERRORS):
+        return True
+    if isinstance(error, (requests.exceptions.HTTPError, httpx.HTTPStatusError)):
+        response = error.response
+        return response is not None and response.status_code in RETRYABLE_STATUS
+    return False
+
+
+def retry_delay(attempt, settings):
+    """
+    第 attempt 次重試前的等待秒數,每次重試加倍
+
+    Args:
+        attempt: 重試次數,從 1 開始
+        settings: source_settings() 的回傳值
+    """
+    return settings["backoff_seconds"] * 2 ** (attempt - 1)
+
+
+def load_meta(meta_path):
+    """讀取下載紀錄 (ETag, Last-Modified 等)"""
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_meta(meta_path, meta):
+    """原子性地寫入下載紀錄"""
+    tmp_path = f"{meta_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, meta_path)
+
+
+def meta_path_for(path):
+    """下載紀錄的路徑"""
+    return f"{path}.meta.json"
+
+
+def _request_headers(url, dest_path, part_path, meta, reference_path=None):
+    """
+    依現有檔案與下載紀錄組出條件式請求或續傳的標頭
+
+    Args:
+        reference_path: 判斷資料是否變動時參考的檔案,預設為 dest_path 本身
+    """
+    partial = meta.get("partial") or {}
+    validator = partial.get("etag") or partial.get("last_modified")
+    if os.path.exists(part_path) and partial.get("url") == url and validator:
+        # 只有伺服器上的檔案沒變 (If-Range) 才會回傳 206 接續內容
+        return {"Range": f"bytes={os.path.getsize(part_path)}-", "If-Range": validator}
+
+    if reference_path is None:
+        reference_path, reference_meta = dest_path, meta
+    else:
+        reference_path = str(reference_path)
+        reference_meta = load_meta(meta_path_for(reference_path))
+
+    headers = {}
+    if os.path.exists(reference_path) and reference_meta.get("url") == url:
+        if reference_meta.get("etag"):
+            headers["If-None-Match"] = reference_meta["etag"]
+        if reference_meta.get("last_modified"):
+            headers["If-Modified-Since"] = reference_meta["last_modified"]
+    return headers
+
+
+def _begin_body(url, headers, status_code, response_headers, part_path, meta, meta_path):
+    """
+    開始接收內容前決定寫入模式並記錄伺服器的驗證資訊
+
+    Returns:
+        'ab' 表示接續 .part 檔案,'wb' 表示從頭寫入
+    """
+    offset = os.path.getsize(part_path) if "Range" in headers else 0
+    content_range = response_headers.get("Content-Range", "")
+    if status_code == 206 and content_range.startswith(f"bytes {offset}-"):
+        mode = "ab"
+    else:
+        # 伺服器忽略 Range 或檔案已變動,從頭下載
+        mode = "wb"
+
+    meta["partial"] = {
+        "url": url,
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+    }
+    save_meta(meta_path, meta)
+    return mode
+
+
+def _finish_download(part_path, dest_path, meta, meta_path):
+    """下載完成後以 .part 取代正式檔案並更新下載紀錄"""
+    os.replace(part_path, dest_path)
+    meta.update(meta.pop("partial"))
+    meta["size"] = os.path.getsize(dest_path)
+    save_meta(meta_path, meta)
+
+
+def download_dataset(url, dest_path, session=None, config=None, reference_path=None):
+    """
+    以串流方式下載資料集
+
+    資料會先寫入 <dest_path>.part,完成後才取代正式檔案;
+    ETag 與 Last-Modified 記錄在 <dest_path>.meta.json,下次下載時未變動的資料會得到 304 而不重新下載;
+    重試規則與 download_dataset_async() 相同 (見 is_retryable 與 source_settings)
+
+    Args:
+        url: 資料集網址
+        dest_path: 輸出檔案路徑
+        session: 共用的 requests.Session,可重複使用連線
+        config: 下載設定,預設為 DOWNLOAD_CONFIG
+        reference_path: 以另一個檔案的下載紀錄發出條件式請求,用於先下載到暫存區再比對的情況
+
+    Returns:
+        {"status": "downloaded" 或 "not_modified", "path": 路徑, "bytes": 本次下載位元組數, "resumed": 是否續傳}
+    """
+    if config is None:
+        config = DOWNLOAD_CONFIG
+    if session is None:
+        session = requests.Session()
+    settings = source_settings(url, config=config)
+
+    dest_path = str(dest_path)
+    part_path = f"{dest_path}.part"
+    meta_path = meta_path_for(dest_path)
+    meta = load_meta(meta_path)
+
+    received = 0
+    resumed = False
+    attempt = 0
+    resumes = 0
+    while True:
+        attempt_received = received
+        headers = _request_headers(url, dest_path, part_path, meta, reference_path)
+        try:
+            with session.get(url, headers=headers, stream=True, timeout=settings["timeout"]) as response:
+                if response.status_code == 304:
+                    return {"status": "not_modified", "path": dest_path, "bytes": 0, "resumed": False}
+                response.raise_for_status()
+
+                mode = _begin_body(url, headers, response.status_code, response.headers, part_path, meta, meta_path)
+                resumed = resumed or mode == "ab"
+
+                with open(part_path, mode) as f:
+                    for chunk in response.iter_content(chunk_size=config["chunk_size"]):
+                        if chunk:
+                            f.write(chunk)
+                            received += len(chunk)
+            break
+        except requests.exceptions.RequestException as e:
+            if not is_retryable(e):
+                raise
+            error = e
+
+        if received > attempt_received:
+            # 已收到部分內容才中斷,下一次以 Range 續傳,次數另外計算
+            resumes += 1
+            if resumes > config["max_resume_attempts"]:
+                raise error
+            delay = retry_delay(resumes, settings)
+            print(f"下載中斷,{delay} 秒後續傳 ({resumes}/{config['max_resume_attempts']}): {error}")
+        else:
+            attempt += 1
+            if attempt > settings["retry_count"]:
+                raise error
+            delay = retry_delay(attempt, settings)
+            print(f"下載失敗,{delay} 秒後重試 ({attempt}/{settings['retry_count']}): {error}")
+        time.sleep(delay)
+
+    _finish_download(part_path, dest_path, meta, meta_path)
+    return {"status": "downloaded", "path": dest_path, "bytes": received, "resumed": resumed}
+
+
+def source_settings(url, apis=None, config=None):
+    """
+    依網址找出 EXTERNAL_APIS 中對應來源的逾時與重試設定
+
+    Args:
+        url: 資料集網址
+        apis: 外部來源設定,預設為 EXTERNAL_APIS
+        config: 找不到對應來源時使用的下載設定
+
+    Returns:
+        {"timeout": 秒, "retry_count": 次數, "backoff_seconds": 秒}
+    """
+    if apis is None:
+        apis = EXTERNAL_APIS
+    if config is None:
+        config = DOWNLOAD_CONFIG
+
+    # 取網址前綴最長的來源
+    matched = {}
+    for api in apis.values():
+        base_url = api.get("base_url", "")
+        if base_url and url.startswith(base_url) and len(base_url) > len(matched.get("base_url", "")):
+            matched = api
+
+    return {
+        "timeout": matched.get("timeout", config["timeout"]),
+        "retry_count": matched.get("retry_count", config["retry_count"]),
+        "backoff_seconds": matched.get("backoff_seconds", config["backoff_seconds"]),
+    }
+
+
+async def download_dataset_async(client, url, dest_path, config=None, reference_path=None):
+    """
+    download_dataset() 的非同步版本,供多個資料集共用同一個 httpx.AsyncClient 並行下載
+
+    逾時,重試次數與退避時間依網址從 EXTERNAL_APIS 取得 (見 source_settings);
+    連線中斷或伺服器暫時錯誤時,等待後以 Range 從中斷處續傳
+
+    Args:
+        client: 共用連線池的 httpx.AsyncClient
+        url: 資料集網址
+        dest_path: 輸出檔案路徑
+        config: 下載設定,預設為 DOWNLOAD_CONFIG
+        reference_path: 以另一個檔案的下載紀錄發出條件式請求
+
+    Returns:
+        與 download_dataset() 相同
+    """
+    if config is None:
+        config = DOWNLOAD_CONFIG
+    settings = source_settings(url, config=config)
+
+    dest_path = str(dest_path)
+    part_path = f"{dest_path}.part"
+    meta_path = meta_path_for(dest_path)
+    meta = load_meta(meta_path)
+
+    received = 0
+    resumed = False
+    attempt = 0
+    resumes = 0
+    while True:
+        attempt_received = received
+        headers = _request_headers(url, dest_path, part_path, meta, reference_path)
+        try:
+            async with client.stream("GET", url, headers=headers, timeout=settings["timeout"]) as response:
+                if response.status_code == 304:
+                    return {"status": "not_modified", "path": dest_path, "bytes": 0, "resumed": False}
+                response.raise_for_status()
+
+                mode = _begin_body(url, headers, response.status_code, response.headers, part_path, meta, meta_path)
+                resumed = resumed or mode == "ab"
+
+                with open(part_path, mode) as f:
+                    async for chunk in response.aiter_bytes(config["chunk_size"]):
+                        f.write(chunk)
+                        received += len(chunk)
+            break
+        except httpx.HTTPError as e:
+            if not is_retryable(e):
+                raise
+            error = e
+
+        if received > attempt_received:
+            # 已收到部分內容才中斷,下一次以 Range 續傳,次數另外計算
+            resumes += 1
+            if resumes > config["max_resume_attempts"]:
+                raise error
+            delay = retry_delay(resumes, settings)
+            print(f"下載中斷,{delay} 秒後續傳 ({resumes}/{config['max_resume_attempts']}): {error}")
+        else:
+            attempt += 1
+            if attempt > settings["retry_count"]:
+                raise error
+            delay = retry_delay(attempt, settings)
+            print(f"下載失敗,{delay} 秒後重試 ({attempt}/{settings['retry_count']}): {error}")
+        await asyncio.sleep(delay)
+
+    _finish_download(part_path, dest_path, meta, meta_path)
+    return {"status": "downloaded", "path": dest_path, "bytes": received, "resumed": resumed}
+
+
+class _JsonStream:
+    """以固定大小的區塊讀取 JSON 文字,每次解碼一個值"""
+
+    WHITESPACE = " \t\r\n"
+    DELIMITERS = ",:]}" + WHITESPACE
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        """丟棄已解析的部分並讀入下一個區塊"""
+        chunk = self.f.read(self.chunk_size)
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        self.eof = not chunk
+
+    def peek(self):
+        """跳過空白並回傳下一個字元,檔案結束時回傳空字串"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in self.WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self._fill()
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"JSON 格式錯誤:預期 '{char}',位置附近為 {self.buffer[self.pos:self.pos + 20]!r}")
+        self.pos += 1
+
+    def decode(self):
+        """解碼下一個完整的 JSON 值"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # 數字可能剛好在區塊邊界被截斷 (例如 2.5 只讀到 2.),後面必須接著分隔字元才算完整
+                if self.eof or (end < len(self.buffer) and self.buffer[end] in self.DELIMITERS):
+                    self.pos = end
+                    return value
+            except ValueError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def iter_array(self):
+        """逐一產生目前位置上陣列的元素"""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.decode()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
+
+
+def _iter_prefix(stream, keys):
+    """依 ijson 形式的路徑 (例如 data.item) 找到陣列並逐筆產生元素"""
+    if not keys:
+        raise ValueError("路徑必須以 item 結尾")
+    if keys == ["item"]:
+        yield from stream.iter_array()
+        return
+
+    stream.expect("{")
+    while stream.peek() != "}":
+        key = stream.decode()
+        stream.expect(":")
+        if key == keys[0]:
+            yield from _iter_prefix(stream, keys[1:])
+            return
+        stream.decode()
+        if stream.peek() == ",":
+            stream.pos += 1
+
+
+def iter_records(path, prefix=None, chunk_size=None):
+    """
+    逐筆讀取 JSON 檔案中的紀錄,不會一次把整個檔案載入記憶體
+
+    Args:
+        path: JSON 檔案路徑
+        prefix: 紀錄所在位置 (ijson 語法),預設為 DOWNLOAD_CONFIG["record_prefix"]
+        chunk_size: 每次讀取的字元數
+
+    Yields:
+        每一筆紀錄
+    """
+    if prefix is None:
+        prefix = DOWNLOAD_CONFIG["record_prefix"]
+    if chunk_size is None:
+        chunk_size = DOWNLOAD_CONFIG["chunk_size"]
+
+    if ijson is not None:
+        with open(path, "rb") as f:
+            yield from ijson.items(f, prefix, use_float=True)
+        return
+
+    with open(path, "r", encoding="utf-8-sig") as f:
+        yield from _iter_prefix(_JsonStream(f, chunk_size), prefix.split("."))
@@ -0,0 +1,139 @@
+"""
+登革熱疫情資料系統 - 資料集增量同步
+新資料先下載到暫存區,以內容雜湊與目前版本比對,只有真正變動的資料集才會取代正式檔案
+並觸發下游重建;下載失敗時正式檔案完全不受影響
+"""
+
+import hashlib
+import os
+
+from config import DATA_SOURCES, DATASET_STAGING_DIR
+from data_fetcher import load_meta, meta_path_for, save_meta
+from dataset_fetchers import dataset_path, update_datasets
+
+# (資料集名稱集合或 None, 重建函數);None 表示任何資料集變動都要執行
+REBUILD_HOOKS = []
+
+
+def register_rebuild_hook(titles=None):
+    """
+    註冊資料集變動後要執行的下游重建函數的裝飾器
+
+    Args:
+        titles: 關心的資料集名稱,None 表示任何資料集
+
+    被註冊的函數會收到這次變動的資料集名稱清單
+    """
+    def decorator(func):
+        REBUILD_HOOKS.append((set(titles) if titles is not None else None, func))
+        return func
+    return decorator
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """分段計算檔案的 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def staging_path(title):
+    """資料集在暫存區的路徑"""
+    return dataset_path(title, DATASET_STAGING_DIR)
+
+
+def _promote(title):
+    """
+    比對暫存區與正式檔案的內容,有變動才取代正式檔案
+
+    Returns:
+        是否有變動
+    """
+    staged = staging_path(title)
+    current = dataset_path(title)
+
+    staged_meta = load_meta(meta_path_for(staged))
+    staged_meta["sha256"] = file_sha256(staged)
+
+    current_hash = None
+    if os.path.exists(current):
+        current_hash = load_meta(meta_path_for(current)).get("sha256") or file_sha256(current)
+
+    changed = staged_meta["sha256"] != current_hash
+    if changed:
+        os.makedirs(os.path.dirname(current), exist_ok=True)
+        os.replace(staged, current)
+    else:
+        os.remove(staged)
+
+    # 內容相同時也更新 ETag 等資訊,下次才能得到 304
+    save_meta(meta_path_for(current), staged_meta)
+    os.remove(meta_path_for(staged))
+    return changed
+
+
+def run_rebuild_hooks(changed_titles):
+    """
+    執行關心這些資料集的下游重建函數
+
+    Returns:
+        {函數名稱: 錯誤訊息或 None}
+    """
+    outcomes = {}
+    changed = set(changed_titles)
+    for titles, func in REBUILD_HOOKS:
+        relevant = changed if titles is None else changed & titles
+        if not relevant:
+            continue
+        try:
+            func(sorted(relevant))
+            outcomes[func.__name__] = None
+        except Exception as e:
+            print(f"下游重建 {func.__name__} 失敗: {e}")
+            outcomes[func.__name__] = str(e)
+    return outcomes
+
+
+async def sync_datasets(titles=None, fetcher=None, config=None):
+    """
+    下載資料集到暫存區,比對後只替換有變動的資料集並觸發下游重建
+
+    Args:
+        titles: 資料集名稱,預設為 DATA_SOURCES["data_titles"]
+        fetcher: 負責網址查詢的 DatasetFetcher
+        config: 下載設定
+
+    Returns:
+        {資料集名稱: {"status": "changed" | "unchanged" | "failed", "path": 正式檔案路徑, "error": 錯誤訊息}}
+    """
+    if titles is None:
+        titles = DATA_SOURCES["data_titles"]
+
+    os.makedirs(str(DATASET_STAGING_DIR), exist_ok=True)
+    # 條件式請求參考正式檔案的 ETag,未變動的資料直接得到 304
+    results = await update_datasets(
+        titles, fetcher, config, dest_for=staging_path, reference_for=dataset_path
+    )
+
+    outcomes = {}
+    for title, result in results.items():
+        outcome = {"status": "unchanged", "path": dataset_path(title), "error": None}
+        if isinstance(result, Exception):
+            # 未完成的 .part 保留在暫存區,下次可以續傳
+            outcome["status"] = "failed"
+            outcome["error"] = str(result)
+        elif result["status"] == "downloaded":
+            try:
+                if _promote(title):
+                    outcome["status"] = "changed"
+            except OSError as e:
+                outcome["status"] = "failed"
+                outcome["error"] = str(e)
+        outcomes[title] = outcome
+
+    changed_titles = [title for title, outcome in outcomes.items() if outcome["status"] == "changed"]
+    if changed_titles:
+        run_rebuild_hooks(changed_titles)
+    return outcomes
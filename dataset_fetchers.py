@@ -0,0 +1,307 @@
+"""
+登革熱疫情資料系統 - 資料集取得層
+依 DATA_SOURCES["data_titles"] 的資料集名稱找出 JSON 網址並下載:
+1. 註冊的自訂取得函數
+2. 設定檔中的已知網址或快取的網址對照表 (manifest)
+3. 都找不到時才開啟瀏覽器從開放資料平台查詢,並把結果寫回對照表
+update_datasets() 以共用連線池並行下載所有資料集,每個資料集寫入各自的檔案
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from datetime import datetime
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import DATA_SOURCES, DATASET_MANIFEST_JSON, DATASETS_DIR, DOWNLOAD_CONFIG, SELENIUM_CONFIG
+from data_fetcher import download_dataset, download_dataset_async
+
+# 資料集名稱 -> 自訂取得函數 fn(session, dest_path, reference_path) -> download_dataset 的回傳值
+# reference_path 為條件式請求參考的檔案 (None 表示 dest_path 本身),應轉交給 download_dataset
+FETCHER_REGISTRY = {}
+
+
+def register_fetcher(title):
+    """
+    為特定資料集註冊自訂取得函數的裝飾器
+
+    Args:
+        title: 資料集名稱,與 DATA_SOURCES["data_titles"] 相同
+    """
+    def decorator(func):
+        FETCHER_REGISTRY[title] = func
+        return func
+    return decorator
+
+
+def dataset_path(title, datasets_dir=DATASETS_DIR):
+    """資料集的下載檔案路徑,以資料集名稱命名"""
+    safe_title = re.sub(r'[\\/:*?"<>|]', "_", title)
+    return os.path.join(str(datasets_dir), f"{safe_title}.json")
+
+
+def create_session(config=None):
+    """建立共用連線池的 requests.Session"""
+    if config is None:
+        config = DOWNLOAD_CONFIG
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=config["pool_maxsize"], pool_maxsize=config["pool_maxsize"])
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class UrlManifest:
+    """資料集名稱與 JSON 網址的對照表,保存在 DATASET_MANIFEST_JSON"""
+
+    def __init__(self, path=DATASET_MANIFEST_JSON, seeds=None):
+        """
+        Args:
+            path: 對照表檔案路徑
+            seeds: 設定檔中的已知網址,優先於快取
+        """
+        self.path = str(path)
+        self.seeds = seeds if seeds is not None else DATA_SOURCES.get("dataset_urls", {})
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+
+    def get(self, title):
+        """取得資料集網址,找不到時回傳 None"""
+        if title in self.seeds:
+            return self.seeds[title]
+        entry = self.entries.get(title)
+        return entry["url"] if entry else None
+
+    def set(self, title, url, source):
+        """記錄資料集網址並寫回檔案"""
+        self.entries[title] = {
+            "url": url,
+            "source": source,
+            "resolved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        self.save()
+
+    def invalidate(self, title):
+        """網址失效時移除快取 (設定檔中的網址不受影響)"""
+        if self.entries.pop(title, None) is not None:
+            self.save()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class BrowserUrlResolver:
+    """以 Selenium 開啟開放資料平台查詢資料集的 JSON 網址,只在對照表找不到時使用"""
+
+    def __init__(self, dataset_page=None, config=None):
+        self.dataset_page = dataset_page or DATA_SOURCES["tainan_data_url"]
+        self.config = config if config is not None else SELENIUM_CONFIG
+        self.driver = None
+
+    def _start(self):
+        # 延遲載入 Selenium,對照表命中時完全不需要瀏覽器
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        chrome_options = Options()
+        if self.config["headless"]:
+            chrome_options.add_argument("--headless")
+        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+
+    def resolve(self, title):
+        """
+        查詢資料集的 JSON 網址
+
+        Args:
+            title: 資料集名稱
+
+        Returns:
+            JSON 網址
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        if self.driver is None:
+            self._start()
+
+        driver = self.driver
+        driver.get(self.dataset_page)
+        for i in range(self.config["max_retries"]):
+            try:
+                element = WebDriverWait(driver, self.config["wait_timeout"]).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, f'[title="{title}"]'))
+                )
+                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
+                time.sleep(self.config["scroll_delay"])
+                element.click()
+                break
+            except Exception:
+                driver.execute_script("window.scrollBy(0, 500);")
+                time.sleep(self.config["scroll_delay"])
+
+        jsonbtn = WebDriverWait(driver, self.config["wait_timeout"]).until(
+            EC.element_to_be_clickable((By.LINK_TEXT, "JSON"))
+        )
+        jsonbtn.click()
+
+        driver.switch_to.window(driver.window_handles[-1])
+        url = driver.current_url
+        # 回到原本的分頁,下一個資料集才能繼續查詢
+        driver.close()
+        driver.switch_to.window(driver.window_handles[0])
+        return url
+
+    def close(self):
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+
+
+class DatasetFetcher:
+    """依資料集名稱取得資料,共用連線池與網址對照表"""
+
+    def __init__(self, session=None, manifest=None, resolver=None):
+        self.session = session if session is not None else create_session()
+        self.manifest = manifest if manifest is not None else UrlManifest()
+        self.resolver = resolver if resolver is not None else BrowserUrlResolver()
+
+    def resolve(self, title):
+        """取得資料集網址,對照表找不到時才使用瀏覽器"""
+        url = self.manifest.get(title)
+        if url is None:
+            print(f"{title}: 對照表中沒有網址,改用瀏覽器查詢")
+            url = self.resolver.resolve(title)
+            self.manifest.set(title, url, "browser")
+        return url
+
+    def fetch(self, title, dest_path, reference_path=None):
+        """
+        下載資料集到 dest_path
+
+        Args:
+            title: 資料集名稱
+            dest_path: 輸出檔案路徑
+            reference_path: 條件式請求參考的檔案,預設為 dest_path 本身
+
+        Returns:
+            download_dataset() 的回傳值,另外附上 title 與 url
+        """
+        if title in FETCHER_REGISTRY:
+            result = FETCHER_REGISTRY[title](self.session, dest_path, reference_path)
+            result.setdefault("title", title)
+            return result
+
+        url = self.resolve(title)
+        try:
+            result = download_dataset(url, dest_path, self.session, reference_path=reference_path)
+        except requests.exceptions.HTTPError as e:
+            # 快取的網址失效時重新查詢一次
+            if e.response is None or e.response.status_code not in (404, 410) or title in self.manifest.seeds:
+                raise
+            print(f"{title}: 快取的網址已失效,重新查詢")
+            self.manifest.invalidate(title)
+            url = self.resolve(title)
+            result = download_dataset(url, dest_path, self.session, reference_path=reference_path)
+
+        result["title"] = title
+        result["url"] = url
+        return result
+
+    def close(self):
+        self.resolver.close()
+        self.session.close()
+
+
+async def _run_blocking(func, *args):
+    """在執行緒中執行同步函數 (瀏覽器查詢,自訂取得函數)"""
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+async def _update_one(client, fetcher, title, semaphore, resolve_lock, dest_for, reference_for):
+    """下載單一資料集到各自的檔案"""
+    dest_path = dest_for(title)
+    reference_path = reference_for(title) if reference_for is not None else None
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+
+    async with semaphore:
+        if title in FETCHER_REGISTRY:
+            return await _run_blocking(fetcher.fetch, title, dest_path, reference_path)
+
+        # 瀏覽器一次只能查詢一個資料集
+        async with resolve_lock:
+            url = await _run_blocking(fetcher.resolve, title)
+        try:
+            result = await download_dataset_async(client, url, dest_path, reference_path=reference_path)
+        except httpx.HTTPStatusError as e:
+            # 快取的網址失效時重新查詢一次
+            if e.response.status_code not in (404, 410) or title in fetcher.manifest.seeds:
+                raise
+            print(f"{title}: 快取的網址已失效,重新查詢")
+            fetcher.manifest.invalidate(title)
+            async with resolve_lock:
+                url = await _run_blocking(fetcher.resolve, title)
+            result = await download_dataset_async(client, url, dest_path, reference_path=reference_path)
+
+    result["title"] = title
+    result["url"] = url
+    return result
+
+
+async def update_datasets(titles=None, fetcher=None, config=None, dest_for=dataset_path, reference_for=None):
+    """
+    並行下載多個資料集,共用同一個連線池並限制同時下載的數量
+
+    Args:
+        titles: 資料集名稱,預設為 DATA_SOURCES["data_titles"]
+        fetcher: 負責網址查詢的 DatasetFetcher,預設建立新的並在結束時關閉
+        config: 下載設定,預設為 DOWNLOAD_CONFIG
+        dest_for: 資料集名稱 -> 輸出路徑,預設為 dataset_path
+        reference_for: 資料集名稱 -> 條件式請求參考的檔案路徑,預設為輸出檔案本身
+
+    Returns:
+        {資料集名稱: download_dataset 的回傳值,失敗時為例外物件}
+    """
+    if titles is None:
+        titles = DATA_SOURCES["data_titles"]
+    if config is None:
+        config = DOWNLOAD_CONFIG
+
+    owns_fetcher = fetcher is None
+    if owns_fetcher:
+        fetcher = DatasetFetcher()
+
+    semaphore = asyncio.Semaphore(config["max_concurrency"])
+    resolve_lock = asyncio.Lock()
+    limits = httpx.Limits(
+        max_connections=config["pool_maxsize"], max_keepalive_connections=config["pool_maxsize"]
+    )
+    try:
+        async with httpx.AsyncClient(limits=limits, follow_redirects=True) as client:
+            results = await asyncio.gather(
+                *[
+                    _update_one(client, fetcher, title, semaphore, resolve_lock, dest_for, reference_for)
+                    for title in titles
+                ],
+                return_exceptions=True
+            )
+    finally:
+        if owns_fetcher:
+            fetcher.close()
+
+    return dict(zip(titles, results))
@@ -1,11 +1,30 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
+import argparse
+import csv
 import random
+import shutil
+import time
 from datetime import datetime, timedelta
 import os
 
+import numpy as np
+import shapely
+
+from columnar_store import write_columns, write_json_view, write_table
+from config import (
+    COORDINATE_SYSTEM, DATA_DIR, DISTRICT_BOUNDARIES_GEOJSON, RISK_LABELS, SYNTHETIC_DATA_CONFIG
+)
+from data.process_map import DistrictSource
+from ovitrap_history import OvitrapHistory
+from models import District, Ovitrap, Weather
+from risk_engine import rate_per_10k, risk_labels
+from serializers import validate_records, write_json
+
+# 每度緯度約 111.32 公里
+METERS_PER_DEGREE = 111320.0
+
 class DengueDataGenerator:
     def __init__(self):
         self.tainan_districts = [
@@ -15,7 +34,9 @@ class DengueDataGenerator:
             "後壁區", "東山區", "六甲區", "官田區", "麻豆區", "下營區", "柳營區"
         ]
         
-        self.risk_levels = ["低風險", "中風險", "高風險", "極高風險"]
+        self.risk_levels = list(RISK_LABELS.values())
+        # 每萬人5例以上 (RISK_THRESHOLDS 的 medium 與 high)
+        self.high_risk_levels = [RISK_LABELS["high"], RISK_LABELS["medium"]]
         
         self.population_base = {
             "中西區": 78000, "安平區": 65000, "東區": 185000, "南區": 125000, "北區": 135000,
@@ -42,57 +63,46 @@ class DengueDataGenerator:
         return cases
     
     def calculate_risk_level(self, cases, population):
-        """根據病例數和人口計算風險等級"""
-        if population == 0:
-            return "低風險"
-        
-        rate = cases / population * 10000
-        
-        if rate >= 10:
-            return "極高風險"
-        elif rate >= 5:
-            return "高風險"
-        elif rate >= 2:
-            return "中風險"
-        else:
-            return "低風險"
+        """根據病例數和人口計算風險等級 (閾值見 config.RISK_THRESHOLDS)"""
+        return risk_labels(rate_per_10k([cases], [population]))[0]
     
     def generate_district_data(self):
         """生成所有行政區的數據"""
+        populations = np.array([self.population_base.get(district, 50000) for district in self.tainan_districts])
+        cases = np.array([self.generate_dengue_cases(district) for district in self.tainan_districts])
+        # 所有行政區一次計算病例率與風險等級
+        rates = rate_per_10k(cases, populations)
+        levels = risk_labels(rates)
+        
         district_data = []
         
         for i, district in enumerate(self.tainan_districts):
-            population = self.population_base.get(district, 50000)
-            cases = self.generate_dengue_cases(district)
-            risk_level = self.calculate_risk_level(cases, population)
-            
             update_time = datetime.now() - timedelta(days=random.randint(0, 7))
             
-            district_info = {
-                "id": i + 1,
-                "name": district,
-                "population": population,
-                "dengue_cases": cases,
-                "risk_level": risk_level,
-                "last_update": update_time.strftime("%Y-%m-%d %H:%M"),
-                "value": cases,
-                "rate_per_10k": round(cases / population * 10000, 2) if population > 0 else 0
-            }
+            district_info = District(
+                id=i + 1,
+                name=district,
+                population=int(populations[i]),
+                dengue_cases=int(cases[i]),
+                risk_level=levels[i],
+                last_update=update_time.strftime("%Y-%m-%d %H:%M"),
+                rate_per_10k=float(rates[i])
+            )
             
             district_data.append(district_info)
         
-        district_data.sort(key=lambda x: x['dengue_cases'], reverse=True)
+        district_data.sort(key=lambda x: x.dengue_cases, reverse=True)
         
         return district_data
     
     def generate_weather_data(self):
         """生成天氣相關數據"""
-        weather_data = {
-            "temperature": round(random.uniform(25, 35), 1),
-            "humidity": random.randint(60, 90),
-            "rainfall": round(random.uniform(0, 50), 1),
-            "update_time": datetime.now().strftime("%Y-%m-%d %H:%M")
-        }
+        weather_data = Weather(
+            temperature=round(random.uniform(25, 35), 1),
+            humidity=random.randint(60, 90),
+            rainfall=round(random.uniform(0, 50), 1),
+            update_time=datetime.now().strftime("%Y-%m-%d %H:%M")
+        )
         return weather_data
     
     def generate_ovitrap_data(self):
@@ -103,45 +113,54 @@ class DengueDataGenerator:
             num_ovitraps = random.randint(5, 15)
             
             for i in range(num_ovitraps):
-                ovitrap_info = {
-                    "district": district,
-                    "ovitrap_id": f"{district}_{i+1:03d}",
-                    "egg_count": random.randint(0, 200),
-                    "location": {
-                        "lat": round(23.0 + random.uniform(-0.5, 0.5), 6),
-                        "lng": round(120.2 + random.uniform(-0.5, 0.5), 6)
-                    },
-                    "status": random.choice(["正常", "需更換", "故障"]),
-                    "last_check": (datetime.now() - timedelta(days=random.randint(0, 14))).strftime("%Y-%m-%d")
-                }
+                ovitrap_info = Ovitrap(
+                    district=district,
+                    ovitrap_id=f"{district}_{i+1:03d}",
+                    egg_count=random.randint(0, 200),
+                    lat=round(23.0 + random.uniform(-0.5, 0.5), 6),
+                    lng=round(120.2 + random.uniform(-0.5, 0.5), 6),
+                    status=random.choice(["正常", "需更換", "故障"]),
+                    last_check=(datetime.now() - timedelta(days=random.randint(0, 14))).strftime("%Y-%m-%d")
+                )
                 ovitrap_data.append(ovitrap_info)
         
         return ovitrap_data
     
     def save_data_to_json(self, data, filename):
-        """保存數據到JSON文件"""
+        """保存數據到JSON文件 (精簡格式,給瀏覽器使用)"""
         output_path = os.path.join(os.path.dirname(__file__), 'data', filename)
         
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_json(output_path, data)
         
         print(f"數據已保存到: {output_path}")
         return output_path
+
+    def save_table(self, name, data, filename, single=False):
+        """保存數據為欄式資料表,JSON 檔由欄式資料衍生,寫入前先驗證紀錄格式"""
+        validate_records(data, name)
+        table = write_table(name, [data] if single else data)
+        output_path = os.path.join(os.path.dirname(__file__), 'data', filename)
+        write_json_view(table, output_path, single=single)
+        
+        print(f"數據已保存到: {output_path} (欄式資料版本 {table.version})")
+        return output_path
     
     def generate_all_data(self):
         """生成所有類型的數據"""
         print("正在生成台南市登革熱疫情模擬數據...")
         
         district_data = self.generate_district_data()
-        district_file = self.save_data_to_json(district_data, 'district_data.json')
+        district_file = self.save_table('districts', district_data, 'district_data.json')
         
         weather_data = self.generate_weather_data()
-        weather_file = self.save_data_to_json(weather_data, 'weather_data.json')
+        weather_file = self.save_table('weather', weather_data, 'weather_data.json', single=True)
         
         ovitrap_data = self.generate_ovitrap_data()
-        ovitrap_file = self.save_data_to_json(ovitrap_data, 'ovitrap_data.json')
+        ovitrap_file = self.save_table('ovitraps', ovitrap_data, 'ovitrap_data.json')
+        # 每次的誘卵器資料都保留在歷史資料中
+        OvitrapHistory().append(ovitrap_data)
         
         combined_data = {
             "districts": district_data,
@@ -149,28 +168,307 @@ class DengueDataGenerator:
             "ovitraps": ovitrap_data,
             "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "total_districts": len(district_data),
-            "total_cases": sum(d['dengue_cases'] for d in district_data),
-            "high_risk_districts": len([d for d in district_data if d['risk_level'] in ['高風險', '極高風險']])
+            "total_cases": sum(d.dengue_cases for d in district_data),
+            "high_risk_districts": len([d for d in district_data if d.risk_level in self.high_risk_levels])
         }
         
         combined_file = self.save_data_to_json(combined_data, 'dengue_data.json')
         
         print("\n=== 數據生成完成 ===")
         print(f"總行政區數: {len(district_data)}")
-        print(f"總病例數: {sum(d['dengue_cases'] for d in district_data)}")
-        print(f"高風險區域: {len([d for d in district_data if d['risk_level'] in ['高風險', '極高風險']])}")
+        print(f"總病例數: {sum(d.dengue_cases for d in district_data)}")
+        print(f"高風險區域: {len([d for d in district_data if d.risk_level in self.high_risk_levels])}")
         print(f"數據文件: {combined_file}")
         
         return combined_data
 
+class LargeScaleGenerator(DengueDataGenerator):
+    """
+    以 NumPy 向量運算產生大量模擬資料 (效能測試用),相同的 seed 會產生相同的資料
+
+    村里集中在各行政區的聚落附近,誘卵器分布在村里周圍,所有點位都落在 district_boundaries.geojson
+    的行政區範圍內;誘卵器每週一筆紀錄,卵數有夏季高峰。資料直接寫成欄式資料與歷史資料分區
+    """
+
+    STATUS_LABELS = ["正常", "需更換", "故障"]
+    STATUS_WEIGHTS = [0.85, 0.10, 0.05]
+
+    def __init__(self, scale=1.0, seed=None, config=None, source=None):
+        """
+        Args:
+            scale: 資料規模,1 約為實際規模 (村里數與誘卵器數乘上此倍數)
+            seed: 亂數種子,預設為 config["seed"]
+            config: 設定,預設為 SYNTHETIC_DATA_CONFIG
+            source: 已載入的 DistrictSource,預設讀取 DISTRICT_BOUNDARIES_GEOJSON
+        """
+        super().__init__()
+        self.config = config if config is not None else SYNTHETIC_DATA_CONFIG
+        self.scale = scale
+        self.seed = self.config["seed"] if seed is None else seed
+        self.rng = np.random.default_rng(self.seed)
+
+        if source is None:
+            source = DistrictSource(DISTRICT_BOUNDARIES_GEOJSON, COORDINATE_SYSTEM)
+        gdf = source.ensure_loaded().gdf
+        geometries = dict(zip(gdf["name"], gdf.geometry))
+        self.geometries = []
+        for district in self.tainan_districts:
+            # 邊界資料中相鄰行政區有少量重疊,只在不重疊的範圍取點,空間對應的結果才會一致
+            others = shapely.union_all([geometry for name, geometry in geometries.items() if name != district])
+            exclusive = shapely.difference(geometries[district], others)
+            geometry = exclusive if not exclusive.is_empty else geometries[district]
+            shapely.prepare(geometry)
+            self.geometries.append(geometry)
+        self.populations = np.array([self.population_base[district] for district in self.tainan_districts])
+
+    def _sample_in_polygon(self, geometry, count, centers=None, sigma_m=None):
+        """
+        在多邊形內取點
+
+        Args:
+            geometry: 經緯度多邊形
+            count: 點數
+            centers: (經度陣列, 緯度陣列),指定時點位以常態分布集中在這些中心附近,否則均勻分布
+            sigma_m: 常態分布的標準差 (公尺)
+
+        Returns:
+            (經度陣列, 緯度陣列)
+        """
+        minx, miny, maxx, maxy = geometry.bounds
+        if centers is not None:
+            sigma_lat = sigma_m / METERS_PER_DEGREE
+            sigma_lng = sigma_lat / np.cos(np.radians((miny + maxy) / 2))
+
+        lngs, lats = [], []
+        found = 0
+        while found < count:
+            need = count - found
+            batch = max(need * 2, 64)
+            if centers is None:
+                lng = self.rng.uniform(minx, maxx, batch)
+                lat = self.rng.uniform(miny, maxy, batch)
+            else:
+                pick = self.rng.integers(0, len(centers[0]), batch)
+                lng = centers[0][pick] + self.rng.normal(0, sigma_lng, batch)
+                lat = centers[1][pick] + self.rng.normal(0, sigma_lat, batch)
+            # 落在行政區外的點捨棄後重新抽樣
+            inside = np.flatnonzero(shapely.contains_xy(geometry, lng, lat))[:need]
+            lngs.append(lng[inside])
+            lats.append(lat[inside])
+            found += len(inside)
+        return np.concatenate(lngs), np.concatenate(lats)
+
+    def generate_villages(self):
+        """
+        產生村里,村里數依行政區人口分配
+
+        Returns:
+            {"name", "district", "lng", "lat", "population"} 陣列,district 為 tainan_districts 的索引
+        """
+        total = max(int(round(self.config["villages"] * self.scale)), len(self.tainan_districts))
+        counts = self.rng.multinomial(
+            total - len(self.tainan_districts), self.populations / self.populations.sum()
+        ) + 1
+
+        names, districts, lngs, lats, populations = [], [], [], [], []
+        for index, (district, geometry, count) in enumerate(zip(self.tainan_districts, self.geometries, counts)):
+            clusters = self._sample_in_polygon(geometry, self.config["clusters_per_district"])
+            lng, lat = self._sample_in_polygon(geometry, int(count), clusters, self.config["cluster_sigma_m"])
+            names.extend(f"{district}模擬{k + 1:04d}里" for k in range(count))
+            districts.append(np.full(count, index, dtype=np.int32))
+            lngs.append(lng)
+            lats.append(lat)
+            populations.append(np.round(self.rng.dirichlet(np.ones(count)) * self.populations[index]).astype(np.int64))
+
+        return {
+            "name": np.array(names, dtype=object),
+            "district": np.concatenate(districts),
+            "lng": np.concatenate(lngs),
+            "lat": np.concatenate(lats),
+            "population": np.concatenate(populations),
+        }
+
+    def generate_ovitraps(self, villages):
+        """
+        在村里周圍產生誘卵器
+
+        Returns:
+            {"district", "ovitrap_id", "lng", "lat", "baseline"} 陣列,baseline 為每個誘卵器的平均卵數
+        """
+        districts, ids, lngs, lats = [], [], [], []
+        for index, (district, geometry) in enumerate(zip(self.tainan_districts, self.geometries)):
+            in_district = villages["district"] == index
+            count = int(in_district.sum()) * self.config["ovitraps_per_village"]
+            centers = (villages["lng"][in_district], villages["lat"][in_district])
+            lng, lat = self._sample_in_polygon(geometry, count, centers, self.config["ovitrap_sigma_m"])
+            districts.append(np.full(count, index, dtype=np.int8))
+            ids.extend(f"{district}_{k + 1:05d}" for k in range(count))
+            lngs.append(lng)
+            lats.append(lat)
+
+        count = len(ids)
+        return {
+            "district": np.concatenate(districts),
+            "ovitrap_id": np.array(ids, dtype=str),
+            "lng": np.round(np.concatenate(lngs), 6),
+            "lat": np.round(np.concatenate(lats), 6),
+            "baseline": self.rng.gamma(2.0, 25.0, count),
+        }
+
+    def iter_readings(self, ovitraps, years=None, end=None):
+        """
+        逐月產生每週的誘卵器紀錄,每次只在記憶體中保留一個月的資料
+
+        Args:
+            ovitraps: generate_ovitraps() 的結果
+            years: 年數,預設為 config["years"]
+            end: 最後一週的日期,預設為今天
+
+        Yields:
+            (欄位資料, 類別清單),格式與 columnar_store.records_to_columns() 相同
+        """
+        years = self.config["years"] if years is None else years
+        end = np.datetime64(end if end is not None else datetime.now().strftime("%Y-%m-%d"), "D")
+        dates = np.arange(end - 7 * (int(years * 365.25) // 7), end + 1, 7)
+        months = dates.astype("datetime64[M]")
+        count = len(ovitraps["ovitrap_id"])
+        categories = {"district": list(self.tainan_districts), "status": list(self.STATUS_LABELS)}
+
+        for month in np.unique(months):
+            week_dates = dates[months == month]
+            weeks = len(week_dates)
+            # 卵數在 7 月前後最多
+            day_of_year = (week_dates - week_dates.astype("datetime64[Y]")).astype(np.int64)
+            season = 1 + 0.8 * np.sin(2 * np.pi * (day_of_year - 100) / 365.25)
+            egg_count = self.rng.poisson(season[:, None] * ovitraps["baseline"][None, :]).ravel()
+            columns = {
+                "district": np.tile(ovitraps["district"], weeks),
+                "ovitrap_id": np.tile(ovitraps["ovitrap_id"], weeks),
+                "egg_count": egg_count.astype(np.int64),
+                "lat": np.tile(ovitraps["lat"], weeks),
+                "lng": np.tile(ovitraps["lng"], weeks),
+                "status": self.rng.choice(len(self.STATUS_LABELS), weeks * count, p=self.STATUS_WEIGHTS).astype(np.int8),
+                "last_check": np.repeat(week_dates, count),
+            }
+            yield columns, categories
+
+    def generate_district_records(self, latest):
+        """
+        依最近一週各行政區的平均卵數產生病例數
+
+        Args:
+            latest: 最近一週的誘卵器欄位資料
+        """
+        eggs = np.bincount(latest["district"], weights=latest["egg_count"], minlength=len(self.tainan_districts))
+        traps = np.bincount(latest["district"], minlength=len(self.tainan_districts))
+        mean_eggs = np.divide(eggs, traps, out=np.zeros_like(eggs), where=traps > 0)
+        factor = mean_eggs / mean_eggs.mean() if mean_eggs.mean() > 0 else np.ones_like(mean_eggs)
+        cases = self.rng.poisson(self.populations / 10000 * factor)
+
+        rates = rate_per_10k(cases, self.populations)
+        levels = risk_labels(rates)
+        update_time = datetime.now().strftime("%Y-%m-%d %H:%M")
+        records = [
+            District(
+                id=i + 1, name=district, population=int(self.populations[i]), dengue_cases=int(cases[i]),
+                risk_level=levels[i], last_update=update_time, rate_per_10k=float(rates[i])
+            )
+            for i, district in enumerate(self.tainan_districts)
+        ]
+        records.sort(key=lambda record: record.dengue_cases, reverse=True)
+        return records
+
+    def write_all(self, output_dir=None, years=None):
+        """
+        產生所有資料並寫入 output_dir:
+            columnar/           欄式資料 (ovitraps 為最近一週,districts,weather)
+            history/ovitraps/   每週的誘卵器歷史資料
+            village_list.csv,ovitrap_data.json,district_data.json
+
+        Returns:
+            各項資料的筆數
+        """
+        output_dir = str(output_dir if output_dir is not None else self.config["output_dir"])
+        columnar_dir = os.path.join(output_dir, "columnar")
+        history_dir = os.path.join(output_dir, "history", "ovitraps")
+        # 重新產生時清除上一次的模擬資料,避免歷史資料重複
+        for directory in (columnar_dir, history_dir):
+            shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(output_dir, exist_ok=True)
+
+        villages = self.generate_villages()
+        with open(os.path.join(output_dir, "village_list.csv"), "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["里編號", "區里", "經度", "緯度"])
+            writer.writerows(zip(
+                range(1, len(villages["name"]) + 1), villages["name"].tolist(),
+                np.round(villages["lng"], 6).tolist(), np.round(villages["lat"], 6).tolist()
+            ))
+
+        ovitraps = self.generate_ovitraps(villages)
+        history = OvitrapHistory(history_dir)
+        readings = 0
+        latest = None
+        for columns, categories in self.iter_readings(ovitraps, years):
+            readings += history.append_columns(columns, categories)
+            latest = (columns, categories)
+        history.compact()
+
+        # 目前的誘卵器資料為最近一週的紀錄
+        columns, categories = latest
+        last_week = columns["last_check"] == columns["last_check"].max()
+        latest_columns = {name: array[last_week] for name, array in columns.items()}
+        table = write_columns("ovitraps", latest_columns, categories, columnar_dir)
+        write_json_view(table, os.path.join(output_dir, "ovitrap_data.json"))
+
+        districts = self.generate_district_records(latest_columns)
+        table = write_table("districts", districts, columnar_dir)
+        write_json_view(table, os.path.join(output_dir, "district_data.json"))
+
+        weather = Weather(
+            temperature=round(float(self.rng.uniform(25, 35)), 1),
+            humidity=int(self.rng.integers(60, 91)),
+            rainfall=round(float(self.rng.uniform(0, 50)), 1),
+            update_time=datetime.now().strftime("%Y-%m-%d %H:%M")
+        )
+        write_table("weather", [weather], columnar_dir)
+
+        return {
+            "villages": len(villages["name"]),
+            "ovitraps": len(ovitraps["ovitrap_id"]),
+            "readings": readings,
+            "districts": len(districts),
+        }
+
+
 def main():
     """主函數"""
-    generator = DengueDataGenerator()
-    data = generator.generate_all_data()
-    
-    print("\n=== 前5個高風險區域 ===")
-    for i, district in enumerate(data['districts'][:5]):
-        print(f"{i+1}. {district['name']}: {district['dengue_cases']}例 ({district['risk_level']})")
+    parser = argparse.ArgumentParser(description="產生台南市登革熱疫情模擬數據")
+    parser.add_argument("--scale", type=float, help="產生大量模擬資料 (效能測試用),1 約為實際規模")
+    parser.add_argument("--seed", type=int, help="亂數種子,相同種子產生相同資料")
+    parser.add_argument("--years", type=float, help="大量模擬資料的年數")
+    parser.add_argument("--output", help="大量模擬資料的輸出目錄")
+    args = parser.parse_args()
+
+    if args.scale is None:
+        generator = DengueDataGenerator()
+        data = generator.generate_all_data()
+
+        print("\n=== 前5個高風險區域 ===")
+        for i, district in enumerate(data['districts'][:5]):
+            print(f"{i+1}. {district.name}: {district.dengue_cases}例 ({district.risk_level})")
+        return
+
+    output_dir = args.output or str(SYNTHETIC_DATA_CONFIG["output_dir"])
+    if os.path.realpath(output_dir) == os.path.realpath(DATA_DIR):
+        parser.error("大量模擬資料不可寫入 data 目錄")
+    started = time.perf_counter()
+    generator = LargeScaleGenerator(scale=args.scale, seed=args.seed)
+    counts = generator.write_all(output_dir, args.years)
+    print(
+        f"已產生 {counts['villages']} 個村里,{counts['ovitraps']} 個誘卵器,{counts['readings']} 筆每週紀錄 "
+        f"(seed {generator.seed},{time.perf_counter() - started:.1f} 秒) -> {output_dir}"
+    )
 
 if __name__ == "__main__":
     main()
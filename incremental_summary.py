@@ -0,0 +1,243 @@
+"""
+登革熱疫情資料系統 - 行政區摘要增量更新
+以累加值維護每個行政區的村里中心點,村里數,誘卵器數與風險等級;
+村里,誘卵器或病例資料變動時只重新計算受影響的行政區,輸出的 JSON 也只重新序列化變動的部分
+
+單獨執行時由 village_list.csv,誘卵器與行政區資料重新產生 districts_summary.json:
+    python incremental_summary.py
+"""
+
+import csv
+import os
+from dataclasses import replace
+import uuid
+
+from columnar_store import write_table
+from config import DISTRICT_DATA_JSON, DISTRICTS_SUMMARY_JSON, OVITRAP_DATA_JSON, VILLAGE_LIST_CSV
+from models import from_dicts, to_arrays
+from risk_engine import rate_per_10k, risk_labels
+from serializers import dumps, read_json, validate_records
+
+# districts_summary.json 中每個行政區列出的村里數
+VILLAGE_SAMPLE_SIZE = 5
+
+
+def _dumps(value):
+    return dumps(value).decode("utf-8")
+
+
+def _atomic_write(path, content):
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def district_of_village(name):
+    """'七股區七股里' -> '七股區'"""
+    return name[:name.index("區") + 1]
+
+
+class _DistrictState:
+    """單一行政區的累加值"""
+
+    def __init__(self):
+        self.villages = {}  # 村里名稱 -> (緯度, 經度),保持加入順序
+        self.lat_sum = 0.0
+        self.lng_sum = 0.0
+        self.ovitraps = {}  # 誘卵器編號 -> 卵數
+        self.egg_sum = 0
+        self.record = None  # 行政區統計 (models.District)
+
+
+class DistrictSummaries:
+    """
+    行政區摘要的增量計算
+
+    變動先記錄為受影響的行政區,flush() 時只重新計算這些行政區,並回傳 JSON Patch (RFC 6902)
+    """
+
+    def __init__(self, sample_size=VILLAGE_SAMPLE_SIZE):
+        self.sample_size = sample_size
+        self.districts = {}
+        self.village_district = {}
+        self.ovitrap_district = {}
+        self.dirty = set()
+        self.dirty_records = set()
+        # 行政區 -> 已序列化的 JSON 片段,未變動的行政區直接沿用
+        self._summary_fragments = {}
+        self._record_fragments = {}
+
+    def _state(self, district):
+        state = self.districts.get(district)
+        if state is None:
+            state = self.districts[district] = _DistrictState()
+        return state
+
+    def upsert_village(self, name, lat, lng):
+        """新增或更新村里位置"""
+        self.remove_village(name)
+        district = district_of_village(name)
+        state = self._state(district)
+        state.villages[name] = (lat, lng)
+        state.lat_sum += lat
+        state.lng_sum += lng
+        self.village_district[name] = district
+        self.dirty.add(district)
+
+    def remove_village(self, name):
+        district = self.village_district.pop(name, None)
+        if district is None:
+            return
+        state = self.districts[district]
+        lat, lng = state.villages.pop(name)
+        state.lat_sum -= lat
+        state.lng_sum -= lng
+        self.dirty.add(district)
+
+    def upsert_ovitrap(self, record):
+        """新增或更新誘卵器紀錄 (models.Ovitrap)"""
+        self.remove_ovitrap(record.ovitrap_id)
+        district = record.district
+        state = self._state(district)
+        state.ovitraps[record.ovitrap_id] = record.egg_count
+        state.egg_sum += record.egg_count
+        self.ovitrap_district[record.ovitrap_id] = district
+        self.dirty.add(district)
+
+    def remove_ovitrap(self, ovitrap_id):
+        district = self.ovitrap_district.pop(ovitrap_id, None)
+        if district is None:
+            return
+        state = self.districts[district]
+        state.egg_sum -= state.ovitraps.pop(ovitrap_id)
+        self.dirty.add(district)
+
+    def upsert_district_record(self, record):
+        """新增或更新行政區統計 (models.District),病例率與風險等級會重新計算"""
+        state = self._state(record.name)
+        state.record = replace(record)
+        self.dirty_records.add(record.name)
+
+    def sync_ovitraps(self, records):
+        """
+        以新的誘卵器資料取代目前資料,只套用有差異的紀錄
+
+        Returns:
+            變動的誘卵器數
+        """
+        current = {record.ovitrap_id: record for record in records}
+        changed = 0
+        for ovitrap_id in set(self.ovitrap_district) - set(current):
+            self.remove_ovitrap(ovitrap_id)
+            changed += 1
+        for ovitrap_id, record in current.items():
+            district = self.ovitrap_district.get(ovitrap_id)
+            if district != record.district or self.districts[district].ovitraps[ovitrap_id] != record.egg_count:
+                self.upsert_ovitrap(record)
+                changed += 1
+        return changed
+
+    def _summary(self, state):
+        count = len(state.villages)
+        return {
+            "center_lat": state.lat_sum / count if count else None,
+            "center_lng": state.lng_sum / count if count else None,
+            "village_count": count,
+            "villages": list(state.villages)[:self.sample_size],
+            "ovitrap_count": len(state.ovitraps),
+            "egg_count_total": state.egg_sum,
+        }
+
+    def flush(self):
+        """
+        重新計算有變動的行政區
+
+        Returns:
+            {"summary": districts_summary 的 JSON Patch, "districts": 有變動的行政區統計 (models.District)}
+        """
+        patch = []
+        for district in sorted(self.dirty):
+            state = self.districts[district]
+            if not state.villages and not state.ovitraps and state.record is None:
+                del self.districts[district]
+                if self._summary_fragments.pop(district, None) is not None:
+                    patch.append({"op": "remove", "path": f"/{district}"})
+                continue
+            summary = self._summary(state)
+            op = "replace" if district in self._summary_fragments else "add"
+            self._summary_fragments[district] = _dumps(summary)
+            patch.append({"op": op, "path": f"/{district}", "value": summary})
+
+        # 病例率與風險等級一次計算所有變動的行政區
+        names = sorted(name for name in self.dirty_records if self.districts.get(name) and self.districts[name].record)
+        records = [self.districts[name].record for name in names]
+        if records:
+            arrays = to_arrays(records, ["dengue_cases", "population"])
+            rates = rate_per_10k(arrays["dengue_cases"], arrays["population"])
+            levels = risk_labels(rates)
+            for record, rate, level in zip(records, rates.tolist(), levels.tolist()):
+                record.rate_per_10k = rate
+                record.risk_level = level
+                self._record_fragments[record.name] = _dumps(record)
+
+        self.dirty.clear()
+        self.dirty_records.clear()
+        return {"summary": patch, "districts": records}
+
+    def render_summary(self):
+        """districts_summary.json 的內容,依村里清單中行政區第一次出現的順序"""
+        return "{" + ",".join(
+            f"{_dumps(district)}:{self._summary_fragments[district]}"
+            for district in self.districts if district in self._summary_fragments
+        ) + "}"
+
+    def district_records(self):
+        """所有行政區統計,依病例數由多到少排列"""
+        return sorted(
+            (state.record for state in self.districts.values() if state.record is not None),
+            key=lambda record: record.dengue_cases, reverse=True
+        )
+
+    def render_districts(self):
+        """district_data.json 的內容,依病例數由多到少排列"""
+        return "[" + ",".join(self._record_fragments[record.name] for record in self.district_records()) + "]"
+
+    def write(self, changes, summary_path=DISTRICTS_SUMMARY_JSON, districts_path=DISTRICT_DATA_JSON):
+        """
+        將 flush() 的結果寫入檔案,沒有變動的檔案不會重寫
+
+        Args:
+            changes: flush() 的回傳值
+        """
+        if changes["summary"]:
+            _atomic_write(str(summary_path), self.render_summary())
+        if changes["districts"]:
+            _atomic_write(str(districts_path), self.render_districts())
+            # 查詢 API 使用的欄式資料也一併更新
+            write_table("districts", self.district_records())
+
+    @classmethod
+    def from_files(cls, village_csv=VILLAGE_LIST_CSV, ovitrap_json=OVITRAP_DATA_JSON, district_json=DISTRICT_DATA_JSON):
+        """由現有資料檔建立完整的狀態"""
+        summaries = cls()
+        with open(village_csv, "r", encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                summaries.upsert_village(row["區里"], float(row["緯度"]), float(row["經度"]))
+        for record in from_dicts("ovitraps", validate_records(read_json(ovitrap_json), "ovitraps")):
+            summaries.upsert_ovitrap(record)
+        for record in from_dicts("districts", validate_records(read_json(district_json), "districts")):
+            summaries.upsert_district_record(record)
+        return summaries
+
+
+def main():
+    """重新產生行政區摘要與統計"""
+    summaries = DistrictSummaries.from_files()
+    changes = summaries.flush()
+    summaries.write(changes)
+    print(f"已更新 {len(changes['summary'])} 個行政區摘要: {DISTRICTS_SUMMARY_JSON}")
+
+
+if __name__ == "__main__":
+    main()
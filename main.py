@@ -1,50 +1,299 @@
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-import subprocess
-import os
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+from fastapi import FastAPI, Request, HTTPException
+from fastapi.responses import HTMLResponse, Response
 from config import (
-    FASTAPI_CONFIG, STATIC_MOUNTS, WEB_DIR, DATA_DIR, TEMPLATE_DIR,
-    PROCESS_MAP_SCRIPT, APP_NAME
+    FASTAPI_CONFIG, STATIC_MOUNTS, MAP_BUILD_CONFIG, MAP_CONFIG, DATA_SOURCES, CACHE_CONFIG,
+    SCHEDULER_CONFIG, OVITRAP_DATA_JSON, DISTRICT_DATA_JSON,
+    QUERY_API_CONFIG, STATIC_ASSETS_CONFIG, STATIC_ASSETS_DIR, METRICS_CONFIG
 )
+from map_service import MapService, etag_matches
+from boundary_tiles import BOUNDARY_MEDIA_TYPES, BoundaryStore
+from data_sync import sync_datasets
+from scheduler import PeriodicRefresher
+from query_index import TableIndex
+from spatial_index import OvitrapNearIndex
+from serializers import FastJSONResponse
+from static_assets import AssetManifest, PrecompressedStaticFiles, immutable_cache_control
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, render_metrics
+from data.process_map import (
+    DistrictSource, build_map, publish_artifacts, current_artifact_path, default_build_config
+)
+
+# 常駐的行政區資料,重建地圖時不必重新啟動直譯器與讀檔
+map_build_config = default_build_config()
+district_source = DistrictSource(
+    map_build_config["geojson_path"], map_build_config["coordinate_system"], map_build_config["geometry_cache_dir"]
+)
+boundary_store = BoundaryStore()
+
+# 查詢 API 使用的記憶體索引,欄式資料有新版本時自動重建
+ovitrap_index = TableIndex("ovitraps", OVITRAP_DATA_JSON, date_column="last_check")
+district_index = TableIndex("districts", DISTRICT_DATA_JSON)
+ovitrap_near_index = OvitrapNearIndex(ovitrap_index)
+# 含內容雜湊的靜態檔案對照表,資料檔變動時重新建置
+asset_manifest = AssetManifest(output_dir=map_build_config["assets_dir"])
+
+def update_map():
+    """在程式內呼叫 build_map() 來更新地圖,失敗時由 map_service 記錄錯誤"""
+    artifacts = build_map(map_build_config, district_source)
+    # 發佈到新的版本目錄,完成後才切換,讀取中的舊版本不受影響
+    publish_artifacts(artifacts, map_build_config)
+    boundary_store.ensure_current(district_source)
+    print("地圖更新成功！")
+
+# 地圖只在啟動時或輸入檔案變動時重建,重建在背景執行緒中進行
+map_service = MapService(
+    update_map,
+    MAP_BUILD_CONFIG["inputs"],
+    lambda: current_artifact_path("map.html", map_build_config),
+    failure_backoff=MAP_BUILD_CONFIG["failure_backoff_seconds"],
+)
+
+def load_query_indexes():
+    """
+    載入查詢 API 的索引 (尚未有欄式資料時由 JSON 匯入),誘卵器鄰近查詢的 KD-tree 與靜態檔案對照表,
+    在啟動與資料更新後於背景執行緒中執行,
+    請求不需要負擔建立索引的成本
+    """
+    for index in (ovitrap_index, district_index, ovitrap_near_index, asset_manifest):
+        try:
+            index.current()
+        except Exception as e:
+            print(f"查詢索引 {type(index).__name__} 載入失敗: {e}")
+
+async def refresh_data():
+    """同步所有資料集,再檢查查詢索引與靜態檔案對照表 (資料有新版本時才重建)"""
+    outcomes = await sync_datasets()
+    await asyncio.to_thread(load_query_indexes)
+    failed = [title for title, outcome in outcomes.items() if outcome["status"] == "failed"]
+    if failed:
+        raise RuntimeError(f"資料集更新失敗: {', '.join(failed)}")
+
+async def refresh_map():
+    """輸入檔案變動時重建地圖"""
+    job = await map_service.rebuild_async()
+    if job["status"] == "failed":
+        raise RuntimeError(job["error"])
+
+# 背景排程,使用者的請求不需要負擔更新成本
+refreshers = {
+    "data": PeriodicRefresher(
+        "data", refresh_data, DATA_SOURCES["update_interval_hours"],
+        SCHEDULER_CONFIG["jitter_fraction"], SCHEDULER_CONFIG["run_on_startup"]
+    ),
+    "map": PeriodicRefresher(
+        "map", refresh_map, CACHE_CONFIG["cache_duration_hours"],
+        SCHEDULER_CONFIG["jitter_fraction"]
+    ),
+}
+
+@asynccontextmanager
+async def lifespan(app):
+    if MAP_BUILD_CONFIG["build_on_startup"]:
+        await map_service.rebuild_async(force=True)
+    await asyncio.to_thread(load_query_indexes)
+    if SCHEDULER_CONFIG["enabled"]:
+        for refresher in refreshers.values():
+            refresher.start()
+    yield
+    for refresher in refreshers.values():
+        await refresher.stop()
+    map_service.shutdown()
 
 app = FastAPI(
     title=FASTAPI_CONFIG["title"],
     version=FASTAPI_CONFIG["version"],
-    description=FASTAPI_CONFIG["description"]
+    description=FASTAPI_CONFIG["description"],
+    lifespan=lifespan,
+    # 以 serializers.dumps() 序列化 API 回應,安裝 orjson 時較快
+    default_response_class=FastJSONResponse,
 )
 
-# 使用設定檔中的靜態檔案掛載點
-for mount_path, directory in STATIC_MOUNTS.items():
-    app.mount(mount_path, StaticFiles(directory=directory), name=mount_path[1:])
+# 記錄每個請求的處理時間 (依路由),開啟 DEBUG_CONFIG["enable_profiling"] 時支援 ?profile=1
+if METRICS_CONFIG["enabled"]:
+    app.add_middleware(MetricsMiddleware)
 
-templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+# 使用設定檔中的靜態檔案掛載點,有預先壓縮的 .gz/.br 時直接回傳,並以 ETag 重新驗證
+for mount_path, directory in STATIC_MOUNTS.items():
+    app.mount(mount_path, PrecompressedStaticFiles(directory=directory), name=mount_path[1:])
 
-def update_map():
-    """執行 process_map.py 來更新地圖"""
-    try:
-        result = subprocess.run(
-            ["python", str(PROCESS_MAP_SCRIPT)],
-            cwd=str(DATA_DIR),
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            print("地圖更新成功！")
-        else:
-            print(f"地圖更新失敗: {result.stderr}")
-    except Exception as e:
-        print(f"執行 process_map.py 時發生錯誤: {e}")
+# 含內容雜湊的靜態檔案,網址在內容變動時才改變,可長期快取
+app.mount(
+    STATIC_ASSETS_CONFIG["mount"],
+    PrecompressedStaticFiles(
+        directory=str(STATIC_ASSETS_DIR), check_dir=False, cache_control=immutable_cache_control()
+    ),
+    name="assets",
+)
 
 @app.get("/", response_class=HTMLResponse)
 async def read_map(request: Request):
-    # 每次訪問首頁時更新地圖
-    update_map()
-    return templates.TemplateResponse("map.html", {"request": request})
+    # 直接回傳快取的地圖,瀏覽器帶著相同 ETag 時回傳 304
+    html, etag = await map_service.get()
+    if html is None:
+        return HTMLResponse(content="地圖尚未產生,請稍後再試", status_code=503)
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=html, headers=headers)
 
 @app.get("/api/update-map")
-async def api_update_map():
-    """手動更新地圖的 API"""
-    update_map()
-    return {"status": "success", "message": "地圖已更新"}
\ No newline at end of file
+async def api_update_map(wait: bool = True):
+    """
+    手動更新地圖的 API
+    同時間的多個請求共用同一次重建;wait=false 時立即回傳工作編號
+    """
+    job, future = map_service.submit(force=True)
+    if not wait:
+        return FastJSONResponse(
+            status_code=202,
+            content={"status": "accepted", "message": "地圖更新中", "job_id": job["id"]}
+        )
+
+    job = await asyncio.wrap_future(future)
+    if job["status"] == "failed":
+        return FastJSONResponse(
+            status_code=500,
+            content={"status": "error", "message": f"地圖更新失敗: {job['error']}", "job_id": job["id"]}
+        )
+    return {"status": "success", "message": "地圖已更新", "job_id": job["id"]}
+
+@app.get("/api/update-map/jobs/{job_id}")
+async def api_update_map_job(job_id: str):
+    """查詢地圖更新工作的狀態"""
+    job = map_service.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="找不到此更新工作")
+    return job
+
+@app.get("/api/scheduler")
+async def api_scheduler():
+    """背景排程的狀態與最近一次執行紀錄"""
+    return {name: refresher.status() for name, refresher in refreshers.items()}
+
+@app.get("/api/scheduler/{name}/run")
+async def api_scheduler_run(name: str):
+    """立即在背景執行一次排程,上一次尚未結束時不會重複執行"""
+    refresher = refreshers.get(name)
+    if refresher is None:
+        raise HTTPException(status_code=404, detail="找不到此排程")
+    if not refresher.trigger():
+        return FastJSONResponse(status_code=409, content={"status": "running", "message": "上一次更新尚未結束"})
+    return FastJSONResponse(status_code=202, content={"status": "accepted", "message": "已開始更新"})
+
+def _split_fields(fields):
+    return [field for field in fields.split(",") if field] if fields else None
+
+def _query_page(index, **kwargs):
+    try:
+        return index.page(**kwargs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+# 查詢 API 以一般函數定義,索引查詢與版本變動時的重建在執行緒池中進行,不會阻塞事件迴圈
+@app.get("/api/ovitraps")
+def api_ovitraps(
+    district: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Optional[str] = None,
+    fields: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+):
+    """
+    查詢誘卵器資料
+
+    district,status 可用逗號指定多個值;since 為檢查日期下限 (YYYY-MM-DD);
+    fields 指定回傳欄位;下一頁以回傳的 next_cursor 查詢
+    """
+    return _query_page(
+        ovitrap_index,
+        equals={"district": district, "status": status},
+        since=since,
+        fields=_split_fields(fields),
+        limit=limit,
+        cursor=cursor,
+    )
+
+@app.get("/api/ovitraps/near")
+def api_ovitraps_near(
+    lat: float,
+    lng: float,
+    radius: Optional[float] = None,
+    k: Optional[int] = None,
+    fields: Optional[str] = None,
+):
+    """
+    查詢某個地點附近的誘卵器,依距離由近到遠排列
+
+    radius 為半徑 (公尺),k 為最多回傳的數量;兩者都指定時回傳半徑內最近的 k 個
+    """
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        raise HTTPException(status_code=400, detail="lat,lng 超出經緯度範圍")
+    if radius is not None and not 0 < radius <= QUERY_API_CONFIG["near_max_radius_m"]:
+        raise HTTPException(status_code=400, detail=f"radius 必須介於 0 到 {QUERY_API_CONFIG['near_max_radius_m']} 公尺")
+    if k is not None and not 0 < k <= QUERY_API_CONFIG["near_max_k"]:
+        raise HTTPException(status_code=400, detail=f"k 必須介於 1 到 {QUERY_API_CONFIG['near_max_k']}")
+    if k is None and radius is None:
+        k = QUERY_API_CONFIG["near_default_k"]
+
+    # 與其他查詢 API 相同在執行緒池中執行,版本變動時的索引重建不會阻塞事件迴圈;
+    # pyproj 的 Transformer 在每個執行緒第一次使用時需要初始化 (約 50 毫秒),只發生一次
+    try:
+        items = ovitrap_near_index.near(lat, lng, k=k, radius=radius, fields=_split_fields(fields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "count": len(items)}
+
+@app.get("/api/districts")
+def api_districts(
+    risk_level: Optional[str] = None,
+    fields: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+):
+    """查詢行政區統計,risk_level 可用逗號指定多個值"""
+    return _query_page(
+        district_index,
+        equals={"risk_level": risk_level},
+        fields=_split_fields(fields),
+        limit=limit,
+        cursor=cursor,
+    )
+
+@app.get("/api/boundaries")
+async def api_boundaries(request: Request, zoom: float = MAP_CONFIG["zoom_start"], format: str = "geojson"):
+    """依縮放等級回傳預先簡化的行政區邊界 (GeoJSON 或量化的 TopoJSON),依 Accept-Encoding 回傳預先壓縮的版本"""
+    if format not in BOUNDARY_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"不支援的格式: {format}")
+    await map_service.get()
+    result = boundary_store.get(zoom, format, request.headers.get("accept-encoding"))
+    if result is None:
+        raise HTTPException(status_code=503, detail="行政區邊界尚未產生")
+
+    level, body, etag, encoding = result
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+        "X-Boundary-Level": str(level),
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=BOUNDARY_MEDIA_TYPES[format], headers=headers)
+
+@app.get("/api/assets")
+def api_assets():
+    """原始網址與含內容雜湊網址的對照表,資料檔可改用對照後的網址長期快取;資料檔變動時先重新建置"""
+    return FastJSONResponse(content=asset_manifest.current(), headers={"Cache-Control": "no-cache"})
+
+if METRICS_CONFIG["enabled"]:
+    @app.get(METRICS_CONFIG["path"], include_in_schema=False)
+    async def api_metrics():
+        """請求延遲與地圖建置各階段耗時 (Prometheus 文字格式)"""
+        return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
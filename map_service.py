@@ -0,0 +1,221 @@
+"""
+登革熱疫情資料系統 - 地圖產物快取服務
+地圖只在啟動時或輸入檔案變動時重新產生,首頁直接回傳記憶體中的 HTML
+重建在背景執行緒中進行,同時間多個重建請求只會觸發一次建置
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+def etag_matches(if_none_match, etag):
+    """
+    判斷請求的 If-None-Match 標頭是否符合目前的 ETag
+
+    Args:
+        if_none_match: 請求中的 If-None-Match 標頭值
+        etag: 目前內容的 ETag
+
+    Returns:
+        是否可以回傳 304
+    """
+    if not if_none_match or not etag:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class MapService:
+    """管理 map.html 的建置,記憶體快取與背景重建工作"""
+
+    def __init__(self, builder, inputs, output_path, max_jobs=20, failure_backoff=60):
+        """
+        Args:
+            builder: 實際產生地圖的函數,失敗時應拋出例外
+            inputs: 影響地圖內容的輸入檔案
+            output_path: 產生出的 map.html 路徑,或回傳目前版本路徑的函數
+            max_jobs: 保留供查詢的重建工作數量
+            failure_backoff: 建置失敗後,相同輸入在這段時間 (秒) 內不會因請求而再次重建
+        """
+        self.builder = builder
+        self.inputs = [str(path) for path in inputs]
+        self.output_path = output_path
+        self.max_jobs = max_jobs
+        self.failure_backoff = failure_backoff
+        self.jobs = OrderedDict()
+        # (signature, html, etag) 整組替換,避免讀到不一致的內容
+        self._cached = None
+        # 最近一次建置失敗的 (signature, 可再次嘗試的時間)
+        self._failure = None
+        self._running = None
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def input_signature(self):
+        """以輸入檔案的路徑,修改時間與大小計算簽章"""
+        parts = []
+        for path in self.inputs:
+            try:
+                stat = os.stat(path)
+                parts.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+            except FileNotFoundError:
+                parts.append(f"{path}:missing")
+        return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+    def current_output_path(self):
+        """目前應讀取的 map.html 路徑"""
+        if callable(self.output_path):
+            return str(self.output_path())
+        return str(self.output_path)
+
+    def is_stale(self):
+        """
+        快取是否需要重建
+
+        相同的輸入剛建置失敗時,在退避時間內視為不需要重建,
+        避免沒有地圖可用時每個請求都觸發一次注定失敗的建置
+        """
+        cached = self._cached
+        signature = self.input_signature()
+        if cached is not None and signature == cached[0]:
+            return False
+        failure = self._failure
+        if failure is not None and failure[0] == signature and time.monotonic() < failure[1]:
+            return False
+        return True
+
+    def rebuild(self, force=False):
+        """
+        重新產生地圖並載入快取 (同步執行,會阻塞呼叫端)
+
+        Args:
+            force: 即使輸入檔案沒有變動也強制重建
+
+        Returns:
+            是否真的執行了重建
+        """
+        signature = self.input_signature()
+        cached = self._cached
+        if not force and cached is not None and signature == cached[0]:
+            return False
+
+        try:
+            self.builder()
+        except Exception:
+            self._failure = (signature, time.monotonic() + self.failure_backoff)
+            # 建置失敗時仍載入現有的 HTML,維持網站可用;簽章維持舊的 (沒有快取時為 None),
+            # 這組輸入仍視為需要重建,何時重試由退避時間決定
+            if os.path.exists(self.current_output_path()):
+                self._load(cached[0] if cached is not None else None)
+            raise
+        self._failure = None
+        if os.path.exists(self.current_output_path()):
+            self._load(signature)
+        return True
+
+    def _load(self, signature):
+        """讀取產生好的 HTML 並計算 ETag"""
+        with open(self.current_output_path(), "r", encoding="utf-8") as f:
+            html = f.read()
+
+        etag = '"' + hashlib.sha256(html.encode("utf-8")).hexdigest()[:32] + '"'
+        self._cached = (signature, html, etag)
+
+    def submit(self, force=False):
+        """
+        提交背景重建工作,已有工作在執行時直接共用該工作
+
+        進行中的工作不是強制重建時,它可能在輸入變動前就已讀取簽章,
+        因此強制重建不共用它,而是在其後排入一次強制重建,之後的強制重建請求共用這個工作
+
+        Args:
+            force: 即使輸入檔案沒有變動也強制重建
+
+        Returns:
+            (job, future),job 為可查詢狀態的字典
+        """
+        with self._lock:
+            running = self._running
+            if running is not None and not running[1].done() and (not force or running[0]["force"]):
+                return running
+
+            # 執行緒池只有一個工作執行緒,排入的工作會在進行中的工作結束後才開始
+            job = {
+                "id": uuid.uuid4().hex,
+                "status": "pending",
+                "force": force,
+                "rebuilt": False,
+                "error": None,
+                "submitted_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+            }
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="map-build")
+            future = self._executor.submit(self._run_job, job, force)
+            self._running = (job, future)
+
+            self.jobs[job["id"]] = job
+            while len(self.jobs) > self.max_jobs:
+                self.jobs.popitem(last=False)
+            return self._running
+
+    def _run_job(self, job, force):
+        """在背景執行緒中執行重建並記錄結果"""
+        job["status"] = "running"
+        job["started_at"] = time.time()
+        try:
+            job["rebuilt"] = self.rebuild(force)
+            job["status"] = "success"
+        except Exception as e:
+            job["status"] = "failed"
+            job["error"] = str(e)
+            print(f"地圖更新失敗: {e}")
+        finally:
+            job["finished_at"] = time.time()
+        return job
+
+    async def rebuild_async(self, force=False):
+        """提交重建工作並等待完成,不會阻塞事件迴圈"""
+        job, future = self.submit(force)
+        return await asyncio.wrap_future(future)
+
+    async def get(self):
+        """
+        取得目前的 HTML 與 ETag,輸入檔案變動時才會先重建
+
+        Returns:
+            (html, etag),尚未產生過地圖 (或建置失敗) 時皆為 None
+        """
+        if self.is_stale():
+            await self.rebuild_async()
+
+        cached = self._cached
+        if cached is None:
+            return None, None
+        return cached[1], cached[2]
+
+    def get_job(self, job_id):
+        """查詢重建工作狀態"""
+        return self.jobs.get(job_id)
+
+    def shutdown(self):
+        """停止背景執行緒,之後提交的工作會建立新的執行緒"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
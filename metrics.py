@@ -0,0 +1,270 @@
+"""
+登革熱疫情資料系統 - 效能監控
+請求延遲 (依路由) 與地圖建置各階段 (讀檔、座標轉換、形心、folium 產生 HTML、寫檔) 的耗時直方圖,
+由 /metrics 端點以 Prometheus 文字格式輸出
+
+DEBUG_CONFIG["enable_profiling"] 開啟時,帶有 ?profile=1 的請求會以 pyinstrument (有安裝時) 或 cProfile 分析,
+結果存於 PROFILE_DIR,檔名由回應的 X-Profile 標頭提供
+"""
+
+import cProfile
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from urllib.parse import parse_qs
+
+from config import DEBUG_CONFIG, METRICS_CONFIG, PROFILE_DIR
+
+try:
+    from pyinstrument import Profiler
+except ImportError:  # pyinstrument 為選用套件,沒有安裝時使用 cProfile
+    Profiler = None
+
+# Prometheus 文字格式的 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _format_labels(pairs):
+    if not pairs:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in pairs
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+class Histogram:
+    """
+    依標籤分組的累積直方圖 (Prometheus histogram)
+
+    每組標籤保存各區間的次數,總和與總次數;observe() 可以在多個執行緒中同時呼叫
+    """
+
+    def __init__(self, name, documentation, labelnames=(), buckets=None):
+        """
+        Args:
+            name: 指標名稱
+            documentation: 說明 (# HELP)
+            labelnames: 標籤名稱
+            buckets: 區間上限 (秒),會自動加上 +Inf
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets or METRICS_CONFIG["latency_buckets"])) + (float("inf"),)
+        self._lock = threading.Lock()
+        # 標籤值 -> [各區間次數 (非累積), 總和, 總次數]
+        self._series = {}
+
+    def observe(self, value, **labels):
+        """記錄一次觀測值"""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = next(i for i, bound in enumerate(self.buckets) if value <= bound)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def snapshot(self):
+        """
+        目前的統計值
+
+        Returns:
+            {標籤值: {"buckets": [(上限, 累積次數)], "sum": 總和, "count": 總次數}}
+        """
+        with self._lock:
+            series = {key: (list(counts), total, count) for key, (counts, total, count) in self._series.items()}
+        result = {}
+        for key, (counts, total, count) in series.items():
+            cumulative, running = [], 0
+            for bound, n in zip(self.buckets, counts):
+                running += n
+                cumulative.append((bound, running))
+            result[key] = {"buckets": cumulative, "sum": total, "count": count}
+        return result
+
+    def render(self):
+        """Prometheus 文字格式"""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for key, data in sorted(self.snapshot().items()):
+            pairs = list(zip(self.labelnames, key))
+            for bound, count in data["buckets"]:
+                lines.append(f"{self.name}_bucket{_format_labels(pairs + [('le', _format_value(bound))])} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(pairs)} {_format_value(data['sum'])}")
+            lines.append(f"{self.name}_count{_format_labels(pairs)} {data['count']}")
+        return "\n".join(lines)
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+
+REQUEST_LATENCY = Histogram(
+    "dengue_http_request_duration_seconds", "HTTP 請求處理時間 (秒),依路由",
+    ("method", "route", "status"), METRICS_CONFIG["latency_buckets"],
+)
+STAGE_DURATION = Histogram(
+    "dengue_map_build_stage_seconds", "地圖建置各階段耗時 (秒)",
+    ("stage",), METRICS_CONFIG["stage_buckets"],
+)
+
+# /metrics 輸出的所有指標
+REGISTRY = [REQUEST_LATENCY, STAGE_DURATION]
+
+# 每個階段最近一次的耗時 (秒),單獨執行 process_map.py 時印出
+last_stage_seconds = {}
+
+
+@contextmanager
+def stage(name):
+    """
+    計時地圖建置的一個階段
+
+        with stage("read"):
+            gdf = gpd.read_file(path)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        last_stage_seconds[name] = elapsed
+        STAGE_DURATION.observe(elapsed, stage=name)
+
+
+def render_metrics(registry=None):
+    """所有指標的 Prometheus 文字格式"""
+    return "\n".join(metric.render() for metric in (registry if registry is not None else REGISTRY)) + "\n"
+
+
+def route_label(scope, root_path=""):
+    """
+    請求對應的路由樣板,例如 '/api/update-map/jobs/{job_id}'
+    路徑參數不展開,避免每個不同的網址各產生一組時間序列;
+    靜態檔案以掛載點表示 (例如 '/template'),沒有對應路由時為 'unmatched'
+
+    Args:
+        scope: 處理完畢後的 ASGI scope
+        root_path: 進入路由前的 root_path,用來判斷請求是否交給了掛載的應用程式
+    """
+    path = getattr(scope.get("route"), "path", None)
+    if path:
+        return path
+    # 掛載的應用程式不會留下 route,但 root_path 會加上掛載點
+    mount_path = scope.get("root_path", "")[len(root_path):]
+    return mount_path or "unmatched"
+
+
+def _profile_requested(scope, config):
+    values = parse_qs(scope.get("query_string", b"").decode("latin-1")).get(config["profile_param"])
+    return bool(values) and values[-1] not in ("", "0", "false")
+
+
+def prune_profiles(profile_dir, keep):
+    """只保留最新的 keep 份效能分析結果"""
+    try:
+        entries = sorted(entry.name for entry in os.scandir(profile_dir) if entry.is_file())
+    except FileNotFoundError:
+        return
+    for name in entries[:-keep] if keep > 0 else entries:
+        try:
+            os.remove(os.path.join(profile_dir, name))
+        except FileNotFoundError:
+            pass
+
+
+class _RequestProfiler:
+    """單一請求的效能分析,有 pyinstrument 時輸出 HTML,否則輸出 cProfile 的 .prof (以 pstats 或 snakeviz 檢視)"""
+
+    def __init__(self, scope, profile_dir):
+        slug = scope["path"].strip("/").replace("/", "_") or "index"
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        suffix = ".html" if Profiler is not None else ".prof"
+        self.name = f"{stamp}-{uuid.uuid4().hex[:6]}-{slug}{suffix}"
+        self.path = os.path.join(str(profile_dir), self.name)
+        self._profiler = Profiler(async_mode="enabled") if Profiler is not None else cProfile.Profile()
+
+    def start(self):
+        if Profiler is not None:
+            self._profiler.start()
+        else:
+            # cProfile 分析的是整個執行緒,同時間在事件迴圈中執行的其他請求也會被計入
+            self._profiler.enable()
+
+    def stop(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if Profiler is not None:
+            self._profiler.stop()
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(self._profiler.output_html())
+        else:
+            self._profiler.disable()
+            self._profiler.dump_stats(self.path)
+
+
+class MetricsMiddleware:
+    """
+    記錄每個 HTTP 請求的處理時間 (ASGI middleware)
+
+    處理時間從收到請求到回應本文送出完畢為止,依方法,路由樣板與狀態碼分組;
+    開啟效能分析時,帶有 ?profile=1 的請求另外輸出分析結果
+    """
+
+    def __init__(self, app, config=None, profiling=None, profile_dir=PROFILE_DIR):
+        """
+        Args:
+            app: 下一層 ASGI 應用程式
+            config: 設定,預設為 METRICS_CONFIG
+            profiling: 是否允許效能分析,預設為 DEBUG_CONFIG["enable_profiling"]
+            profile_dir: 分析結果目錄
+        """
+        self.app = app
+        self.config = config if config is not None else METRICS_CONFIG
+        self.profiling = DEBUG_CONFIG["enable_profiling"] if profiling is None else profiling
+        self.profile_dir = profile_dir
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profiler = None
+        if self.profiling and _profile_requested(scope, self.config):
+            profiler = _RequestProfiler(scope, self.profile_dir)
+
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if profiler is not None:
+                    message = dict(message, headers=list(message.get("headers", [])) + [
+                        (b"x-profile", profiler.name.encode("latin-1"))
+                    ])
+            await send(message)
+
+        root_path = scope.get("root_path", "")
+        started = time.perf_counter()
+        if profiler is not None:
+            profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            if profiler is not None:
+                profiler.stop()
+                prune_profiles(str(self.profile_dir), self.config["profile_keep"])
+            REQUEST_LATENCY.observe(elapsed, method=scope["method"], route=route_label(scope, root_path), status=status)
@@ -0,0 +1,180 @@
+"""
+登革熱疫情資料系統 - 資料紀錄型別
+行政區,誘卵器與天氣紀錄的 slotted dataclass,每筆紀錄不需要一個 dict,記憶體用量較小;
+屬性名稱與 columnar_store.TABLE_SCHEMAS 的欄位名稱相同,可以直接轉成欄式資料 (NumPy 陣列)
+
+JSON 的格式不變:to_dict() 輸出與原本相同的結構 (誘卵器的 location 巢狀物件,行政區的 value 欄位)
+"""
+
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+
+@dataclass(slots=True)
+class District:
+    """行政區統計"""
+
+    id: int
+    name: str
+    population: int
+    dengue_cases: int
+    risk_level: str
+    last_update: str
+    rate_per_10k: float
+
+    @property
+    def value(self):
+        """地圖著色使用的數值,與 dengue_cases 相同"""
+        return self.dengue_cases
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "population": self.population,
+            "dengue_cases": self.dengue_cases,
+            "risk_level": self.risk_level,
+            "last_update": self.last_update,
+            "value": self.dengue_cases,
+            "rate_per_10k": self.rate_per_10k,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """由 district_data.json 的紀錄建立,value 由 dengue_cases 衍生因此不讀取"""
+        return cls(
+            data["id"], data["name"], data["population"], data["dengue_cases"],
+            data["risk_level"], data["last_update"], data["rate_per_10k"],
+        )
+
+
+@dataclass(slots=True)
+class Ovitrap:
+    """誘卵器紀錄,位置攤平為 lat/lng 兩個屬性"""
+
+    district: str
+    ovitrap_id: str
+    egg_count: int
+    lat: float
+    lng: float
+    status: str
+    last_check: str
+
+    def to_dict(self):
+        return {
+            "district": self.district,
+            "ovitrap_id": self.ovitrap_id,
+            "egg_count": self.egg_count,
+            "location": {"lat": self.lat, "lng": self.lng},
+            "status": self.status,
+            "last_check": self.last_check,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """由 ovitrap_data.json 的紀錄建立"""
+        location = data["location"]
+        return cls(
+            data["district"], data["ovitrap_id"], data["egg_count"],
+            location["lat"], location["lng"], data["status"], data["last_check"],
+        )
+
+
+@dataclass(slots=True)
+class Weather:
+    """天氣資料"""
+
+    temperature: float
+    humidity: int
+    rainfall: float
+    update_time: str
+
+    def to_dict(self):
+        return {
+            "temperature": self.temperature,
+            "humidity": self.humidity,
+            "rainfall": self.rainfall,
+            "update_time": self.update_time,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["temperature"], data["humidity"], data["rainfall"], data["update_time"])
+
+
+# 資料表名稱 (與 columnar_store.TABLE_SCHEMAS 相同) -> 紀錄型別
+MODELS = {
+    "districts": District,
+    "ovitraps": Ovitrap,
+    "weather": Weather,
+}
+
+# 屬性型別 -> NumPy 型別,字串欄位使用 object 陣列
+_DTYPES = {int: np.int64, float: np.float64, str: object}
+
+
+def from_dicts(table, records):
+    """
+    將 JSON 紀錄轉成紀錄型別
+
+    Args:
+        table: MODELS 中的資料表名稱
+        records: dict 清單
+    """
+    from_dict = MODELS[table].from_dict
+    return [from_dict(record) for record in records]
+
+
+def to_dicts(records):
+    """將紀錄型別轉回 JSON 結構的 dict 清單"""
+    return [record.to_dict() for record in records]
+
+
+def to_arrays(records, names=None, model=None):
+    """
+    紀錄清單 (array of structs) 轉成欄位陣列 (struct of arrays)
+
+    Args:
+        records: 同一型別的紀錄清單
+        names: 要轉換的屬性,None 表示全部欄位
+        model: 紀錄型別,records 可能為空時需要指定
+
+    Returns:
+        {屬性: ndarray},數值欄位為 int64/float64,字串欄位為 object
+    """
+    if model is None:
+        if not records:
+            raise ValueError("records 為空時需要指定 model")
+        model = type(records[0])
+    types = {field.name: field.type for field in fields(model)}
+    if names is None:
+        names = list(types)
+
+    arrays = {}
+    for name in names:
+        # value 等衍生屬性沒有宣告型別,依第一筆資料判斷
+        kind = types.get(name) or (type(getattr(records[0], name)) if records else object)
+        dtype = _DTYPES.get(kind, object)
+        if dtype is object:
+            array = np.empty(len(records), dtype=object)
+            array[:] = [getattr(record, name) for record in records]
+        else:
+            array = np.fromiter((getattr(record, name) for record in records), dtype=dtype, count=len(records))
+        arrays[name] = array
+    return arrays
+
+
+def from_arrays(model, arrays):
+    """
+    欄位陣列 (struct of arrays) 轉回紀錄清單 (array of structs)
+
+    Args:
+        model: 紀錄型別
+        arrays: {屬性: ndarray 或 list},需包含所有欄位
+    """
+    columns = [
+        arrays[field.name].tolist() if isinstance(arrays[field.name], np.ndarray) else arrays[field.name]
+        for field in fields(model)
+    ]
+    return [model(*row) for row in zip(*columns)]
@@ -0,0 +1,303 @@
+"""
+登革熱疫情資料系統 - 誘卵器歷史資料
+每次產生或更新的誘卵器資料都附加到歷史資料中,不會覆蓋之前的紀錄,可以計算卵數趨勢
+
+資料依 last_check 的月份分區,每個分區是 OVITRAP_HISTORY_DIR/<YYYY-MM>/ 下的一組欄式資料片段:
+    MANIFEST.json           目前有效的片段 (以 os.replace 原子性地更新)
+    seg-<時間>-<編號>/       附加時寫入的片段
+    compact-<時間>-<編號>/   合併後的片段,依行政區與日期排序並附上行政區索引
+同一個誘卵器同一天的紀錄 (ovitrap_id, last_check) 以最後附加的為準
+"""
+
+import os
+import shutil
+import threading
+import time
+import uuid
+from datetime import date
+
+import numpy as np
+
+from columnar_store import ColumnTable, TABLE_SCHEMAS, concat_tables, load_columns, records_to_columns, save_columns
+from config import OVITRAP_HISTORY_CONFIG, OVITRAP_HISTORY_DIR
+from serializers import read_json, write_json
+
+SCHEMA = TABLE_SCHEMAS["ovitraps"]
+
+
+def _to_day(value):
+    """'2025-09-20',date 或 datetime64 -> datetime64[D]"""
+    if value is None:
+        return None
+    return np.datetime64(value, "D")
+
+
+def _partition_of(day):
+    return str(np.datetime64(day, "M"))
+
+
+def _segment_name(prefix):
+    return f"{prefix}-{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
+
+
+def _dedupe(table):
+    """相同 (ovitrap_id, last_check) 只保留最後一筆"""
+    if len(table) == 0:
+        return table
+    keys = np.char.add(np.asarray(table.columns["ovitrap_id"]), np.asarray(table.columns["last_check"]).astype(str))
+    # 反轉後 np.unique 取到的第一筆即為最後附加的紀錄
+    _, reversed_index = np.unique(keys[::-1], return_index=True)
+    keep = np.sort(len(keys) - 1 - reversed_index)
+    if len(keep) == len(keys):
+        return table
+    return _take(table, keep)
+
+
+def _take(table, rows):
+    columns = {name: np.asarray(array)[rows] for name, array in table.columns.items()}
+    return ColumnTable(table.name, columns, table.categories, table.schema)
+
+
+class OvitrapHistory:
+    """附加式的誘卵器歷史資料,支援依行政區與日期範圍查詢"""
+
+    def __init__(self, base_dir=OVITRAP_HISTORY_DIR, config=None):
+        """
+        Args:
+            base_dir: 歷史資料目錄
+            config: 設定,預設為 OVITRAP_HISTORY_CONFIG
+        """
+        self.base_dir = str(base_dir)
+        self.config = config if config is not None else OVITRAP_HISTORY_CONFIG
+        self._lock = threading.Lock()
+
+    def _partition_dir(self, partition):
+        return os.path.join(self.base_dir, partition)
+
+    def partitions(self):
+        """所有分區 (YYYY-MM),由舊到新"""
+        try:
+            entries = os.listdir(self.base_dir)
+        except FileNotFoundError:
+            return []
+        return sorted(entry for entry in entries if not entry.startswith(".") and len(entry) == 7)
+
+    def _read_manifest(self, partition):
+        try:
+            return read_json(os.path.join(self._partition_dir(partition), "MANIFEST.json"))
+        except FileNotFoundError:
+            return {"segments": []}
+
+    def _write_manifest(self, partition, manifest):
+        write_json(os.path.join(self._partition_dir(partition), "MANIFEST.json"), manifest)
+
+    def append(self, records):
+        """
+        附加一批誘卵器紀錄
+
+        Args:
+            records: dict 清單或 models.Ovitrap 清單
+
+        Returns:
+            附加的筆數
+        """
+        if not records:
+            return 0
+        return self.append_columns(*records_to_columns(records, SCHEMA))
+
+    def append_columns(self, columns, categories):
+        """
+        附加已是欄式的誘卵器紀錄,大量資料不需要先建立逐筆紀錄
+
+        Args:
+            columns: {欄位: ndarray},格式與 records_to_columns() 的輸出相同
+            categories: {欄位: [類別]}
+
+        Returns:
+            附加的筆數
+        """
+        count = len(columns["last_check"])
+        if not count:
+            return 0
+
+        partitions = np.datetime_as_string(columns["last_check"].astype("datetime64[M]"), unit="M")
+
+        with self._lock:
+            for partition in np.unique(partitions).tolist():
+                rows = np.flatnonzero(partitions == partition)
+                segment = _segment_name("seg")
+                save_columns(
+                    os.path.join(self._partition_dir(partition), segment),
+                    {name: array[rows] for name, array in columns.items()},
+                    categories,
+                    SCHEMA,
+                )
+                manifest = self._read_manifest(partition)
+                manifest["segments"].append(segment)
+                self._write_manifest(partition, manifest)
+
+                if len(manifest["segments"]) > self.config["compact_after_segments"]:
+                    self._compact_partition(partition)
+        return count
+
+    def compact(self, partition=None):
+        """
+        合併分區中的片段:去除重複紀錄,依行政區與日期排序並建立行政區索引
+
+        Args:
+            partition: 分區 (YYYY-MM),None 表示全部分區
+        """
+        with self._lock:
+            for name in [partition] if partition is not None else self.partitions():
+                self._compact_partition(name)
+
+    def _compact_partition(self, partition):
+        manifest = self._read_manifest(partition)
+        segments = manifest["segments"]
+        if not segments or (len(segments) == 1 and segments[0].startswith("compact-")):
+            return
+
+        table = _dedupe(concat_tables([self._load_segment(partition, segment)[0] for segment in segments]))
+
+        # 依行政區名稱,日期排序,相同行政區的紀錄是連續的一段
+        district_labels = np.asarray(table.categories["district"], dtype=object)
+        order = np.lexsort((np.asarray(table.columns["last_check"]), district_labels[table.columns["district"]]))
+        table = _take(table, order)
+
+        codes = np.asarray(table.columns["district"])
+        boundaries = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.concatenate(([0], boundaries)).tolist() if len(codes) else []
+        stops = np.concatenate((boundaries, [len(codes)])).tolist() if len(codes) else []
+        index = {table.categories["district"][codes[start]]: [start, stop] for start, stop in zip(starts, stops)}
+
+        segment = _segment_name("compact")
+        save_columns(
+            os.path.join(self._partition_dir(partition), segment),
+            table.columns, table.categories, SCHEMA, {"district_index": index}
+        )
+        self._write_manifest(partition, {"segments": [segment]})
+
+        # 已 mmap 的舊片段在關閉前仍可讀取
+        for old in segments:
+            shutil.rmtree(os.path.join(self._partition_dir(partition), old), ignore_errors=True)
+
+    def _load_segment(self, partition, segment):
+        return load_columns(os.path.join(self._partition_dir(partition), segment), "ovitraps")
+
+    def query(self, district=None, start=None, end=None, ovitrap_id=None):
+        """
+        查詢歷史紀錄
+
+        Args:
+            district: 行政區名稱
+            start: 起始日期 (含)
+            end: 結束日期 (含)
+            ovitrap_id: 誘卵器編號
+
+        Returns:
+            ColumnTable,依分區由舊到新排列
+        """
+        start, end = _to_day(start), _to_day(end)
+        parts = []
+        for partition in self.partitions():
+            if start is not None and partition < _partition_of(start):
+                continue
+            if end is not None and partition > _partition_of(end):
+                continue
+
+            segments = self._read_manifest(partition)["segments"]
+            tables = []
+            for segment in segments:
+                try:
+                    table, meta = self._load_segment(partition, segment)
+                except FileNotFoundError:
+                    # 讀取期間片段被合併,改讀新的 MANIFEST
+                    return self.query(district, start, end, ovitrap_id)
+                tables.append(self._filter_segment(table, meta, district, start, end, ovitrap_id))
+
+            table = concat_tables(tables) if tables else None
+            if table is not None and len(segments) > 1:
+                table = _dedupe(table)
+            if table is not None and len(table):
+                parts.append(table)
+
+        if not parts:
+            columns, categories = records_to_columns([], SCHEMA)
+            return ColumnTable("ovitraps", columns, categories, SCHEMA)
+        return concat_tables(parts)
+
+    def _filter_segment(self, table, meta, district, start, end, ovitrap_id):
+        index = meta.get("district_index")
+        if district is not None and index is not None:
+            # 合併過的片段:行政區是連續的一段且依日期排序,以二分搜尋找出日期範圍
+            low, high = index.get(district, (0, 0))
+            days = table.columns["last_check"][low:high]
+            if start is not None:
+                low += int(np.searchsorted(days, start, side="left"))
+            if end is not None:
+                high = low + int(np.searchsorted(table.columns["last_check"][low:high], end, side="right"))
+            table = _take(table, slice(low, high))
+            mask = None
+        else:
+            mask = np.ones(len(table), dtype=bool)
+            if district is not None:
+                labels = table.categories["district"]
+                code = labels.index(district) if district in labels else -1
+                mask &= np.asarray(table.columns["district"]) == code
+            if start is not None:
+                mask &= np.asarray(table.columns["last_check"]) >= start
+            if end is not None:
+                mask &= np.asarray(table.columns["last_check"]) <= end
+
+        if ovitrap_id is not None:
+            id_mask = np.asarray(table.columns["ovitrap_id"]) == ovitrap_id
+            mask = id_mask if mask is None else mask & id_mask
+        return table if mask is None else _take(table, np.flatnonzero(mask))
+
+    def weekly_egg_counts(self, district, weeks=8, end=None):
+        """
+        行政區最近幾週的卵數統計
+
+        Args:
+            district: 行政區名稱
+            weeks: 週數
+            end: 最後一天,預設為今天
+
+        Returns:
+            [{"week_start": 週一日期, "total": 總卵數, "mean": 平均卵數, "samples": 紀錄數}],由舊到新
+        """
+        end = _to_day(end or date.today())
+        # 對齊到週一 (1970-01-01 是週四)
+        last_week = end - ((end.astype(np.int64) + 3) % 7)
+        first_week = last_week - np.timedelta64(7 * (weeks - 1), "D")
+
+        table = self.query(district=district, start=first_week, end=end)
+        days = np.asarray(table.columns["last_check"])
+        counts = np.asarray(table.columns["egg_count"])
+        week_index = ((days - first_week) // np.timedelta64(7, "D")).astype(np.int64)
+
+        totals = np.bincount(week_index, weights=counts, minlength=weeks)[:weeks]
+        samples = np.bincount(week_index, minlength=weeks)[:weeks]
+        return [
+            {
+                "week_start": str(first_week + np.timedelta64(7 * i, "D")),
+                "total": int(totals[i]),
+                "mean": round(float(totals[i] / samples[i]), 2) if samples[i] else None,
+                "samples": int(samples[i]),
+            }
+            for i in range(weeks)
+        ]
+
+
+def main():
+    """將目前的誘卵器資料附加到歷史資料並合併所有分區"""
+    from config import OVITRAP_DATA_JSON
+
+    history = OvitrapHistory()
+    count = history.append(read_json(OVITRAP_DATA_JSON))
+    history.compact()
+    print(f"已附加 {count} 筆誘卵器紀錄,分區: {', '.join(history.partitions())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+登革熱疫情資料系統 - 資料查詢索引
+將欄式資料表載入記憶體並為類別欄位與日期建立索引,API 只回傳符合條件的列與需要的欄位,
+回應大小不會隨資料量增加
+"""
+
+import base64
+import json
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from columnar_store import current_version, import_json, load_table
+from config import QUERY_API_CONFIG
+
+
+class CursorError(ValueError):
+    """分頁游標無效或資料已更新"""
+
+
+def encode_cursor(version, offset):
+    payload = json.dumps({"v": version, "o": offset}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor, version):
+    """
+    解析分頁游標
+
+    Returns:
+        下一頁的起始位置
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        offset = int(payload["o"])
+    except (ValueError, KeyError, TypeError):
+        raise CursorError("分頁游標格式錯誤")
+    if payload.get("v") != version:
+        raise CursorError("資料已更新,請重新查詢")
+    return offset
+
+
+@dataclass(frozen=True, slots=True)
+class IndexSnapshot:
+    """某個版本的資料表與它的索引,整組替換,查詢途中不會混用不同版本"""
+
+    table: object
+    category_rows: dict
+    date_order: object = None
+    sorted_dates: object = None
+
+
+class TableIndex:
+    """
+    單一欄式資料表的記憶體索引,資料表有新版本時自動重新載入
+
+    - 類別欄位:每個類別對應的列號 (已排序)
+    - 日期欄位:依日期排序的列號,以二分搜尋找出某日期之後的列
+    """
+
+    def __init__(self, name, json_path, date_column=None):
+        """
+        Args:
+            name: 欄式資料表名稱
+            json_path: 尚未建立欄式資料表時匯入的 JSON 檔
+            date_column: 支援 since 條件的日期欄位
+        """
+        self.name = name
+        self.json_path = json_path
+        self.date_column = date_column
+        self._lock = threading.Lock()
+        self._snapshot = None
+
+    def snapshot(self):
+        """取得目前版本的資料表與索引 (IndexSnapshot),版本變動時重建索引"""
+        version = current_version(self.name)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.table.version == version:
+            return snapshot
+
+        with self._lock:
+            version = current_version(self.name)
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.table.version != version:
+                if version is None:
+                    # 尚未產生欄式資料時由 JSON 匯入
+                    import_json(self.name, self.json_path)
+                snapshot = self._build(load_table(self.name))
+                self._snapshot = snapshot
+        return snapshot
+
+    def current(self):
+        """取得目前版本的資料表,版本變動時重建索引"""
+        return self.snapshot().table
+
+    def _build(self, table):
+        category_rows = {}
+        for column, labels in table.categories.items():
+            codes = np.asarray(table.columns[column])
+            # 一次排序後依代碼切段,不需要對每個類別各掃描一次
+            order = np.argsort(codes, kind="stable")
+            bounds = np.searchsorted(codes[order], np.arange(len(labels) + 1))
+            category_rows[column] = {
+                label: order[bounds[code]:bounds[code + 1]] for code, label in enumerate(labels)
+            }
+
+        date_order = sorted_dates = None
+        if self.date_column is not None:
+            dates = np.asarray(table.columns[self.date_column])
+            date_order = np.argsort(dates, kind="stable")
+            sorted_dates = dates[date_order]
+
+        return IndexSnapshot(table, category_rows, date_order, sorted_dates)
+
+    def columns_for(self, fields, snapshot=None):
+        """
+        將 API 的欄位名稱轉成資料表欄位,'location' 等巢狀欄位會展開成 lat,lng
+
+        Args:
+            fields: API 的欄位名稱清單
+            snapshot: 查詢使用的 IndexSnapshot,預設為目前版本
+
+        Raises:
+            ValueError: 欄位不存在
+        """
+        if not fields:
+            return None
+        schema = (snapshot or self.snapshot()).table.schema
+        selected = []
+        for field in fields:
+            matches = [column for column, _, path in schema if field in (column, path[0])]
+            if not matches:
+                raise ValueError(f"沒有此欄位: {field}")
+            selected.extend(matches)
+        return selected
+
+    def select(self, equals=None, since=None, snapshot=None):
+        """
+        找出符合條件的列號
+
+        Args:
+            equals: {類別欄位: 值},值可以是逗號分隔的多個值
+            since: 日期欄位不早於此日期
+            snapshot: 查詢使用的 IndexSnapshot,預設為目前版本
+
+        Returns:
+            (資料表, 已排序的列號)
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        table = snapshot.table
+        rows = None
+        for column, value in (equals or {}).items():
+            if value is None:
+                continue
+            index = snapshot.category_rows[column]
+            matched = [index[label] for label in value.split(",") if label in index]
+            column_rows = np.sort(np.concatenate(matched)) if matched else np.empty(0, dtype=np.int64)
+            rows = column_rows if rows is None else np.intersect1d(rows, column_rows, assume_unique=True)
+
+        if since is not None:
+            sorted_dates = snapshot.sorted_dates
+            start = np.searchsorted(sorted_dates, np.datetime64(since, "D").astype(sorted_dates.dtype))
+            since_rows = np.sort(snapshot.date_order[start:])
+            rows = since_rows if rows is None else np.intersect1d(rows, since_rows, assume_unique=True)
+
+        if rows is None:
+            rows = np.arange(len(table))
+        return table, rows
+
+    def page(self, equals=None, since=None, fields=None, limit=None, cursor=None, config=None):
+        """
+        依條件查詢並分頁
+
+        Args:
+            equals: {類別欄位: 值}
+            since: 日期下限
+            fields: 要回傳的欄位清單
+            limit: 每頁筆數
+            cursor: 上一頁回傳的 next_cursor
+            config: 查詢設定,預設為 QUERY_API_CONFIG
+
+        Returns:
+            {"items": [...], "count": 本頁筆數, "total": 符合條件的總筆數, "next_cursor": 下一頁游標或 None}
+
+        Raises:
+            ValueError: 參數錯誤 (包含 CursorError)
+        """
+        if config is None:
+            config = QUERY_API_CONFIG
+        if limit is None:
+            limit = config["default_limit"]
+        elif int(limit) < 1:
+            raise ValueError("limit 必須大於 0")
+        else:
+            limit = min(int(limit), config["max_limit"])
+
+        # 欄位與列號取自同一個版本,查詢途中資料更新也不會混用
+        snapshot = self.snapshot()
+        columns = self.columns_for(fields, snapshot)
+        table, rows = self.select(equals, since, snapshot)
+        offset = decode_cursor(cursor, table.version) if cursor else 0
+
+        page_rows = rows[offset:offset + limit]
+        next_offset = offset + len(page_rows)
+        return {
+            "items": table.to_records(page_rows, columns),
+            "count": len(page_rows),
+            "total": len(rows),
+            "next_cursor": encode_cursor(table.version, next_offset) if next_offset < len(rows) else None,
+        }
@@ -0,0 +1,139 @@
+"""
+登革熱疫情資料系統 - 風險等級計算
+依 config.RISK_THRESHOLDS 一次計算所有行政區或村里的病例數,每萬人病例率與風險等級,
+可指定時間範圍並產生 (區域 x 週) 的統計表,全部以 NumPy/pandas 向量運算完成
+"""
+
+import numpy as np
+import pandas as pd
+
+from config import RISK_LABELS, RISK_THRESHOLDS
+
+
+def _levels(thresholds):
+    """依閾值由低到高排列的 (等級, 閾值)"""
+    return sorted(thresholds.items(), key=lambda item: item[1])
+
+
+def rate_per_10k(cases, population):
+    """
+    每萬人病例率,人口為 0 時為 0
+
+    Args:
+        cases: 病例數陣列
+        population: 人口陣列
+    """
+    cases = np.asarray(cases, dtype=float)
+    population = np.asarray(population, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates = np.where(population > 0, cases / population * 10000, 0.0)
+    return np.round(rates, 2)
+
+
+def _level_index(rates, thresholds):
+    levels = _levels(thresholds if thresholds is not None else RISK_THRESHOLDS)
+    keys = [key for key, _ in levels]
+    bounds = np.array([bound for _, bound in levels], dtype=float)
+    # 低於最低閾值的病例率歸入最低等級
+    index = np.searchsorted(bounds, np.asarray(rates, dtype=float), side="right") - 1
+    return keys, np.clip(index, 0, len(keys) - 1)
+
+
+def classify(rates, thresholds=None):
+    """
+    依每萬人病例率分類風險等級
+
+    Args:
+        rates: 每萬人病例率陣列
+        thresholds: {等級: 閾值},預設為 RISK_THRESHOLDS;病例率不低於閾值即屬於該等級
+
+    Returns:
+        等級鍵陣列 (例如 'high'),object 型別
+    """
+    keys, index = _level_index(rates, thresholds)
+    return np.array(keys, dtype=object)[index]
+
+
+def risk_labels(rates, thresholds=None, labels=None):
+    """
+    依每萬人病例率取得風險等級的顯示名稱
+
+    Args:
+        rates: 每萬人病例率陣列
+        thresholds: 閾值,預設為 RISK_THRESHOLDS
+        labels: {等級: 顯示名稱},預設為 RISK_LABELS
+    """
+    labels = labels if labels is not None else RISK_LABELS
+    keys, index = _level_index(rates, thresholds)
+    return np.array([labels[key] for key in keys], dtype=object)[index]
+
+
+def assess(frame, cases="dengue_cases", population="population", thresholds=None, labels=None):
+    """
+    為每一列加上 rate_per_10k,risk 與 risk_level
+
+    Args:
+        frame: 含病例數與人口欄位的 DataFrame
+        cases: 病例數欄位
+        population: 人口欄位
+
+    Returns:
+        新的 DataFrame
+    """
+    result = frame.copy()
+    result["rate_per_10k"] = rate_per_10k(result[cases], result[population])
+    result["risk"] = classify(result["rate_per_10k"], thresholds)
+    result["risk_level"] = risk_labels(result["rate_per_10k"], thresholds, labels)
+    return result
+
+
+def aggregate(cases, population, by="district", date="date", count=None, start=None, end=None, freq=None,
+              thresholds=None, labels=None):
+    """
+    依區域 (與時間) 彙總病例並計算風險等級
+
+    Args:
+        cases: 病例 DataFrame,每列一筆病例或一筆計數
+        population: 區域人口,以區域名稱為索引的 Series;沒有病例的區域也會出現在結果中
+        by: 區域欄位,例如 'district' 或 'village'
+        date: 日期欄位
+        count: 病例數欄位,None 表示每列為一筆病例
+        start: 起始日期 (含)
+        end: 結束日期 (含)
+        freq: pandas 時間粒度,例如 'W-SUN' 表示週一到週日為一週;None 表示整段時間合計
+
+    Returns:
+        DataFrame,欄位為 [by, (period,) cases, population, rate_per_10k, risk, risk_level]
+    """
+    frame = cases
+    if start is not None or end is not None:
+        dates = pd.to_datetime(frame[date])
+        mask = np.ones(len(frame), dtype=bool)
+        if start is not None:
+            mask &= (dates >= pd.Timestamp(start)).to_numpy()
+        if end is not None:
+            mask &= (dates <= pd.Timestamp(end)).to_numpy()
+        frame = frame[mask]
+
+    values = frame[count] if count is not None else pd.Series(1, index=frame.index)
+    population = population.astype(float)
+    areas = population.index.union(pd.Index(frame[by].unique()))
+
+    if freq is None:
+        totals = values.groupby(frame[by]).sum().reindex(areas, fill_value=0)
+        result = pd.DataFrame({by: areas, "cases": totals.to_numpy()})
+    else:
+        periods = pd.to_datetime(frame[date]).dt.to_period(freq)
+        totals = values.groupby([frame[by], periods]).sum()
+        first = pd.Period(start, freq) if start is not None else periods.min()
+        last = pd.Period(end, freq) if end is not None else periods.max()
+        if pd.isna(first) or pd.isna(last):
+            return pd.DataFrame(columns=[by, "period", "cases", "population", "rate_per_10k", "risk", "risk_level"])
+        # 完整的 (區域 x 期間) 表格,沒有病例的期間為 0
+        grid = pd.MultiIndex.from_product([areas, pd.period_range(first, last, freq=freq)], names=[by, "period"])
+        totals = totals.reindex(grid, fill_value=0)
+        result = totals.rename("cases").reset_index()
+
+    result["cases"] = result["cases"].astype(np.int64)
+    result["population"] = population.reindex(result[by]).fillna(0).to_numpy()
+    return assess(result, cases="cases", thresholds=thresholds, labels=labels)
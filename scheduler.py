@@ -0,0 +1,128 @@
+"""
+登革熱疫情資料系統 - 背景排程
+在 FastAPI 的事件迴圈中定期執行更新工作,使用者的請求不需要負擔更新成本
+"""
+
+import asyncio
+import random
+import time
+
+
+class PeriodicRefresher:
+    """
+    定期執行非同步工作
+
+    - 每次間隔隨機加減 jitter_fraction,避免多個實例同時更新
+    - 上一次還在執行時不會重複執行 (手動觸發也一樣)
+    - 記錄最近一次的執行時間,耗時與結果
+    """
+
+    def __init__(self, name, job, interval_hours, jitter_fraction=0.1, run_on_start=False):
+        """
+        Args:
+            name: 排程名稱
+            job: 無參數的非同步函數,失敗時應拋出例外
+            interval_hours: 執行間隔 (小時)
+            jitter_fraction: 間隔隨機變動的比例
+            run_on_start: 啟動時是否立即執行一次
+        """
+        self.name = name
+        self.job = job
+        self.interval_seconds = interval_hours * 3600
+        self.jitter_fraction = jitter_fraction
+        self.run_on_start = run_on_start
+        self.running = False
+        self._task = None
+        self.metrics = {
+            "run_count": 0,
+            "failure_count": 0,
+            "skipped_count": 0,
+            "last_started_at": None,
+            "last_finished_at": None,
+            "last_duration_seconds": None,
+            "last_status": None,
+            "last_error": None,
+            "next_run_at": None,
+        }
+
+    def next_delay(self):
+        """下一次執行前的等待秒數"""
+        jitter = random.uniform(-self.jitter_fraction, self.jitter_fraction)
+        return max(0.0, self.interval_seconds * (1 + jitter))
+
+    async def run_once(self):
+        """
+        立即執行一次
+
+        Returns:
+            是否有執行 (上一次尚未結束時回傳 False)
+        """
+        if self.running:
+            self.metrics["skipped_count"] += 1
+            return False
+
+        self.running = True
+        started = time.monotonic()
+        self.metrics["last_started_at"] = time.time()
+        try:
+            await self.job()
+            self.metrics["last_status"] = "success"
+            self.metrics["last_error"] = None
+        except Exception as e:
+            self.metrics["last_status"] = "failed"
+            self.metrics["last_error"] = str(e)
+            self.metrics["failure_count"] += 1
+            print(f"排程 {self.name} 執行失敗: {e}")
+        finally:
+            self.metrics["run_count"] += 1
+            self.metrics["last_finished_at"] = time.time()
+            self.metrics["last_duration_seconds"] = round(time.monotonic() - started, 3)
+            self.running = False
+        return True
+
+    def trigger(self):
+        """
+        在背景立即執行一次,不等待結果
+
+        Returns:
+            是否有排入執行
+        """
+        if self.running:
+            self.metrics["skipped_count"] += 1
+            return False
+        asyncio.ensure_future(self.run_once())
+        return True
+
+    async def _loop(self):
+        if self.run_on_start:
+            await self.run_once()
+        while True:
+            delay = self.next_delay()
+            self.metrics["next_run_at"] = time.time() + delay
+            await asyncio.sleep(delay)
+            await self.run_once()
+
+    def start(self):
+        """在目前的事件迴圈中開始排程"""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._loop())
+
+    async def stop(self):
+        """停止排程,執行中的工作會被取消"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self.metrics["next_run_at"] = None
+
+    def status(self):
+        """排程狀態與執行紀錄"""
+        return {
+            "name": self.name,
+            "interval_seconds": self.interval_seconds,
+            "running": self.running,
+            **self.metrics,
+        }
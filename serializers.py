@@ -0,0 +1,187 @@
+"""
+登革熱疫情資料系統 - JSON 序列化
+資料檔寫入,讀取與 API 回應共用的序列化層:有安裝 orjson 時使用 orjson,否則使用標準函式庫 json,
+兩者輸出相同的精簡 UTF-8 JSON。行政區,誘卵器與天氣紀錄依 RECORD_SCHEMAS 驗證欄位與型別
+"""
+
+import json
+import os
+import uuid
+
+import numpy as np
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson 為選用套件
+    orjson = None
+
+# 目前使用的序列化實作
+BACKEND = "orjson" if orjson is not None else "json"
+
+# 各資料表的紀錄格式 {欄位: 型別},巢狀 dict 表示巢狀物件;float 欄位也接受整數
+RECORD_SCHEMAS = {
+    "districts": {
+        "id": int,
+        "name": str,
+        "population": int,
+        "dengue_cases": int,
+        "risk_level": str,
+        "last_update": str,
+        "value": int,
+        "rate_per_10k": float,
+    },
+    "ovitraps": {
+        "district": str,
+        "ovitrap_id": str,
+        "egg_count": int,
+        "location": {"lat": float, "lng": float},
+        "status": str,
+        "last_check": str,
+    },
+    "weather": {
+        "temperature": float,
+        "humidity": int,
+        "rainfall": float,
+        "update_time": str,
+    },
+}
+
+
+class RecordValidationError(ValueError):
+    """紀錄不符合 RECORD_SCHEMAS"""
+
+
+def _default(value):
+    """JSON 沒有對應型別的值 (models.py 的紀錄型別,NumPy 數值與陣列)"""
+    to_dict = getattr(value, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"無法序列化的型別: {type(value).__name__}")
+
+
+def dumps(value, indent=False):
+    """
+    序列化為 UTF-8 JSON 位元組
+
+    Args:
+        value: 要序列化的資料,可包含紀錄型別,NumPy 數值與陣列
+        indent: 是否縮排 (給人閱讀的檔案使用)
+    """
+    if orjson is not None:
+        # 紀錄型別交給 _default 以 to_dict() 輸出,維持原本的 JSON 結構
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, default=_default, option=option)
+    if indent:
+        return json.dumps(value, ensure_ascii=False, indent=2, default=_default).encode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def loads(data):
+    """解析 JSON 位元組或字串"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(path, value, indent=False):
+    """
+    寫入 JSON 檔,先寫入暫存檔再以 os.replace 取代,讀取端不會讀到寫到一半的檔案
+
+    Returns:
+        寫入的位元組數
+    """
+    body = dumps(value, indent=indent)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+    return len(body)
+
+
+def read_json(path):
+    """讀取 JSON 檔"""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def _compile(schema):
+    """將紀錄格式轉為 [(欄位, 允許的型別, 子格式)],驗證大量紀錄時不必每筆重新判斷"""
+    compiled = []
+    for field, field_schema in schema.items():
+        if isinstance(field_schema, dict):
+            compiled.append((field, dict, _compile(field_schema)))
+        else:
+            compiled.append((field, (int, float) if field_schema is float else field_schema, None))
+    return compiled
+
+
+_COMPILED_SCHEMAS = {}
+
+
+def _check(record, compiled):
+    """驗證單筆紀錄,錯誤訊息中的位置只在失敗時才組出"""
+    if not isinstance(record, dict):
+        raise RecordValidationError("", "應為物件")
+    for field, allowed, nested in compiled:
+        try:
+            value = record[field]
+        except KeyError:
+            raise RecordValidationError("", f"缺少欄位 {field}") from None
+        # bool 是 int 的子類別,需要排除
+        if not isinstance(value, allowed) or (value.__class__ is bool and allowed is not bool):
+            expected = "物件" if nested is not None else getattr(allowed, "__name__", "float")
+            raise RecordValidationError(f".{field}", f"應為 {expected},得到 {type(value).__name__}")
+        if nested is not None:
+            try:
+                _check(value, nested)
+            except RecordValidationError as exc:
+                raise RecordValidationError(f".{field}{exc.args[0]}", exc.args[1]) from None
+
+
+def validate_records(records, table):
+    """
+    驗證紀錄的欄位與型別,允許額外的欄位
+
+    Args:
+        records: 紀錄 dict 或紀錄型別的清單,或單筆紀錄 (weather)
+        table: RECORD_SCHEMAS 中的資料表名稱
+
+    Raises:
+        RecordValidationError: 第一筆不符合的紀錄
+    """
+    compiled = _COMPILED_SCHEMAS.get(table)
+    if compiled is None:
+        compiled = _COMPILED_SCHEMAS[table] = _compile(RECORD_SCHEMAS[table])
+    single = isinstance(records, dict) or hasattr(records, "to_dict")
+    items = [(None, records)] if single else enumerate(records)
+    for i, record in items:
+        try:
+            _check(record if isinstance(record, dict) else record.to_dict(), compiled)
+        except RecordValidationError as exc:
+            where = table if i is None else f"{table}[{i}]"
+            raise RecordValidationError(f"{where}{exc.args[0]}: {exc.args[1]}") from None
+    return records
+
+
+def encode_records(records, table, indent=False):
+    """驗證後序列化紀錄"""
+    return dumps(validate_records(records, table), indent=indent)
+
+
+def decode_records(data, table):
+    """解析並驗證紀錄"""
+    return validate_records(loads(data), table)
+
+
+class FastJSONResponse(JSONResponse):
+    """以 dumps() 序列化的 JSON 回應,安裝 orjson 時比預設的 JSONResponse 快"""
+
+    def render(self, content):
+        return dumps(content)
@@ -0,0 +1,173 @@
+"""
+登革熱疫情資料系統 - 誘卵器鄰近查詢
+將誘卵器座標轉成平面座標 (COORDINATE_SYSTEM["input_crs"],公尺) 後建立 KD-tree,
+查詢某個地點附近半徑內或最近的 k 個誘卵器,不需要逐筆計算距離
+
+有安裝 scipy 時使用 cKDTree,否則使用依 x 座標排序的 NumPy 索引
+"""
+
+import threading
+
+import numpy as np
+
+from config import COORDINATE_SYSTEM
+from data.process_map import _transformer
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy 為選用套件
+    cKDTree = None
+
+
+class PointIndex:
+    """平面座標點的鄰近查詢索引"""
+
+    def __init__(self, x, y):
+        """
+        Args:
+            x: x 座標陣列 (公尺)
+            y: y 座標陣列 (公尺)
+        """
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self._tree = cKDTree(np.column_stack((self.x, self.y))) if cKDTree is not None and len(self.x) else None
+        # 沒有 scipy 時依 x 排序,半徑查詢只需檢查 x 在範圍內的一段
+        self._order = np.argsort(self.x, kind="stable")
+        self._sorted_x = self.x[self._order]
+
+    def __len__(self):
+        return len(self.x)
+
+    def query(self, x, y, k=None, radius=None):
+        """
+        查詢鄰近的點
+
+        Args:
+            x, y: 查詢位置 (公尺)
+            k: 最多回傳的點數,None 表示不限制 (需指定 radius)
+            radius: 半徑 (公尺),None 表示不限制 (需指定 k)
+
+        Returns:
+            (列號陣列, 距離陣列),依距離由近到遠排列
+        """
+        if k is None and radius is None:
+            raise ValueError("k 與 radius 至少需要指定一個")
+        if len(self.x) == 0 or not (np.isfinite(x) and np.isfinite(y)):
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        if self._tree is not None:
+            return self._query_tree(x, y, k, radius)
+        return self._query_sorted(x, y, k, radius)
+
+    def _query_tree(self, x, y, k, radius):
+        if k is None:
+            rows = np.asarray(self._tree.query_ball_point((x, y), radius), dtype=np.int64)
+            distances = np.hypot(self.x[rows] - x, self.y[rows] - y)
+        else:
+            distances, rows = self._tree.query(
+                (x, y), k=min(k, len(self.x)), distance_upper_bound=np.inf if radius is None else radius
+            )
+            distances, rows = np.atleast_1d(distances), np.atleast_1d(rows)
+            # 超出半徑的結果距離為 inf
+            found = np.isfinite(distances)
+            distances, rows = distances[found], rows[found].astype(np.int64)
+        return self._sorted(rows, distances, k)
+
+    def _query_sorted(self, x, y, k, radius):
+        if radius is None:
+            # 只指定 k 時由資料密度估計半徑,找到的點不足 k 個就加倍,半徑內的 k 個最近點即為答案
+            extent = max((np.nanmax(self.x) - np.nanmin(self.x)) * (np.nanmax(self.y) - np.nanmin(self.y)), 1.0)
+            search = 2 * np.sqrt(extent * k / (np.pi * len(self.x)))
+            # 涵蓋所有點的半徑,超過時不需要再加倍
+            farthest = np.hypot(
+                max(abs(x - np.nanmin(self.x)), abs(x - np.nanmax(self.x))),
+                max(abs(y - np.nanmin(self.y)), abs(y - np.nanmax(self.y))),
+            )
+            if not np.isfinite(farthest):
+                return np.empty(0, dtype=np.int64), np.empty(0)
+            while True:
+                rows, distances = self._query_sorted(x, y, k, min(search, farthest))
+                if len(rows) >= min(k, len(self.x)) or search >= farthest:
+                    return rows, distances
+                search *= 2
+
+        low = np.searchsorted(self._sorted_x, x - radius, side="left")
+        high = np.searchsorted(self._sorted_x, x + radius, side="right")
+        rows = self._order[low:high]
+
+        distances = np.hypot(self.x[rows] - x, self.y[rows] - y)
+        within = distances <= radius
+        rows, distances = rows[within], distances[within]
+        if k is not None and len(rows) > k:
+            nearest = np.argpartition(distances, k - 1)[:k]
+            rows, distances = rows[nearest], distances[nearest]
+        return self._sorted(rows, distances, k)
+
+    @staticmethod
+    def _sorted(rows, distances, k):
+        order = np.argsort(distances, kind="stable")
+        if k is not None:
+            order = order[:k]
+        return rows[order], distances[order]
+
+
+class OvitrapNearIndex:
+    """誘卵器的鄰近查詢索引,欄式資料有新版本時重建"""
+
+    def __init__(self, table_index, coordinate_system=COORDINATE_SYSTEM):
+        """
+        Args:
+            table_index: 誘卵器的 query_index.TableIndex
+            coordinate_system: 座標系統設定,以 input_crs 計算距離
+        """
+        self.table_index = table_index
+        # 經緯度 -> 平面座標 (公尺),與地圖建置共用同一個 Transformer
+        self.to_projected = _transformer(coordinate_system["output_crs"], coordinate_system["input_crs"])
+        self._lock = threading.Lock()
+        # (資料表版本, PointIndex) 整組替換,不會讀到版本與索引不一致的狀態
+        self._built = None
+
+    def current(self):
+        """取得目前版本的資料表與索引,有新版本時重建 (啟動與資料更新後由 main.load_query_indexes 預先執行)"""
+        table = self.table_index.current()
+        return table, self._points_for(table)
+
+    def _points_for(self, table):
+        """資料表對應的 PointIndex,版本不同時重建"""
+        built = self._built
+        if built is None or built[0] != table.version:
+            with self._lock:
+                built = self._built
+                if built is None or built[0] != table.version:
+                    x, y = self.to_projected.transform(
+                        np.asarray(table.columns["lng"]), np.asarray(table.columns["lat"])
+                    )
+                    built = (table.version, PointIndex(x, y))
+                    self._built = built
+        return built[1]
+
+    def near(self, lat, lng, k=None, radius=None, fields=None):
+        """
+        查詢某個地點附近的誘卵器
+
+        Args:
+            lat, lng: 查詢位置 (經緯度)
+            k: 最多回傳的數量
+            radius: 半徑 (公尺)
+            fields: 要回傳的欄位
+
+        Returns:
+            誘卵器 dict 清單,附上 distance_m,依距離由近到遠排列
+        """
+        # 資料表,欄位與點位索引取自同一個版本
+        snapshot = self.table_index.snapshot()
+        table = snapshot.table
+        points = self._points_for(table)
+        columns = self.table_index.columns_for(fields, snapshot)
+        x, y = self.to_projected.transform(lng, lat)
+        rows, distances = points.query(x, y, k=k, radius=radius)
+
+        items = table.to_records(rows, columns)
+        for item, distance in zip(items, distances.tolist()):
+            item["distance_m"] = round(distance, 1)
+        return items
@@ -0,0 +1,171 @@
+"""
+登革熱疫情資料系統 - 點位與行政區的空間對應
+以 STRtree 索引行政區多邊形,一次判斷大量點位 (誘卵器,村里) 落在哪個行政區,
+並檢查資料中的行政區欄位是否與實際位置相符
+
+單獨執行時檢查誘卵器與村里資料:
+    python spatial_join.py                  # 誘卵器與村里
+    python spatial_join.py ovitraps --fix   # 以實際位置修正誘卵器的行政區並輸出
+"""
+
+import argparse
+import csv
+import os
+import time
+
+import numpy as np
+import shapely
+
+from columnar_store import write_table
+from config import COORDINATE_SYSTEM, DISTRICT_BOUNDARIES_GEOJSON, OVITRAP_DATA_JSON, VILLAGE_LIST_CSV
+from models import Ovitrap, from_dicts, to_arrays
+from serializers import read_json, write_json
+
+
+class DistrictLocator:
+    """行政區多邊形的空間索引 (經緯度)"""
+
+    def __init__(self, gdf, name_field="name"):
+        """
+        Args:
+            gdf: 輸出座標系統 (經緯度) 的行政區 GeoDataFrame
+            name_field: 行政區名稱欄位
+        """
+        self.names = np.asarray(gdf[name_field], dtype=object)
+        self.geometries = np.asarray(gdf.geometry.values, dtype=object)
+        self.tree = shapely.STRtree(self.geometries)
+
+    @classmethod
+    def from_source(cls, source):
+        """由 process_map.DistrictSource 建立,與地圖使用相同的行政區資料"""
+        return cls(source.ensure_loaded().gdf)
+
+    def locate(self, lng, lat):
+        """
+        找出每個點所在的行政區
+
+        Args:
+            lng: 經度陣列
+            lat: 緯度陣列
+
+        Returns:
+            行政區名稱陣列 (object),不在任何行政區內的點為 None
+        """
+        points = shapely.points(np.asarray(lng, dtype=float), np.asarray(lat, dtype=float))
+        point_index, polygon_index = self.tree.query(points, predicate="intersects")
+
+        result = np.full(len(points), None, dtype=object)
+        # 落在兩區交界上的點取第一個符合的行政區
+        first_point, first = np.unique(point_index, return_index=True)
+        result[first_point] = self.names[polygon_index[first]]
+        return result
+
+    def validate(self, labels, lng, lat):
+        """
+        比對資料中的行政區與實際所在的行政區
+
+        Args:
+            labels: 資料中的行政區名稱
+            lng: 經度陣列
+            lat: 緯度陣列
+
+        Returns:
+            {"actual": 實際行政區陣列, "matched": 相符的布林陣列, "outside": 不在任何行政區內的布林陣列}
+        """
+        actual = self.locate(lng, lat)
+        outside = np.equal(actual, None)
+        matched = ~outside & (actual == np.asarray(labels, dtype=object))
+        return {"actual": actual, "matched": matched, "outside": outside}
+
+
+def load_locator(geojson_path=DISTRICT_BOUNDARIES_GEOJSON, coordinate_system=COORDINATE_SYSTEM):
+    """讀取行政區邊界並建立空間索引"""
+    from data.process_map import DistrictSource
+
+    return DistrictLocator.from_source(DistrictSource(geojson_path, coordinate_system))
+
+
+def join_ovitraps(locator, records):
+    """
+    檢查誘卵器紀錄的行政區
+
+    Args:
+        locator: DistrictLocator
+        records: 誘卵器紀錄 (models.Ovitrap) 清單
+
+    Returns:
+        DistrictLocator.validate() 的結果
+    """
+    arrays = to_arrays(records, ["district", "lng", "lat"], model=Ovitrap)
+    return locator.validate(arrays["district"], arrays["lng"], arrays["lat"])
+
+
+def read_villages(path=VILLAGE_LIST_CSV):
+    """
+    讀取村里清單
+
+    Returns:
+        (村里名稱清單, 行政區名稱清單, 經度陣列, 緯度陣列)
+    """
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.DictReader(f))
+    names = [row["區里"] for row in rows]
+    # "七股區七股里" -> "七股區"
+    districts = [name[:name.index("區") + 1] for name in names]
+    lng = np.array([float(row["經度"]) for row in rows])
+    lat = np.array([float(row["緯度"]) for row in rows])
+    return names, districts, lng, lat
+
+
+def _report(label, result, elapsed):
+    total = len(result["actual"])
+    matched = int(result["matched"].sum())
+    outside = int(result["outside"].sum())
+    rate = total / elapsed if elapsed > 0 else float("inf")
+    print(
+        f"{label}: {total} 筆,相符 {matched},行政區不符 {total - matched - outside},"
+        f"不在台南市內 {outside} ({elapsed * 1000:.1f} ms,每秒 {rate:,.0f} 點)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="檢查點位資料的行政區是否與實際位置相符")
+    parser.add_argument("targets", nargs="*", help="要檢查的資料 (ovitraps, villages),預設為全部")
+    parser.add_argument("--fix", action="store_true", help="以實際所在的行政區取代誘卵器資料中的行政區")
+    parser.add_argument("--output", help="--fix 的輸出檔案,預設覆寫誘卵器資料")
+    args = parser.parse_args()
+    targets = args.targets or ["ovitraps", "villages"]
+    unknown = set(targets) - {"ovitraps", "villages"}
+    if unknown:
+        parser.error(f"未知的資料: {', '.join(sorted(unknown))}")
+
+    locator = load_locator()
+
+    if "ovitraps" in targets:
+        records = from_dicts("ovitraps", read_json(OVITRAP_DATA_JSON))
+        started = time.perf_counter()
+        result = join_ovitraps(locator, records)
+        _report("誘卵器", result, time.perf_counter() - started)
+
+        if args.fix:
+            for record, actual in zip(records, result["actual"]):
+                if actual is not None:
+                    record.district = actual
+            output = args.output or str(OVITRAP_DATA_JSON)
+            write_json(output, records)
+            if os.path.abspath(output) == os.path.abspath(OVITRAP_DATA_JSON):
+                # 查詢 API 使用的欄式資料也一併更新;輸出到其他檔案時不影響正式資料
+                write_table("ovitraps", records)
+            print(f"已修正的誘卵器資料: {output}")
+
+    if "villages" in targets:
+        names, districts, lng, lat = read_villages()
+        started = time.perf_counter()
+        result = locator.validate(districts, lng, lat)
+        _report("村里", result, time.perf_counter() - started)
+        for name, actual in zip(np.asarray(names, dtype=object)[~result["matched"]], result["actual"][~result["matched"]]):
+            print(f"  {name}: 實際位於 {actual or '台南市外'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+登革熱疫情資料系統 - 靜態檔案建置與提供
+將 script.js,樣式與資料檔複製為檔名含內容雜湊的版本並預先壓縮成 gzip/brotli,
+內容不變時網址不變,瀏覽器可以長期快取 (immutable);內容變動時網址跟著改變,不需要 ?t= 時間戳記
+
+單獨執行時重新產生所有靜態檔案:
+    python static_assets.py
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from mimetypes import guess_type
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+from compression import ENCODING_SUFFIXES, choose_encoding, compress_variants
+from config import STATIC_ASSETS_CONFIG, STATIC_ASSETS_DIR, STATIC_MOUNTS
+
+MANIFEST_NAME = "manifest.json"
+
+
+def mount_url(path, mounts=None):
+    """
+    檔案在靜態掛載點下的網址
+
+    Args:
+        path: 檔案路徑
+        mounts: {掛載點: 目錄},預設為 STATIC_MOUNTS
+
+    Returns:
+        例如 '/template/script.js',不在任何掛載點下時為 None
+    """
+    path = Path(path).resolve()
+    for mount_path, directory in (mounts if mounts is not None else STATIC_MOUNTS).items():
+        try:
+            relative = path.relative_to(Path(directory).resolve())
+        except ValueError:
+            continue
+        return f"{mount_path}/{relative.as_posix()}"
+    return None
+
+
+def hashed_name(path, digest):
+    """'script.js' -> 'script.<雜湊>.js'"""
+    path = Path(path)
+    return f"{path.stem}.{digest}{path.suffix}"
+
+
+def _atomic_write_bytes(path, data):
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def build_assets(files=None, output_dir=STATIC_ASSETS_DIR, config=None):
+    """
+    產生含內容雜湊的靜態檔案與預先壓縮的 .gz/.br,並更新對照表
+
+    Args:
+        files: 要處理的檔案,預設為 config["files"]
+        output_dir: 輸出目錄
+        config: 設定,預設為 STATIC_ASSETS_CONFIG
+
+    Returns:
+        {原始網址: 含雜湊的網址}
+    """
+    if config is None:
+        config = STATIC_ASSETS_CONFIG
+    if files is None:
+        files = config["files"]
+    output_dir = str(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    manifest = {}
+    for path in files:
+        url = mount_url(path)
+        if url is None or not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            body = f.read()
+        name = hashed_name(path, hashlib.sha256(body).hexdigest()[:12])
+        target = os.path.join(output_dir, name)
+
+        # 檔名由內容決定,已存在表示內容相同,不需要重寫;
+        # 原始檔先寫入,壓縮檔的修改時間不會早於原始檔,中途失敗時只是少了壓縮版本
+        if not os.path.exists(target):
+            _atomic_write_bytes(target, body)
+            for encoding, data in compress_variants(body).items():
+                if encoding != "identity":
+                    _atomic_write_bytes(target + ENCODING_SUFFIXES[encoding], data)
+        manifest[url] = f"{config['mount']}/{name}"
+
+    _atomic_write_bytes(
+        os.path.join(output_dir, MANIFEST_NAME),
+        json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"),
+    )
+    prune_assets(output_dir, manifest, config["retain_seconds"])
+    return manifest
+
+
+def prune_assets(output_dir, manifest, retain_seconds):
+    """刪除不在對照表中且超過保留時間的舊版本檔案"""
+    current = {url.rsplit("/", 1)[-1] for url in manifest.values()}
+    cutoff = time.time() - retain_seconds
+    for entry in os.scandir(output_dir):
+        if not entry.is_file() or entry.name == MANIFEST_NAME:
+            continue
+        base = entry.name
+        for suffix in ENCODING_SUFFIXES.values():
+            if base.endswith(suffix):
+                base = base[:-len(suffix)]
+        if base in current:
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+
+def source_signature(files):
+    """以檔案的路徑,修改時間與大小計算簽章 (與 map_service 判斷輸入變動的方式相同)"""
+    parts = []
+    for path in files:
+        try:
+            stat = os.stat(path)
+            parts.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+        except FileNotFoundError:
+            parts.append(f"{path}:missing")
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class AssetManifest:
+    """
+    目前的靜態檔案對照表,來源檔案變動時重新建置
+
+    資料檔可能由其他程式 (generator,incremental_summary,spatial_join --fix) 改寫,
+    不一定伴隨地圖重建,因此每次取用時比對來源檔案的簽章
+    """
+
+    def __init__(self, files=None, output_dir=STATIC_ASSETS_DIR, config=None):
+        """
+        Args:
+            files: 來源檔案,預設為 config["files"]
+            output_dir: 輸出目錄
+            config: 設定,預設為 STATIC_ASSETS_CONFIG
+        """
+        self.config = config if config is not None else STATIC_ASSETS_CONFIG
+        self.files = [str(path) for path in (files if files is not None else self.config["files"])]
+        self.output_dir = str(output_dir)
+        self._lock = threading.Lock()
+        # (簽章, 對照表) 整組替換
+        self._built = None
+
+    def current(self):
+        """
+        取得對照表,來源檔案有變動時先重新建置
+
+        Returns:
+            {原始網址: 含雜湊的網址}
+        """
+        signature = source_signature(self.files)
+        built = self._built
+        if built is None or built[0] != signature:
+            with self._lock:
+                built = self._built
+                signature = source_signature(self.files)
+                if built is None or built[0] != signature:
+                    built = (signature, build_assets(self.files, self.output_dir, self.config))
+                    self._built = built
+        return built[1]
+
+
+def rewrite_asset_urls(html, manifest):
+    """將頁面中引用的原始網址替換為含雜湊的網址"""
+    for url, hashed_url in manifest.items():
+        html = html.replace(f'"{url}"', f'"{hashed_url}"')
+    return html
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    優先回傳預先壓縮的 .br/.gz 檔的 StaticFiles
+
+    壓縮檔必須與原始檔放在同一目錄且不比原始檔舊,否則回傳原始檔
+    """
+
+    def __init__(self, *args, cache_control="no-cache", **kwargs):
+        """
+        Args:
+            cache_control: 回應的 Cache-Control,含雜湊的檔案使用 immutable
+        """
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        request_headers = Headers(scope=scope)
+        full_path = str(full_path)
+
+        available = {"identity": None}
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            try:
+                compressed_stat = os.stat(full_path + suffix)
+            except FileNotFoundError:
+                continue
+            if compressed_stat.st_mtime >= stat_result.st_mtime:
+                available[encoding] = compressed_stat
+
+        headers = {"Cache-Control": self.cache_control}
+        if len(available) > 1:
+            headers["Vary"] = "Accept-Encoding"
+        encoding = choose_encoding(request_headers.get("accept-encoding"), available)
+
+        path = full_path
+        if encoding != "identity":
+            path = full_path + ENCODING_SUFFIXES[encoding]
+            stat_result = available[encoding]
+            headers["Content-Encoding"] = encoding
+
+        response = FileResponse(
+            path,
+            status_code=status_code,
+            stat_result=stat_result,
+            media_type=guess_type(full_path)[0] or "text/plain",
+            headers=headers,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+def immutable_cache_control(config=None):
+    """含雜湊檔案的 Cache-Control"""
+    config = config if config is not None else STATIC_ASSETS_CONFIG
+    return f"public, max-age={config['max_age']}, immutable"
+
+
+def main():
+    """重新產生所有含雜湊的靜態檔案"""
+    manifest = build_assets()
+    for url, hashed_url in manifest.items():
+        print(f"{url} -> {hashed_url}")
+    print(f"對照表: {os.path.join(str(STATIC_ASSETS_DIR), MANIFEST_NAME)}")
+
+
+if __name__ == "__main__":
+    main()
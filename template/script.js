@@ -63,7 +63,41 @@
             geo_json_014c6a9120a5c11bc489ee475900b450
                 .addData(data);
         }
-            geo_json_014c6a9120a5c11bc489ee475900b450_add({"bbox": [120.068639, 22.899127, 120.599719, 23.402224], "features": [{"bbox": [120.068639, 23.077834, 120.159353, 23.189298], "geometry": {"coordinates": [[[120.068639, 23.077834], [120.07871833333334, 23.080152], [120.08879766666666, 23.08247], [120.098877, 23.084788], [120.10895633333334, 23.087106], [120.11903566666666, 23.089424], [120.129115, 23.091742], [120.13919433333334, 23.09406], [120.14927366666666, 23.096378], [120.159353, 23.098696], [120.15779766666667, 23.108290444444446], [120.15624233333332, 23.117884888888888], [120.154687, 23.127479333333333], [120.15313166666667, 23.13707377777778], [120.15157633333332, 23.14666822222222], [120.150021, 23.156262666666667], [120.14846566666667, 23.165857111111112], [120.14691033333332, 23.175451555555554], [120.145355, 23.185046], [120.14403655555554, 23.185518444444444], [120.14271811111111, 23.185990888888888], [120.14139966666666, 23.186463333333332], [120.14008122222222, 23.186935777777776], [120.13876277777777, 23.187408222222224], [120.13744433333333, 23.18788066666667], [120.13612588888888, 23.188353111111113], [120.13480744444445, 23.188825555555557], [120.133489, 23.189298], [120.128023, 23.188077111111113], [120.122557, 23.18685622222222], [120.117091, 23.185635333333334], [120.111625, 23.184414444444446], [120.10615899999999, 23.183193555555555], [120.10069299999999, 23.181972666666667], [120.095227, 23.18075177777778], [120.089761, 23.179530888888888], [120.084295, 23.17831], [120.08255544444444, 23.167146], [120.08081588888889, 23.155981999999998], [120.07907633333333, 23.144818], [120.07733677777777, 23.133654], [120.07559722222223, 23.12249], [120.07385766666667, 23.111326], [120.07211811111111, 23.100162], [120.07037855555556, 23.088998], [120.068639, 23.077834]]], "type": "Polygon"}, "id": "0", "properties": {"name": "\u4e03\u80a1\u5340"}, "type": "Feature"}, {"bbox": [120.2575872, 23.209404, 120.289039, 23.247499], "geometry": {"coordinates": [[[120.259134, 23.210609], [120.26098122222223, 23.210475111111112], [120.26282844444445, 23.210341222222223], [120.26467566666666, 23.210207333333333], [120.26652288888889, 23.210073444444443], [120.26837011111111, 23.209939555555557], [120.27021733333333, 23.209805666666668], [120.27206455555554, 23.20967177777778], [120.27391177777777, 23.20953788888889], [120.275759, 23.209404], [120.27723455555555, 23.213636777777776], [120.27871011111111, 23.217869555555556], [120.28018566666667, 23.222102333333332], [120.28166122222223, 23.226335111111112], [120.28313677777777, 23.23056788888889], [120.28461233333333, 23.23480066666667], [120.28608788888889, 23.239033444444445], [120.28756344444444, 23.243266222222225], [120.289039, 23.247499], [120.28554435555556, 23.24747111111111], [120.28204971111111, 23.247443222222223], [120.27855506666667, 23.247415333333333], [120.27506042222223, 23.247387444444445], [120.27156577777778, 23.247359555555555], [120.26807113333334, 23.247331666666668], [120.26457648888889, 23.247303777777777], [120.26108184444445, 23.24727588888889], [120.2575872, 23.247248], [120.25775906666667, 23.243177], [120.25793093333334, 23.239106], [120.2581028, 23.235035], [120.25827466666667, 23.230964], [120.25844653333334, 23.226893], [120.2586184, 23.222822], [120.25879026666667, 23.218751], [120.25896213333334, 23.21468], [120.259134, 23.210609]]], "type": "Polygon"}, "id": "1", "properties": {"name": "\u4e0b\u71df\u5340"}, "type": "Feature"}, {"bbox": [120.354186, 23.109418, 120.428593, 23.168278], "geometry": {"coordinates": [[[120.364635, 23.109418], [120.36972422222223, 23.111222666666666], [120.37481344444446, 23.113027333333335], [120.37990266666667, 23.114832], [120.38499188888889, 23.11663666666667], [120.39008111111112, 23.118441333333333], [120.39517033333334, 23.120246], [120.40025955555555, 23.122050666666667], [120.40534877777777, 23.123855333333335], [120.410438, 23.12566], [120.41245522222222, 23.130395333333333], [120.41447244444444, 23.135130666666665], [120.41648966666666, 23.139866], [120.41850688888888, 23.144601333333334], [120.42052411111112, 23.149336666666667], [120.42254133333334, 23.154072], [120.42455855555556, 23.158807333333336], [120.42657577777778, 23.163542666666668], [120.428593, 23.168278], [120.42032555555556, 23.16521588888889], [120.41205811111112, 23.162153777777778], [120.40379066666667, 23.15909166666667], [120.39552322222222, 23.156029555555556], [120.38725577777778, 23.152967444444446], [120.37898833333334, 23.149905333333333], [120.37072088888888, 23.146843222222223], [120.36245344444444, 23.14378111111111], [120.354186, 23.140719], [120.355347, 23.137241111111113], [120.356508, 23.133763222222225], [120.357669, 23.130285333333333], [120.35883, 23.126807444444445], [120.35999100000001, 23.123329555555557], [120.361152, 23.11985166666667], [120.362313, 23.116373777777778], [120.36347400000001, 23.11289588888889], [120.364635, 23.109418]]], "type": "Polygon"}, "id": "2", "properties": {"name": "\u5927\u5167\u5340"}, "type": "Feature"}, {"bbox": [120.344192, 23.078056, 120.393421, 23.117588], "geometry": {"coordinates": [[[120.346856, 23.097696], [120.3478468888889, 23.09551377777778], [120.34883777777777, 23.093331555555555], [120.34982866666667, 23.091149333333334], [120.35081955555556, 23.08896711111111], [120.35181044444444, 23.08678488888889], [120.35280133333333, 23.084602666666665], [120.35379222222222, 23.082420444444445], [120.3547831111111, 23.08023822222222], [120.355774, 23.078056], [120.35828366666667, 23.078724222222224], [120.36079333333333, 23.079392444444444], [120.363303, 23.080060666666668], [120.36581266666667, 23.08072888888889], [120.36832233333332, 23.081397111111112], [120.370832, 23.082065333333333], [120.37334166666666, 23.082733555555556], [120.37585133333333, 23.083401777777777], [120.378361, 23.08407], [120.38003433333333, 23.085525444444446], [120.38170766666667, 23.08698088888889], [120.383381, 23.088436333333334], [120.38505433333333, 23.08989177777778], [120.38672766666667, 23.091347222222222], [120.388401, 23.092802666666667], [120.39007433333333, 23.094258111111113], [120.39174766666667, 23.095713555555555], [120.393421, 23.097169], [120.38795111111112, 23.09943777777778], [120.38248122222222, 23.101706555555555], [120.37701133333334, 23.103975333333334], [120.37154144444445, 23.106244111111113], [120.36607155555556, 23.10851288888889], [120.36060166666667, 23.110781666666668], [120.35513177777779, 23.113050444444447], [120.34966188888889, 23.115319222222222], [120.344192, 23.117588], [120.34448800000001, 23.11537777777778], [120.344784, 23.113167555555556], [120.34508000000001, 23.110957333333335], [120.345376, 23.10874711111111], [120.34567200000001, 23.10653688888889], [120.345968, 23.104326666666665], [120.346264, 23.102116444444444], [120.34656, 23.09990622222222], [120.346856, 23.097696]]], "type": "Polygon"}, "id": "3", "properties": {"name": "\u5c71\u4e0a\u5340"}, "type": "Feature"}, {"bbox": [120.169778, 22.982906, 120.209574, 23.003295], "geometry": {"coordinates": [[[120.1971488, 22.98361], [120.19844093333333, 22.983531777777777], [120.19973306666667, 22.983453555555556], [120.20102519999999, 22.98337533333333], [120.20231733333333, 22.98329711111111], [120.20360946666666, 22.98321888888889], [120.2049016, 22.983140666666667], [120.20619373333332, 22.983062444444442], [120.20748586666666, 22.98298422222222], [120.208778, 22.982906], [120.20886644444444, 22.983353], [120.20895488888888, 22.9838], [120.20904333333333, 22.984247], [120.20913177777777, 22.984694], [120.20922022222223, 22.985141], [120.20930866666667, 22.985588], [120.20939711111112, 22.986035], [120.20948555555556, 22.986482], [120.209574, 22.986929], [120.20930411111111, 22.988046333333333], [120.20903422222223, 22.989163666666666], [120.20876433333333, 22.990281], [120.20849444444444, 22.991398333333333], [120.20822455555556, 22.992515666666666], [120.20795466666667, 22.993633], [120.20768477777777, 22.994750333333332], [120.20741488888889, 22.995867666666665], [120.207145, 22.996985], [120.20523666666666, 22.997681666666665], [120.20332833333333, 22.99837833333333], [120.20142, 22.999074999999998], [120.19951166666667, 22.999771666666664], [120.19760333333333, 23.000468333333334], [120.195695, 23.001165], [120.19378666666667, 23.001861666666667], [120.19187833333334, 23.002558333333333], [120.18997, 23.003255], [120.18772644444445, 23.003259444444446], [120.18548288888888, 23.00326388888889], [120.18323933333333, 23.003268333333335], [120.18099577777778, 23.003272777777777], [120.17875222222222, 23.003277222222223], [120.17650866666666, 23.003281666666666], [120.17426511111111, 23.003286111111112], [120.17202155555555, 23.003290555555555], [120.169778, 23.003295], [120.17281919999999, 23.00110777777778], [120.17586039999999, 22.998920555555557], [120.17890159999999, 22.996733333333335], [120.18194279999999, 22.994546111111113], [120.184984, 22.992358888888887], [120.1880252, 22.990171666666665], [120.1910664, 22.987984444444443], [120.1941076, 22.98579722222222], [120.1971488, 22.98361]]], "type": "Polygon"}, "id": "4", "properties": {"name": "\u4e2d\u897f\u5340"}, "type": "Feature"}, {"bbox": [120.219044, 22.910241, 120.261752, 22.99076], "geometry": {"coordinates": [[[120.259529, 22.910241], [120.259776, 22.91640888888889], [120.260023, 22.922576777777778], [120.26027, 22.928744666666667], [120.26051700000001, 22.934912555555556], [120.260764, 22.94108044444444], [120.261011, 22.94724833333333], [120.261258, 22.95341622222222], [120.261505, 22.95958411111111], [120.261752, 22.965752], [120.26165566666667, 22.967941888888888], [120.26155933333334, 22.970131777777777], [120.261463, 22.972321666666666], [120.26136666666667, 22.974511555555555], [120.26127033333333, 22.976701444444444], [120.261174, 22.978891333333333], [120.26107766666667, 22.981081222222222], [120.26098133333333, 22.98327111111111], [120.260885, 22.985461], [120.26084377777778, 22.98604977777778], [120.26080255555556, 22.986638555555558], [120.26076133333333, 22.987227333333333], [120.26072011111111, 22.987816111111112], [120.26067888888889, 22.98840488888889], [120.26063766666667, 22.98899366666667], [120.26059644444445, 22.989582444444444], [120.26055522222222, 22.990171222222223], [120.260514, 22.99076], [120.25646011111111, 22.987281000000003], [120.25240622222222, 22.983802], [120.24835233333333, 22.980323000000002], [120.24429844444444, 22.976844], [120.24024455555556, 22.973365], [120.23619066666667, 22.969886], [120.23213677777778, 22.966407], [120.22808288888889, 22.962927999999998], [120.224029, 22.959449], [120.22347511111111, 22.958552333333333], [120.22292122222223, 22.957655666666668], [120.22236733333334, 22.956758999999998], [120.22181344444445, 22.955862333333332], [120.22125955555555, 22.954965666666666], [120.22070566666666, 22.954069], [120.22015177777777, 22.95317233333333], [120.21959788888888, 22.952275666666665], [120.219044, 22.951379], [120.22354233333333, 22.94680811111111], [120.22804066666666, 22.94223722222222], [120.232539, 22.937666333333333], [120.23703733333333, 22.933095444444444], [120.24153566666666, 22.928524555555555], [120.246034, 22.923953666666666], [120.25053233333334, 22.919382777777777], [120.25503066666667, 22.914811888888888], [120.259529, 22.910241]]], "type": "Polygon"}, "id": "5", "properties": {"name": "\u4ec1\u5fb7\u5340"}, "type": "Feature"}, {"bbox": [120.314211, 23.218379, 120.445996, 23.253562], "geometry": {"coordinates": [[[120.345538, 23.218379], [120.3567, 23.218380777777778], [120.367862, 23.218382555555554], [120.379024, 23.218384333333333], [120.390186, 23.218386111111112], [120.401348, 23.218387888888888], [120.41251, 23.218389666666667], [120.423672, 23.218391444444446], [120.434834, 23.218393222222222], [120.445996, 23.218395], [120.434283, 23.221617666666667], [120.42257, 23.224840333333333], [120.410857, 23.228063000000002], [120.39914399999999, 23.23128566666667], [120.387431, 23.234508333333334], [120.375718, 23.237731], [120.364005, 23.24095366666667], [120.352292, 23.244176333333336], [120.340579, 23.247399], [120.33764922222223, 23.24808377777778], [120.33471944444445, 23.248768555555557], [120.33178966666667, 23.249453333333335], [120.32885988888889, 23.250138111111113], [120.32593011111112, 23.250822888888887], [120.32300033333334, 23.251507666666665], [120.32007055555556, 23.252192444444443], [120.31714077777778, 23.25287722222222], [120.314211, 23.253562], [120.31769177777778, 23.249652777777776], [120.32117255555556, 23.245743555555553], [120.32465333333333, 23.241834333333333], [120.32813411111111, 23.23792511111111], [120.3316148888889, 23.234015888888887], [120.33509566666667, 23.230106666666664], [120.33857644444444, 23.226197444444445], [120.34205722222222, 23.22228822222222], [120.345538, 23.218379]]], "type": "Polygon"}, "id": "6", "properties": {"name": "\u516d\u7532\u5340"}, "type": "Feature"}, {"bbox": [120.105148, 23.232527, 120.166373, 23.316825], "geometry": {"coordinates": [[[120.105148, 23.232527], [120.10904544444445, 23.23593688888889], [120.1129428888889, 23.23934677777778], [120.11684033333333, 23.24275666666667], [120.12073777777778, 23.246166555555558], [120.12463522222222, 23.249576444444443], [120.12853266666667, 23.252986333333332], [120.1324301111111, 23.25639622222222], [120.13632755555555, 23.25980611111111], [120.140225, 23.263216], [120.14313033333333, 23.266800444444446], [120.14603566666666, 23.270384888888888], [120.148941, 23.273969333333334], [120.15184633333332, 23.27755377777778], [120.15475166666667, 23.28113822222222], [120.157657, 23.284722666666667], [120.16056233333333, 23.288307111111113], [120.16346766666666, 23.291891555555555], [120.166373, 23.295476], [120.16218222222221, 23.29784811111111], [120.15799144444443, 23.300220222222222], [120.15380066666667, 23.302592333333333], [120.14960988888889, 23.304964444444444], [120.14541911111111, 23.30733655555556], [120.14122833333333, 23.30970866666667], [120.13703755555557, 23.31208077777778], [120.13284677777779, 23.31445288888889], [120.128656, 23.316825], [120.12604400000001, 23.307458555555556], [120.12343200000001, 23.298092111111114], [120.12082000000001, 23.288725666666668], [120.11820800000001, 23.279359222222222], [120.115596, 23.26999277777778], [120.112984, 23.260626333333335], [120.110372, 23.25125988888889], [120.10776, 23.241893444444447], [120.105148, 23.232527]]], "type": "Polygon"}, "id": "7", "properties": {"name": "\u5317\u9580\u5340"}, "type": "Feature"}, {"bbox": [120.181648, 22.99925, 120.228627, 23.019636], "geometry": {"coordinates": [[[120.1956154, 23.00085], [120.19620215555555, 23.00067222222222], [120.19678891111111, 23.000494444444445], [120.19737566666666, 23.000316666666667], [120.19796242222222, 23.000138888888888], [120.19854917777778, 22.999961111111112], [120.19913593333334, 22.999783333333333], [120.19972268888888, 22.999605555555554], [120.20030944444444, 22.99942777777778], [120.2008962, 22.99925], [120.20386517777779, 22.99941188888889], [120.20683415555555, 22.999573777777776], [120.20980313333334, 22.999735666666666], [120.21277211111111, 22.999897555555556], [120.21574108888889, 23.000059444444442], [120.21871006666666, 23.000221333333332], [120.22167904444444, 23.000383222222222], [120.22464802222221, 23.00054511111111], [120.227617, 23.000707], [120.22772922222222, 23.001377777777776], [120.22784144444444, 23.002048555555554], [120.22795366666666, 23.00271933333333], [120.22806588888889, 23.00339011111111], [120.2281781111111, 23.00406088888889], [120.22829033333333, 23.004731666666668], [120.22840255555556, 23.005402444444446], [120.22851477777778, 23.006073222222224], [120.228627, 23.006744], [120.227744, 23.007814333333336], [120.226861, 23.008884666666667], [120.225978, 23.009955], [120.225095, 23.011025333333333], [120.22421200000001, 23.012095666666667], [120.223329, 23.013166], [120.222446, 23.014236333333333], [120.221563, 23.015306666666664], [120.22068, 23.016377], [120.21944977777778, 23.01673911111111], [120.21821955555556, 23.01710122222222], [120.21698933333333, 23.017463333333332], [120.21575911111111, 23.017825444444444], [120.21452888888889, 23.018187555555553], [120.21329866666667, 23.018549666666665], [120.21206844444444, 23.018911777777777], [120.21083822222222, 23.019273888888886], [120.209608, 23.019636], [120.20751222222222, 23.01915588888889], [120.20541644444445, 23.018675777777776], [120.20332066666667, 23.018195666666667], [120.20122488888889, 23.017715555555554], [120.19912911111112, 23.017235444444445], [120.19703333333334, 23.016755333333332], [120.19493755555555, 23.016275222222223], [120.19284177777779, 23.01579511111111], [120.190746, 23.015315], [120.18973511111112, 23.014900444444446], [120.18872422222222, 23.01448588888889], [120.18771333333333, 23.014071333333334], [120.18670244444445, 23.01365677777778], [120.18569155555555, 23.01324222222222], [120.18468066666667, 23.012827666666666], [120.18366977777778, 23.012413111111112], [120.18265888888888, 23.011998555555554], [120.181648, 23.011584], [120.18319993333333, 23.01039133333333], [120.18475186666666, 23.009198666666666], [120.18630379999999, 23.008005999999998], [120.18785573333332, 23.006813333333334], [120.18940766666667, 23.005620666666665], [120.1909596, 23.004428], [120.19251153333333, 23.003235333333333], [120.19406346666666, 23.002042666666668], [120.1956154, 23.00085]]], "type": "Polygon"}, "id": "8", "properties": {"name": "\u5317\u5340"}, "type": "Feature"}, {"bbox": [120.390183, 22.988016, 120.438883, 23.07105], "geometry": {"coordinates": [[[120.390183, 23.031488], [120.39231044444443, 23.02665777777778], [120.39443788888889, 23.021827555555554], [120.39656533333333, 23.016997333333332], [120.39869277777777, 23.01216711111111], [120.40082022222222, 23.007336888888887], [120.40294766666666, 23.002506666666665], [120.4050751111111, 22.997676444444444], [120.40720255555556, 22.99284622222222], [120.40933, 22.988016], [120.41261366666666, 22.988056999999998], [120.41589733333333, 22.988097999999997], [120.419181, 22.988139], [120.42246466666667, 22.98818], [120.42574833333333, 22.988221], [120.429032, 22.988262], [120.43231566666667, 22.988303000000002], [120.43559933333334, 22.988344], [120.438883, 22.988385], [120.43717988888889, 22.996152111111112], [120.43547677777778, 23.003919222222223], [120.43377366666667, 23.011686333333333], [120.43207055555555, 23.019453444444444], [120.43036744444444, 23.027220555555555], [120.42866433333333, 23.034987666666666], [120.42696122222222, 23.042754777777777], [120.4252581111111, 23.050521888888888], [120.423555, 23.058289], [120.4219391111111, 23.059097777777776], [120.42032322222222, 23.059906555555553], [120.41870733333333, 23.06071533333333], [120.41709144444444, 23.06152411111111], [120.41547555555556, 23.06233288888889], [120.41385966666667, 23.063141666666667], [120.41224377777777, 23.063950444444444], [120.4106278888889, 23.06475922222222], [120.409012, 23.065568], [120.40744455555556, 23.06617711111111], [120.40587711111111, 23.06678622222222], [120.40430966666666, 23.067395333333334], [120.40274222222222, 23.068004444444444], [120.40117477777778, 23.068613555555554], [120.39960733333334, 23.069222666666665], [120.39803988888889, 23.06983177777778], [120.39647244444444, 23.07044088888889], [120.394905, 23.07105], [120.39438033333333, 23.066654222222223], [120.39385566666667, 23.062258444444446], [120.39333099999999, 23.057862666666665], [120.39280633333333, 23.053466888888888], [120.39228166666666, 23.04907111111111], [120.391757, 23.044675333333334], [120.39123233333332, 23.040279555555554], [120.39070766666666, 23.035883777777777], [120.390183, 23.031488]]], "type": "Polygon"}, "id": "9", "properties": {"name": "\u5de6\u93ae\u5340"}, "type": "Feature"}, {"bbox": [120.2316208, 22.998426, 120.279232, 23.057647], "geometry": {"coordinates": [[[120.231944, 23.003112], [120.23254511111111, 23.00279888888889], [120.23314622222222, 23.00248577777778], [120.23374733333333, 23.002172666666667], [120.23434844444444, 23.001859555555555], [120.23494955555556, 23.001546444444447], [120.23555066666667, 23.001233333333335], [120.23615177777778, 23.000920222222224], [120.23675288888889, 23.000607111111112], [120.237354, 23.000294], [120.238012, 23.000086444444445], [120.23867, 22.99987888888889], [120.239328, 22.999671333333332], [120.239986, 22.999463777777777], [120.24064399999999, 22.999256222222222], [120.24130199999999, 22.999048666666667], [120.24195999999999, 22.99884111111111], [120.242618, 22.998633555555553], [120.243276, 22.998426], [120.24612122222221, 22.998586888888887], [120.24896644444443, 22.998747777777776], [120.25181166666667, 22.998908666666665], [120.25465688888889, 22.999069555555554], [120.25750211111111, 22.999230444444443], [120.26034733333333, 22.99939133333333], [120.26319255555556, 22.99955222222222], [120.26603777777778, 22.99971311111111], [120.268883, 22.999874], [120.2699638888889, 23.001837444444444], [120.27104477777777, 23.003800888888886], [120.27212566666667, 23.00576433333333], [120.27320655555556, 23.007727777777777], [120.27428744444444, 23.00969122222222], [120.27536833333333, 23.011654666666665], [120.27644922222223, 23.01361811111111], [120.2775301111111, 23.015581555555553], [120.278611, 23.017545], [120.27868, 23.01865311111111], [120.27874899999999, 23.019761222222222], [120.278818, 23.020869333333334], [120.278887, 23.021977444444445], [120.278956, 23.023085555555554], [120.27902499999999, 23.024193666666665], [120.279094, 23.025301777777777], [120.279163, 23.02640988888889], [120.279232, 23.027518], [120.27891755555555, 23.029352666666668], [120.27860311111111, 23.031187333333335], [120.27828866666667, 23.033022], [120.27797422222223, 23.034856666666666], [120.27765977777777, 23.036691333333334], [120.27734533333333, 23.038526], [120.27703088888889, 23.040360666666665], [120.27671644444445, 23.042195333333332], [120.276402, 23.04403], [120.27444655555556, 23.045543], [120.27249111111111, 23.047055999999998], [120.27053566666667, 23.048569], [120.26858022222223, 23.050082], [120.26662477777778, 23.051595], [120.26466933333333, 23.053107999999998], [120.2627138888889, 23.054621], [120.26075844444445, 23.056134], [120.258803, 23.057647], [120.25578275555556, 23.056023888888888], [120.25276251111111, 23.054400777777776], [120.24974226666667, 23.052777666666667], [120.24672202222223, 23.051154555555556], [120.24370177777777, 23.049531444444444], [120.24068153333333, 23.047908333333332], [120.23766128888889, 23.046285222222224], [120.23464104444444, 23.044662111111112], [120.2316208, 23.043039], [120.23165671111111, 23.038602666666666], [120.23169262222223, 23.034166333333335], [120.23172853333334, 23.02973], [120.23176444444445, 23.025293666666666], [120.23180035555555, 23.020857333333336], [120.23183626666666, 23.016421], [120.23187217777777, 23.011984666666667], [120.23190808888889, 23.007548333333336], [120.231944, 23.003112]]], "type": "Polygon"}, "id": "10", "properties": {"name": "\u6c38\u5eb7\u5340"}, "type": "Feature"}, {"bbox": [120.431218, 23.083249, 120.496062, 23.151389], "geometry": {"coordinates": [[[120.431218, 23.083249], [120.4384228888889, 23.084576888888886], [120.44562777777777, 23.085904777777777], [120.45283266666667, 23.087232666666665], [120.46003755555556, 23.088560555555553], [120.46724244444444, 23.089888444444444], [120.47444733333333, 23.091216333333332], [120.48165222222222, 23.09254422222222], [120.4888571111111, 23.09387211111111], [120.496062, 23.0952], [120.49597955555555, 23.097516555555554], [120.4958971111111, 23.09983311111111], [120.49581466666666, 23.102149666666666], [120.49573222222222, 23.10446622222222], [120.49564977777779, 23.106782777777777], [120.49556733333334, 23.109099333333333], [120.4954848888889, 23.11141588888889], [120.49540244444445, 23.113732444444445], [120.49532, 23.116049], [120.4919538888889, 23.11961488888889], [120.48858777777778, 23.12318077777778], [120.48522166666667, 23.126746666666666], [120.48185555555555, 23.130312555555555], [120.47848944444445, 23.133878444444445], [120.47512333333333, 23.137444333333335], [120.47175722222222, 23.14101022222222], [120.4683911111111, 23.14457611111111], [120.465025, 23.148142], [120.46316922222222, 23.14850277777778], [120.46131344444444, 23.148863555555558], [120.45945766666667, 23.149224333333333], [120.45760188888889, 23.14958511111111], [120.45574611111111, 23.14994588888889], [120.45389033333333, 23.15030666666667], [120.45203455555556, 23.150667444444444], [120.45017877777778, 23.151028222222223], [120.448323, 23.151389], [120.44642244444445, 23.14381788888889], [120.44452188888889, 23.136246777777778], [120.44262133333334, 23.128675666666666], [120.44072077777778, 23.121104555555554], [120.43882022222222, 23.113533444444446], [120.43691966666667, 23.105962333333334], [120.43501911111112, 23.098391222222222], [120.43311855555555, 23.09082011111111], [120.431218, 23.083249]]], "type": "Polygon"}, "id": "11", "properties": {"name": "\u7389\u4e95\u5340"}, "type": "Feature"}, {"bbox": [120.404178, 23.314358, 120.507384, 23.402224], "geometry": {"coordinates": [[[120.424718, 23.327221], [120.42882422222222, 23.32579177777778], [120.43293044444444, 23.324362555555556], [120.43703666666667, 23.322933333333335], [120.44114288888889, 23.32150411111111], [120.44524911111111, 23.32007488888889], [120.44935533333333, 23.318645666666665], [120.45346155555556, 23.317216444444444], [120.45756777777778, 23.31578722222222], [120.461674, 23.314358], [120.46675288888889, 23.314621555555554], [120.47183177777778, 23.31488511111111], [120.47691066666667, 23.315148666666666], [120.48198955555556, 23.31541222222222], [120.48706844444445, 23.315675777777777], [120.49214733333334, 23.315939333333333], [120.49722622222222, 23.31620288888889], [120.50230511111111, 23.316466444444444], [120.507384, 23.31673], [120.50391, 23.323848444444444], [120.50043600000001, 23.330966888888888], [120.496962, 23.338085333333332], [120.493488, 23.345203777777776], [120.490014, 23.352322222222224], [120.48654, 23.359440666666668], [120.483066, 23.366559111111112], [120.479592, 23.373677555555556], [120.476118, 23.380796], [120.47262555555555, 23.38317688888889], [120.4691331111111, 23.385557777777777], [120.46564066666667, 23.387938666666667], [120.46214822222223, 23.390319555555557], [120.45865577777778, 23.392700444444444], [120.45516333333333, 23.395081333333334], [120.4516708888889, 23.397462222222224], [120.44817844444445, 23.39984311111111], [120.444686, 23.402224], [120.44018511111112, 23.40175211111111], [120.43568422222222, 23.401280222222223], [120.43118333333334, 23.400808333333334], [120.42668244444445, 23.400336444444445], [120.42218155555555, 23.399864555555556], [120.41768066666667, 23.399392666666667], [120.41317977777778, 23.39892077777778], [120.40867888888889, 23.39844888888889], [120.404178, 23.397977], [120.40646022222222, 23.390115222222224], [120.40874244444444, 23.382253444444444], [120.41102466666666, 23.374391666666668], [120.41330688888888, 23.36652988888889], [120.41558911111112, 23.35866811111111], [120.41787133333334, 23.350806333333335], [120.42015355555556, 23.342944555555558], [120.42243577777778, 23.335082777777778], [120.424718, 23.327221]]], "type": "Polygon"}, "id": "12", "properties": {"name": "\u767d\u6cb3\u5340"}, "type": "Feature"}, {"bbox": [120.155457, 22.978405, 120.182673, 23.000435], "geometry": {"coordinates": [[[120.155457, 22.978405], [120.15691766666667, 22.978776888888888], [120.15837833333333, 22.979148777777777], [120.159839, 22.979520666666666], [120.16129966666666, 22.979892555555555], [120.16276033333334, 22.980264444444444], [120.164221, 22.980636333333333], [120.16568166666667, 22.981008222222222], [120.16714233333333, 22.98138011111111], [120.168603, 22.981752], [120.17011044444445, 22.982271555555556], [120.17161788888889, 22.982791111111112], [120.17312533333333, 22.983310666666668], [120.17463277777777, 22.983830222222224], [120.17614022222223, 22.984349777777776], [120.17764766666667, 22.984869333333332], [120.17915511111111, 22.985388888888888], [120.18066255555556, 22.985908444444444], [120.18217, 22.986428], [120.1822258888889, 22.987216], [120.18228177777777, 22.988004], [120.18233766666667, 22.988792], [120.18239355555555, 22.98958], [120.18244944444444, 22.990368], [120.18250533333332, 22.991156], [120.18256122222222, 22.991944], [120.1826171111111, 22.992732], [120.182673, 22.99352], [120.18207088888889, 22.994172], [120.18146877777778, 22.994824], [120.18086666666666, 22.995476], [120.18026455555555, 22.996128], [120.17966244444445, 22.99678], [120.17906033333334, 22.997432], [120.17845822222222, 22.998084], [120.17785611111111, 22.998736], [120.177254, 22.999388], [120.17554156666667, 22.999504333333334], [120.17382913333334, 22.999620666666665], [120.1721167, 22.999737], [120.17040426666667, 22.999853333333334], [120.16869183333334, 22.999969666666665], [120.1669794, 23.000086], [120.16526696666666, 23.000202333333334], [120.16355453333334, 23.000318666666665], [120.1618421, 23.000435], [120.16113264444445, 22.99798722222222], [120.16042318888888, 22.995539444444443], [120.15971373333333, 22.993091666666665], [120.15900427777778, 22.990643888888886], [120.15829482222222, 22.98819611111111], [120.15758536666667, 22.985748333333333], [120.15687591111111, 22.983300555555555], [120.15616645555555, 22.980852777777777], [120.155457, 22.978405]]], "type": "Polygon"}, "id": "13", "properties": {"name": "\u5b89\u5e73\u5340"}, "type": "Feature"}, {"bbox": [120.207823, 23.074512, 120.259701, 23.124227], "geometry": {"coordinates": [[[120.207823, 23.074512], [120.21078666666666, 23.075865], [120.21375033333334, 23.077218], [120.216714, 23.078571], [120.21967766666667, 23.079924], [120.22264133333333, 23.081277], [120.225605, 23.082629999999998], [120.22856866666666, 23.083983], [120.23153233333333, 23.085335999999998], [120.234496, 23.086689], [120.2354731111111, 23.087658], [120.23645022222222, 23.088627], [120.23742733333333, 23.089596], [120.23840444444444, 23.090565], [120.23938155555555, 23.091534], [120.24035866666667, 23.092503], [120.24133577777778, 23.093472000000002], [120.24231288888889, 23.094441], [120.24329, 23.09541], [120.24511344444444, 23.098323333333333], [120.2469368888889, 23.10123666666667], [120.24876033333334, 23.10415], [120.25058377777778, 23.107063333333333], [120.25240722222223, 23.109976666666668], [120.25423066666667, 23.11289], [120.25605411111111, 23.115803333333332], [120.25787755555557, 23.118716666666668], [120.259701, 23.12163], [120.25834455555557, 23.121918555555556], [120.25698811111111, 23.122207111111113], [120.25563166666667, 23.122495666666666], [120.25427522222223, 23.122784222222222], [120.25291877777778, 23.12307277777778], [120.25156233333334, 23.123361333333335], [120.2502058888889, 23.123649888888888], [120.24884944444445, 23.123938444444445], [120.247493, 23.124227], [120.24310524444445, 23.122541444444444], [120.2387174888889, 23.12085588888889], [120.23432973333334, 23.119170333333333], [120.22994197777778, 23.11748477777778], [120.22555422222221, 23.115799222222222], [120.22116646666666, 23.114113666666668], [120.2167787111111, 23.11242811111111], [120.21239095555555, 23.110742555555557], [120.2080032, 23.109057], [120.20798317777778, 23.105218666666666], [120.20796315555555, 23.10138033333333], [120.20794313333333, 23.097542], [120.20792311111111, 23.093703666666666], [120.20790308888888, 23.089865333333332], [120.20788306666667, 23.086026999999998], [120.20786304444445, 23.082188666666667], [120.20784302222222, 23.078350333333333], [120.207823, 23.074512]]], "type": "Polygon"}, "id": "14", "properties": {"name": "\u5b89\u5b9a\u5340"}, "type": "Feature"}, {"bbox": [120.106087, 23.010616, 120.235615, 23.079416], "geometry": {"coordinates": [[[120.126119, 23.013544], [120.130332, 23.013218666666667], [120.134545, 23.012893333333334], [120.138758, 23.012567999999998], [120.142971, 23.012242666666666], [120.147184, 23.011917333333333], [120.151397, 23.011592], [120.15561, 23.011266666666664], [120.159823, 23.01094133333333], [120.164036, 23.010616], [120.16946166666666, 23.012352444444442], [120.17488733333333, 23.01408888888889], [120.180313, 23.015825333333332], [120.18573866666667, 23.017561777777775], [120.19116433333333, 23.019298222222222], [120.19659, 23.021034666666665], [120.20201566666667, 23.02277111111111], [120.20744133333334, 23.024507555555555], [120.212867, 23.026244], [120.21352355555555, 23.02686033333333], [120.21418011111112, 23.027476666666665], [120.21483666666667, 23.028093], [120.21549322222222, 23.02870933333333], [120.21614977777779, 23.029325666666665], [120.21680633333334, 23.029942], [120.21746288888889, 23.03055833333333], [120.21811944444445, 23.031174666666665], [120.218776, 23.031791], [120.220647, 23.034696777777775], [120.22251800000001, 23.037602555555555], [120.224389, 23.04050833333333], [120.22626, 23.04341411111111], [120.228131, 23.04631988888889], [120.230002, 23.04922566666667], [120.231873, 23.052131444444445], [120.233744, 23.055037222222225], [120.235615, 23.057943], [120.23388187777778, 23.05964711111111], [120.23214875555556, 23.061351222222225], [120.23041563333334, 23.063055333333335], [120.22868251111112, 23.064759444444444], [120.22694938888888, 23.066463555555558], [120.22521626666666, 23.068167666666668], [120.22348314444444, 23.069871777777777], [120.22175002222222, 23.07157588888889], [120.2200169, 23.07328], [120.21762891111112, 23.07373777777778], [120.21524092222222, 23.074195555555555], [120.21285293333334, 23.074653333333334], [120.21046494444445, 23.075111111111113], [120.20807695555555, 23.07556888888889], [120.20568896666667, 23.076026666666667], [120.20330097777779, 23.076484444444446], [120.20091298888889, 23.076942222222222], [120.198525, 23.0774], [120.19026133333334, 23.077624], [120.18199766666667, 23.077848], [120.173734, 23.078072], [120.16547033333333, 23.078295999999998], [120.15720666666667, 23.07852], [120.148943, 23.078744], [120.14067933333332, 23.078968], [120.13241566666666, 23.079192], [120.124152, 23.079416], [120.12214477777778, 23.078754555555555], [120.12013755555556, 23.07809311111111], [120.11813033333333, 23.077431666666666], [120.11612311111111, 23.076770222222223], [120.11411588888889, 23.076108777777776], [120.11210866666667, 23.075447333333333], [120.11010144444444, 23.07478588888889], [120.10809422222222, 23.074124444444443], [120.106087, 23.073463], [120.10831277777778, 23.066805333333335], [120.11053855555556, 23.060147666666666], [120.11276433333333, 23.05349], [120.11499011111111, 23.046832333333334], [120.1172158888889, 23.040174666666665], [120.11944166666667, 23.033517], [120.12166744444444, 23.026859333333334], [120.12389322222222, 23.020201666666665], [120.126119, 23.013544]]], "type": "Polygon"}, "id": "15", "properties": {"name": "\u5b89\u5357\u5340"}, "type": "Feature"}, {"bbox": [120.177896, 23.094541, 120.230522, 23.153723], "geometry": {"coordinates": [[[120.177896, 23.094541], [120.17985977777778, 23.095689888888888], [120.18182355555555, 23.096838777777776], [120.18378733333334, 23.097987666666665], [120.18575111111112, 23.099136555555553], [120.18771488888889, 23.100285444444445], [120.18967866666667, 23.101434333333334], [120.19164244444445, 23.102583222222222], [120.19360622222223, 23.10373211111111], [120.19557, 23.104881], [120.19798633333333, 23.106801555555556], [120.20040266666666, 23.10872211111111], [120.202819, 23.110642666666667], [120.20523533333333, 23.11256322222222], [120.20765166666666, 23.114483777777778], [120.21006799999999, 23.116404333333332], [120.21248433333334, 23.11832488888889], [120.21490066666667, 23.120245444444443], [120.217317, 23.122166], [120.21878422222221, 23.123583888888888], [120.22025144444444, 23.12500177777778], [120.22171866666666, 23.126419666666667], [120.22318588888888, 23.127837555555555], [120.22465311111111, 23.129255444444446], [120.22612033333333, 23.130673333333334], [120.22758755555554, 23.132091222222222], [120.22905477777778, 23.133509111111113], [120.230522, 23.134927], [120.22760322222221, 23.137015444444444], [120.22468444444443, 23.13910388888889], [120.22176566666666, 23.141192333333333], [120.21884688888888, 23.14328077777778], [120.21592811111111, 23.14536922222222], [120.21300933333333, 23.147457666666668], [120.21009055555555, 23.14954611111111], [120.20717177777777, 23.151634555555557], [120.204253, 23.153723], [120.20132444444444, 23.151052222222223], [120.19839588888888, 23.148381444444443], [120.19546733333333, 23.145710666666666], [120.19253877777777, 23.14303988888889], [120.18961022222223, 23.14036911111111], [120.18668166666667, 23.137698333333333], [120.18375311111112, 23.135027555555556], [120.18082455555556, 23.132356777777776], [120.177896, 23.129686], [120.177896, 23.125781], [120.177896, 23.121876], [120.177896, 23.117971], [120.177896, 23.114066], [120.177896, 23.110160999999998], [120.177896, 23.106256], [120.177896, 23.102351], [120.177896, 23.098446], [120.177896, 23.094541]]], "type": "Polygon"}, "id": "16", "properties": {"name": "\u897f\u6e2f\u5340"}, "type": "Feature"}, {"bbox": [120.16937, 23.149236, 120.2123559, 23.190347], "geometry": {"coordinates": [[[120.16937, 23.150825], [120.17129688888889, 23.150648444444446], [120.17322377777778, 23.15047188888889], [120.17515066666667, 23.150295333333332], [120.17707755555556, 23.150118777777777], [120.17900444444444, 23.149942222222222], [120.18093133333333, 23.149765666666667], [120.18285822222222, 23.14958911111111], [120.18478511111111, 23.149412555555553], [120.186712, 23.149236], [120.18892655555555, 23.151804777777777], [120.19114111111111, 23.154373555555555], [120.19335566666666, 23.156942333333333], [120.19557022222222, 23.15951111111111], [120.19778477777778, 23.162079888888886], [120.19999933333334, 23.164648666666665], [120.20221388888889, 23.167217444444443], [120.20442844444445, 23.16978622222222], [120.206643, 23.172355], [120.20727776666666, 23.174133444444443], [120.20791253333333, 23.175911888888887], [120.2085473, 23.177690333333334], [120.20918206666667, 23.179468777777778], [120.20981683333333, 23.181247222222222], [120.2104516, 23.183025666666666], [120.21108636666668, 23.184804111111113], [120.21172113333334, 23.186582555555557], [120.2123559, 23.188361], [120.21083346666667, 23.188581666666668], [120.20931103333334, 23.188802333333335], [120.2077886, 23.189023], [120.20626616666667, 23.189243666666666], [120.20474373333334, 23.189464333333333], [120.20322130000001, 23.189685], [120.20169886666667, 23.189905666666665], [120.20017643333334, 23.190126333333332], [120.198654, 23.190347], [120.19540022222223, 23.185955666666665], [120.19214644444445, 23.181564333333334], [120.18889266666667, 23.177173], [120.18563888888889, 23.172781666666666], [120.18238511111112, 23.168390333333335], [120.17913133333333, 23.163999], [120.17587755555556, 23.159607666666666], [120.17262377777777, 23.155216333333335], [120.16937, 23.150825]]], "type": "Polygon"}, "id": "17", "properties": {"name": "\u4f73\u91cc\u5340"}, "type": "Feature"}, {"bbox": [120.303493, 23.174473, 120.39196, 23.215263], "geometry": {"coordinates": [[[120.3266762, 23.174473], [120.33112628888888, 23.17458611111111], [120.33557637777777, 23.174699222222223], [120.34002646666666, 23.174812333333332], [120.34447655555554, 23.174925444444444], [120.34892664444445, 23.175038555555556], [120.35337673333333, 23.175151666666668], [120.35782682222222, 23.175264777777777], [120.36227691111111, 23.17537788888889], [120.366727, 23.175491], [120.36953066666666, 23.176570666666667], [120.37233433333333, 23.177650333333332], [120.37513799999999, 23.17873], [120.37794166666666, 23.179809666666667], [120.38074533333334, 23.180889333333333], [120.383549, 23.181969], [120.38635266666667, 23.183048666666668], [120.38915633333333, 23.184128333333334], [120.39196, 23.185208], [120.3864402, 23.187862], [120.3809204, 23.190516], [120.37540059999999, 23.19317], [120.36988079999999, 23.195823999999998], [120.364361, 23.198478], [120.3588412, 23.201132], [120.3533214, 23.203786], [120.3478016, 23.20644], [120.3422818, 23.209094], [120.34112771111111, 23.209340666666666], [120.33997362222222, 23.209587333333335], [120.33881953333334, 23.209834], [120.33766544444444, 23.210080666666666], [120.33651135555556, 23.210327333333336], [120.33535726666666, 23.210574], [120.33420317777778, 23.210820666666667], [120.33304908888888, 23.211067333333336], [120.331895, 23.211314], [120.32873922222223, 23.21175277777778], [120.32558344444445, 23.212191555555556], [120.32242766666667, 23.212630333333333], [120.31927188888889, 23.21306911111111], [120.31611611111111, 23.21350788888889], [120.31296033333334, 23.21394666666667], [120.30980455555556, 23.214385444444446], [120.30664877777778, 23.214824222222223], [120.303493, 23.215263], [120.30606891111111, 23.210730777777776], [120.30864482222222, 23.206198555555556], [120.31122073333333, 23.201666333333332], [120.31379664444444, 23.19713411111111], [120.31637255555556, 23.192601888888888], [120.31894846666667, 23.188069666666667], [120.32152437777778, 23.183537444444443], [120.32410028888889, 23.179005222222223], [120.3266762, 23.174473]]], "type": "Polygon"}, "id": "18", "properties": {"name": "\u5b98\u7530\u5340"}, "type": "Feature"}, {"bbox": [120.382807, 23.247802, 120.492441, 23.330903], "geometry": {"coordinates": [[[120.403492, 23.271977], [120.40700555555556, 23.270095666666666], [120.41051911111111, 23.268214333333333], [120.41403266666667, 23.266333], [120.41754622222223, 23.264451666666666], [120.42105977777777, 23.262570333333333], [120.42457333333333, 23.260689], [120.42808688888888, 23.258807666666666], [120.43160044444444, 23.256926333333332], [120.435114, 23.255045], [120.44092455555555, 23.254240222222222], [120.44673511111111, 23.253435444444445], [120.45254566666667, 23.252630666666665], [120.45835622222222, 23.251825888888888], [120.46416677777778, 23.25102111111111], [120.46997733333333, 23.250216333333334], [120.47578788888889, 23.249411555555554], [120.48159844444444, 23.248606777777777], [120.487409, 23.247802], [120.48796811111112, 23.25239311111111], [120.48852722222222, 23.256984222222222], [120.48908633333333, 23.261575333333333], [120.48964544444445, 23.266166444444444], [120.49020455555555, 23.270757555555555], [120.49076366666667, 23.275348666666666], [120.49132277777778, 23.279939777777777], [120.49188188888888, 23.284530888888888], [120.492441, 23.289122], [120.48349877777778, 23.293262666666667], [120.47455655555555, 23.29740333333333], [120.46561433333333, 23.301544], [120.45667211111112, 23.305684666666668], [120.44772988888889, 23.309825333333333], [120.43878766666667, 23.313966], [120.42984544444445, 23.31810666666667], [120.42090322222222, 23.322247333333333], [120.411961, 23.326388], [120.41062244444444, 23.326889666666666], [120.4092838888889, 23.327391333333335], [120.40794533333333, 23.327893], [120.40660677777778, 23.328394666666668], [120.40526822222222, 23.328896333333333], [120.40392966666667, 23.329398], [120.40259111111111, 23.329899666666666], [120.40125255555556, 23.330401333333334], [120.399914, 23.330903], [120.39801322222222, 23.330058777777776], [120.39611244444444, 23.329214555555556], [120.39421166666666, 23.328370333333332], [120.39231088888889, 23.327526111111112], [120.39041011111111, 23.32668188888889], [120.38850933333333, 23.32583766666667], [120.38660855555555, 23.324993444444445], [120.38470777777778, 23.324149222222225], [120.382807, 23.323305], [120.38510533333333, 23.31760188888889], [120.38740366666667, 23.311898777777778], [120.389702, 23.306195666666667], [120.39200033333333, 23.300492555555557], [120.39429866666667, 23.294789444444444], [120.396597, 23.289086333333334], [120.39889533333333, 23.283383222222223], [120.40119366666667, 23.27768011111111], [120.403492, 23.271977]]], "type": "Polygon"}, "id": "19", "properties": {"name": "\u6771\u5c71\u5340"}, "type": "Feature"}, {"bbox": [120.213612, 22.962199, 120.245548, 22.997695], "geometry": {"coordinates": [[[120.213612, 22.980104], [120.21383755555556, 22.97951011111111], [120.21406311111112, 22.97891622222222], [120.21428866666666, 22.978322333333335], [120.21451422222222, 22.977728444444445], [120.21473977777778, 22.977134555555555], [120.21496533333334, 22.976540666666665], [120.21519088888888, 22.97594677777778], [120.21541644444444, 22.97535288888889], [120.215642, 22.974759], [120.21648, 22.973363444444445], [120.217318, 22.971967888888887], [120.21815600000001, 22.970572333333333], [120.21899400000001, 22.969176777777776], [120.219832, 22.96778122222222], [120.22067, 22.966385666666664], [120.221508, 22.96499011111111], [120.222346, 22.963594555555552], [120.223184, 22.962199], [120.22430377777778, 22.962307777777777], [120.22542355555555, 22.962416555555553], [120.22654333333334, 22.962525333333332], [120.22766311111111, 22.96263411111111], [120.22878288888889, 22.962742888888886], [120.22990266666666, 22.962851666666666], [120.23102244444445, 22.962960444444445], [120.23214222222222, 22.96306922222222], [120.233262, 22.963178], [120.23348033333333, 22.963459], [120.23369866666667, 22.963739999999998], [120.23391699999999, 22.964021], [120.23413533333333, 22.964302], [120.23435366666666, 22.964582999999998], [120.234572, 22.964864], [120.23479033333332, 22.965145], [120.23500866666666, 22.965425999999997], [120.235227, 22.965707], [120.23637377777777, 22.967212555555555], [120.23752055555555, 22.96871811111111], [120.23866733333332, 22.970223666666666], [120.2398141111111, 22.971729222222223], [120.24096088888889, 22.973234777777776], [120.24210766666667, 22.974740333333333], [120.24325444444445, 22.97624588888889], [120.24440122222222, 22.977751444444444], [120.245548, 22.979257], [120.245084, 22.98084411111111], [120.24462, 22.98243122222222], [120.244156, 22.984018333333335], [120.243692, 22.985605444444445], [120.243228, 22.987192555555556], [120.242764, 22.988779666666666], [120.2423, 22.99036677777778], [120.24183599999999, 22.99195388888889], [120.241372, 22.993541], [120.240338, 22.993935333333333], [120.239304, 22.994329666666665], [120.23827, 22.994724], [120.237236, 22.995118333333334], [120.236202, 22.995512666666666], [120.235168, 22.995907], [120.234134, 22.996301333333335], [120.23310000000001, 22.996695666666668], [120.232066, 22.99709], [120.23166466666667, 22.99715722222222], [120.23126333333333, 22.997224444444445], [120.230862, 22.997291666666666], [120.23046066666667, 22.99735888888889], [120.23005933333333, 22.99742611111111], [120.229658, 22.997493333333335], [120.22925666666667, 22.997560555555555], [120.22885533333333, 22.99762777777778], [120.228454, 22.997695], [120.22697933333333, 22.997621555555554], [120.22550466666667, 22.99754811111111], [120.22403, 22.997474666666665], [120.22255533333333, 22.997401222222223], [120.22108066666667, 22.997327777777777], [120.219606, 22.997254333333334], [120.21813133333333, 22.997180888888888], [120.21665666666667, 22.997107444444445], [120.215182, 22.997034], [120.21500755555556, 22.99515288888889], [120.2148331111111, 22.993271777777778], [120.21465866666666, 22.991390666666668], [120.21448422222223, 22.989509555555557], [120.21430977777777, 22.987628444444443], [120.21413533333333, 22.985747333333332], [120.21396088888889, 22.983866222222222], [120.21378644444444, 22.98198511111111], [120.213612, 22.980104]]], "type": "Polygon"}, "id": "20", "properties": {"name": "\u6771\u5340"}, "type": "Feature"}, {"bbox": [120.459382, 23.019698, 120.599719, 23.167912], "geometry": {"coordinates": [[[120.459382, 23.030638], [120.46196577777778, 23.029422444444446], [120.46454955555556, 23.02820688888889], [120.46713333333334, 23.026991333333335], [120.46971711111111, 23.025775777777778], [120.4723008888889, 23.024560222222224], [120.47488466666667, 23.023344666666667], [120.47746844444444, 23.022129111111113], [120.48005222222223, 23.020913555555556], [120.482636, 23.019698], [120.48903411111111, 23.026949222222225], [120.49543222222222, 23.034200444444448], [120.50183033333333, 23.041451666666667], [120.50822844444444, 23.04870288888889], [120.51462655555555, 23.055954111111113], [120.52102466666666, 23.063205333333336], [120.52742277777777, 23.070456555555555], [120.53382088888888, 23.07770777777778], [120.540219, 23.084959], [120.5468301111111, 23.094176], [120.55344122222222, 23.103393], [120.56005233333333, 23.11261], [120.56666344444444, 23.121827], [120.57327455555554, 23.131044000000003], [120.57988566666666, 23.140261000000002], [120.58649677777777, 23.149478000000002], [120.59310788888888, 23.158695], [120.599719, 23.167912], [120.58419033333332, 23.15718777777778], [120.56866166666666, 23.146463555555556], [120.553133, 23.135739333333333], [120.53760433333333, 23.12501511111111], [120.52207566666667, 23.114290888888892], [120.506547, 23.10356666666667], [120.49101833333334, 23.092842444444447], [120.47548966666668, 23.082118222222224], [120.459961, 23.071394], [120.45989666666668, 23.066865555555555], [120.45983233333334, 23.062337111111113], [120.45976800000001, 23.057808666666666], [120.45970366666667, 23.053280222222224], [120.45963933333334, 23.048751777777778], [120.459575, 23.044223333333335], [120.45951066666667, 23.03969488888889], [120.45944633333333, 23.035166444444446], [120.459382, 23.030638]]], "type": "Polygon"}, "id": "21", "properties": {"name": "\u5357\u5316\u5340"}, "type": "Feature"}, {"bbox": [120.179462, 22.917993, 120.210506, 22.986781], "geometry": {"coordinates": [[[120.179462, 22.917993], [120.18038622222223, 22.918485333333333], [120.18131044444445, 22.918977666666667], [120.18223466666667, 22.91947], [120.1831588888889, 22.919962333333334], [120.18408311111111, 22.920454666666664], [120.18500733333333, 22.920946999999998], [120.18593155555556, 22.921439333333332], [120.18685577777778, 22.921931666666666], [120.18778, 22.922424], [120.19005944444444, 22.926261333333333], [120.1923388888889, 22.930098666666666], [120.19461833333334, 22.933936], [120.19689777777778, 22.937773333333332], [120.19917722222223, 22.941610666666666], [120.20145666666667, 22.945448], [120.20373611111111, 22.949285333333332], [120.20601555555557, 22.953122666666665], [120.208295, 22.95696], [120.20848355555556, 22.95844988888889], [120.20867211111111, 22.959939777777777], [120.20886066666667, 22.961429666666668], [120.20904922222222, 22.962919555555555], [120.20923777777779, 22.964409444444446], [120.20942633333334, 22.965899333333333], [120.2096148888889, 22.967389222222224], [120.20980344444445, 22.96887911111111], [120.209992, 22.970369], [120.2100491111111, 22.971172000000003], [120.21010622222222, 22.971975], [120.21016333333333, 22.972778], [120.21022044444445, 22.973581], [120.21027755555555, 22.974384], [120.21033466666667, 22.975187], [120.21039177777777, 22.97599], [120.21044888888889, 22.976792999999997], [120.210506, 22.977596], [120.20892111111111, 22.978427888888888], [120.20733622222222, 22.979259777777777], [120.20575133333332, 22.980091666666667], [120.20416644444444, 22.980923555555556], [120.20258155555555, 22.981755444444442], [120.20099666666667, 22.98258733333333], [120.19941177777777, 22.98341922222222], [120.19782688888888, 22.98425111111111], [120.196242, 22.985083], [120.19546388888888, 22.985271666666666], [120.19468577777778, 22.985460333333332], [120.19390766666666, 22.985649], [120.19312955555556, 22.985837666666665], [120.19235144444444, 22.986026333333335], [120.19157333333334, 22.986215], [120.19079522222222, 22.986403666666668], [120.19001711111112, 22.986592333333334], [120.189239, 22.986781], [120.18889322222222, 22.98643911111111], [120.18854744444444, 22.986097222222224], [120.18820166666667, 22.985755333333334], [120.18785588888889, 22.985413444444443], [120.18751011111111, 22.985071555555557], [120.18716433333333, 22.984729666666667], [120.18681855555556, 22.984387777777776], [120.18647277777778, 22.98404588888889], [120.186127, 22.983704], [120.18538644444445, 22.97640277777778], [120.1846458888889, 22.969101555555554], [120.18390533333333, 22.961800333333333], [120.18316477777778, 22.95449911111111], [120.18242422222222, 22.947197888888887], [120.18168366666667, 22.939896666666666], [120.1809431111111, 22.932595444444445], [120.18020255555555, 22.92529422222222], [120.179462, 22.917993]]], "type": "Polygon"}, "id": "22", "properties": {"name": "\u5357\u5340"}, "type": "Feature"}, {"bbox": [120.305934, 23.324705, 120.393017, 23.387566], "geometry": {"coordinates": [[[120.305934, 23.345694], [120.31100244444444, 23.34336188888889], [120.31607088888889, 23.34102977777778], [120.32113933333333, 23.33869766666667], [120.32620777777778, 23.336365555555556], [120.33127622222221, 23.334033444444447], [120.33634466666666, 23.331701333333335], [120.34141311111111, 23.329369222222223], [120.34648155555556, 23.327037111111114], [120.35155, 23.324705], [120.35266044444445, 23.325825222222225], [120.35377088888889, 23.326945444444444], [120.35488133333334, 23.328065666666667], [120.35599177777777, 23.32918588888889], [120.35710222222222, 23.33030611111111], [120.35821266666666, 23.331426333333333], [120.35932311111111, 23.332546555555556], [120.36043355555555, 23.333666777777776], [120.361544, 23.334787], [120.36504099999999, 23.33945044444444], [120.368538, 23.344113888888888], [120.372035, 23.34877733333333], [120.37553199999999, 23.353440777777777], [120.379029, 23.35810422222222], [120.382526, 23.362767666666667], [120.386023, 23.36743111111111], [120.38952, 23.372094555555556], [120.393017, 23.376758], [120.39019013333333, 23.377958888888887], [120.38736326666667, 23.379159777777776], [120.3845364, 23.380360666666665], [120.38170953333334, 23.381561555555553], [120.37888266666667, 23.382762444444445], [120.3760558, 23.383963333333334], [120.37322893333334, 23.385164222222222], [120.37040206666667, 23.38636511111111], [120.3675752, 23.387566], [120.36263851111111, 23.386802777777778], [120.35770182222223, 23.386039555555556], [120.35276513333334, 23.385276333333334], [120.34782844444445, 23.38451311111111], [120.34289175555556, 23.38374988888889], [120.33795506666667, 23.382986666666667], [120.33301837777778, 23.382223444444445], [120.32808168888889, 23.381460222222223], [120.323145, 23.380697], [120.32123266666666, 23.376807777777778], [120.31932033333332, 23.372918555555557], [120.317408, 23.369029333333334], [120.31549566666666, 23.365140111111113], [120.31358333333333, 23.36125088888889], [120.31167099999999, 23.35736166666667], [120.30975866666667, 23.353472444444446], [120.30784633333333, 23.349583222222225], [120.305934, 23.345694]]], "type": "Polygon"}, "id": "23", "properties": {"name": "\u5f8c\u58c1\u5340"}, "type": "Feature"}, {"bbox": [120.306042, 23.252932, 120.401198, 23.29468], "geometry": {"coordinates": [[[120.354304, 23.256486], [120.35614211111111, 23.25609111111111], [120.35798022222222, 23.255696222222223], [120.35981833333334, 23.255301333333332], [120.36165644444445, 23.254906444444444], [120.36349455555555, 23.254511555555556], [120.36533266666666, 23.25411666666667], [120.36717077777777, 23.253721777777777], [120.36900888888889, 23.25332688888889], [120.370847, 23.252932], [120.37421933333333, 23.25375088888889], [120.37759166666666, 23.25456977777778], [120.38096399999999, 23.25538866666667], [120.38433633333332, 23.256207555555555], [120.38770866666667, 23.257026444444445], [120.391081, 23.257845333333332], [120.39445333333333, 23.258664222222222], [120.39782566666666, 23.25948311111111], [120.401198, 23.260302], [120.39808544444443, 23.26336811111111], [120.39497288888889, 23.266434222222223], [120.39186033333333, 23.269500333333333], [120.38874777777778, 23.272566444444443], [120.38563522222222, 23.275632555555557], [120.38252266666667, 23.278698666666667], [120.37941011111111, 23.281764777777777], [120.37629755555557, 23.28483088888889], [120.373185, 23.287897], [120.3712458888889, 23.28865066666667], [120.36930677777778, 23.289404333333334], [120.36736766666667, 23.290158], [120.36542855555555, 23.290911666666666], [120.36348944444445, 23.291665333333334], [120.36155033333334, 23.292419], [120.35961122222223, 23.293172666666667], [120.35767211111111, 23.29392633333333], [120.355733, 23.29468], [120.35021177777777, 23.293863777777776], [120.34469055555556, 23.293047555555557], [120.33916933333333, 23.292231333333334], [120.33364811111112, 23.29141511111111], [120.32812688888889, 23.29059888888889], [120.32260566666668, 23.289782666666667], [120.31708444444445, 23.288966444444444], [120.31156322222223, 23.288150222222225], [120.306042, 23.287334], [120.31140444444445, 23.283906444444444], [120.31676688888889, 23.28047888888889], [120.32212933333334, 23.277051333333333], [120.32749177777778, 23.27362377777778], [120.33285422222222, 23.27019622222222], [120.33821666666667, 23.266768666666668], [120.34357911111111, 23.26334111111111], [120.34894155555556, 23.259913555555556], [120.354304, 23.256486]]], "type": "Polygon"}, "id": "24", "properties": {"name": "\u67f3\u71df\u5340"}, "type": "Feature"}, {"bbox": [120.088085, 23.188436, 120.163404, 23.224189], "geometry": {"coordinates": [[[120.088085, 23.188436], [120.09645377777778, 23.188772444444442], [120.10482255555556, 23.18910888888889], [120.11319133333333, 23.18944533333333], [120.12156011111111, 23.189781777777778], [120.1299288888889, 23.19011822222222], [120.13829766666667, 23.190454666666668], [120.14666644444445, 23.19079111111111], [120.15503522222222, 23.191127555555557], [120.163404, 23.191464], [120.16319123333334, 23.194715444444444], [120.16297846666667, 23.19796688888889], [120.1627657, 23.201218333333333], [120.16255293333333, 23.204469777777778], [120.16234016666667, 23.207721222222222], [120.1621274, 23.210972666666667], [120.16191463333332, 23.21422411111111], [120.16170186666666, 23.217475555555556], [120.1614891, 23.220727], [120.15428531111111, 23.221111666666665], [120.14708152222222, 23.221496333333334], [120.13987773333334, 23.221881], [120.13267394444445, 23.222265666666665], [120.12547015555555, 23.222650333333334], [120.11826636666666, 23.223035], [120.11106257777777, 23.223419666666665], [120.10385878888889, 23.223804333333334], [120.096655, 23.224189], [120.09570277777777, 23.220216444444443], [120.09475055555555, 23.216243888888886], [120.09379833333334, 23.212271333333334], [120.09284611111111, 23.208298777777777], [120.09189388888889, 23.20432622222222], [120.09094166666667, 23.200353666666665], [120.08998944444446, 23.196381111111112], [120.08903722222223, 23.192408555555556], [120.088085, 23.188436]]], "type": "Polygon"}, "id": "25", "properties": {"name": "\u5c07\u8ecd\u5340"}, "type": "Feature"}, {"bbox": [120.2044745, 23.10832, 120.281227, 23.212041], "geometry": {"coordinates": [[[120.2044745, 23.10832], [120.20984566666667, 23.113006888888886], [120.21521683333333, 23.117693777777777], [120.220588, 23.122380666666665], [120.22595916666667, 23.127067555555556], [120.23133033333333, 23.131754444444443], [120.2367015, 23.136441333333334], [120.24207266666667, 23.14112822222222], [120.24744383333334, 23.145815111111112], [120.252815, 23.150502], [120.2559718888889, 23.154668555555556], [120.25912877777778, 23.15883511111111], [120.26228566666667, 23.163001666666666], [120.26544255555555, 23.167168222222223], [120.26859944444445, 23.171334777777776], [120.27175633333333, 23.175501333333333], [120.27491322222222, 23.17966788888889], [120.2780701111111, 23.183834444444443], [120.281227, 23.188001], [120.27637733333333, 23.190551666666668], [120.27152766666667, 23.193102333333332], [120.266678, 23.195653], [120.26182833333333, 23.198203666666668], [120.25697866666667, 23.200754333333332], [120.252129, 23.203305], [120.24727933333332, 23.205855666666668], [120.24242966666667, 23.208406333333333], [120.23758, 23.210957], [120.234325, 23.211077444444445], [120.23107, 23.21119788888889], [120.22781499999999, 23.211318333333335], [120.22456, 23.21143877777778], [120.221305, 23.21155922222222], [120.21805, 23.211679666666665], [120.214795, 23.21180011111111], [120.21154, 23.211920555555555], [120.208285, 23.212041], [120.20786161111111, 23.200516444444442], [120.20743822222222, 23.18899188888889], [120.20701483333333, 23.177467333333333], [120.20659144444444, 23.165942777777776], [120.20616805555557, 23.154418222222223], [120.20574466666667, 23.142893666666666], [120.20532127777778, 23.13136911111111], [120.2048978888889, 23.119844555555556], [120.2044745, 23.10832]]], "type": "Polygon"}, "id": "26", "properties": {"name": "\u9ebb\u8c46\u5340"}, "type": "Feature"}, {"bbox": [120.269496, 23.11533, 120.334357, 23.164187], "geometry": {"coordinates": [[[120.272577, 23.11843], [120.27575242222223, 23.118085555555556], [120.27892784444444, 23.117741111111112], [120.28210326666667, 23.117396666666668], [120.2852786888889, 23.117052222222224], [120.28845411111111, 23.116707777777776], [120.29162953333334, 23.116363333333332], [120.29480495555556, 23.11601888888889], [120.29798037777778, 23.115674444444444], [120.3011558, 23.11533], [120.30422126666667, 23.116059222222223], [120.30728673333334, 23.116788444444445], [120.3103522, 23.117517666666668], [120.31341766666667, 23.11824688888889], [120.31648313333334, 23.11897611111111], [120.3195486, 23.119705333333332], [120.32261406666666, 23.120434555555555], [120.32567953333333, 23.121163777777777], [120.328745, 23.121893], [120.32936855555555, 23.124580666666667], [120.32999211111111, 23.127268333333333], [120.33061566666666, 23.129956], [120.33123922222222, 23.132643666666667], [120.33186277777777, 23.135331333333333], [120.33248633333334, 23.138019], [120.33310988888888, 23.140706666666667], [120.33373344444445, 23.143394333333333], [120.334357, 23.146082], [120.33085722222222, 23.148093666666668], [120.32735744444444, 23.150105333333332], [120.32385766666667, 23.152117], [120.32035788888889, 23.154128666666665], [120.3168581111111, 23.156140333333333], [120.31335833333333, 23.158151999999998], [120.30985855555555, 23.160163666666666], [120.30635877777777, 23.16217533333333], [120.302859, 23.164187], [120.30063677777778, 23.16354088888889], [120.29841455555555, 23.162894777777776], [120.29619233333334, 23.162248666666667], [120.29397011111111, 23.161602555555554], [120.29174788888889, 23.160956444444444], [120.28952566666666, 23.16031033333333], [120.28730344444445, 23.159664222222222], [120.28508122222222, 23.15901811111111], [120.282859, 23.158372], [120.28137422222223, 23.157255444444445], [120.27988944444445, 23.15613888888889], [120.27840466666667, 23.155022333333335], [120.2769198888889, 23.15390577777778], [120.27543511111111, 23.15278922222222], [120.27395033333333, 23.151672666666666], [120.27246555555556, 23.15055611111111], [120.27098077777778, 23.149439555555556], [120.269496, 23.148323], [120.26983833333334, 23.145001555555556], [120.27018066666668, 23.14168011111111], [120.270523, 23.13835866666667], [120.27086533333333, 23.135037222222223], [120.27120766666667, 23.131715777777778], [120.27155, 23.128394333333333], [120.27189233333333, 23.12507288888889], [120.27223466666666, 23.121751444444445], [120.272577, 23.11843]]], "type": "Polygon"}, "id": "27", "properties": {"name": "\u5584\u5316\u5340"}, "type": "Feature"}, {"bbox": [120.290336, 23.006621, 120.374474, 23.068084], "geometry": {"coordinates": [[[120.326225, 23.006621], [120.331586, 23.00729422222222], [120.336947, 23.007967444444443], [120.342308, 23.008640666666665], [120.347669, 23.009313888888887], [120.35303, 23.009987111111112], [120.358391, 23.010660333333334], [120.363752, 23.011333555555556], [120.369113, 23.012006777777778], [120.374474, 23.01268], [120.37291266666668, 23.01759322222222], [120.37135133333334, 23.022506444444446], [120.36979000000001, 23.027419666666667], [120.36822866666667, 23.032332888888888], [120.36666733333334, 23.037246111111113], [120.365106, 23.042159333333334], [120.36354466666667, 23.047072555555555], [120.36198333333333, 23.05198577777778], [120.360422, 23.056899], [120.35901256666666, 23.058141777777777], [120.35760313333333, 23.059384555555557], [120.3561937, 23.060627333333333], [120.35478426666667, 23.061870111111112], [120.35337483333333, 23.063112888888888], [120.3519654, 23.064355666666668], [120.35055596666668, 23.065598444444444], [120.34914653333334, 23.066841222222223], [120.3477371, 23.068084], [120.3413592, 23.06601733333333], [120.3349813, 23.063950666666667], [120.3286034, 23.061884], [120.3222255, 23.05981733333333], [120.3158476, 23.057750666666667], [120.3094697, 23.055684], [120.3030918, 23.05361733333333], [120.2967139, 23.051550666666667], [120.290336, 23.049484], [120.29432366666666, 23.044721444444445], [120.29831133333333, 23.03995888888889], [120.30229899999999, 23.03519633333333], [120.30628666666667, 23.030433777777777], [120.31027433333333, 23.025671222222222], [120.314262, 23.020908666666667], [120.31824966666666, 23.01614611111111], [120.32223733333333, 23.011383555555554], [120.326225, 23.006621]]], "type": "Polygon"}, "id": "28", "properties": {"name": "\u65b0\u5316\u5340"}, "type": "Feature"}, {"bbox": [120.265966, 23.064098, 120.328311, 23.098636], "geometry": {"coordinates": [[[120.301141, 23.064098], [120.30415988888889, 23.065393333333333], [120.30717877777778, 23.066688666666668], [120.31019766666667, 23.067984], [120.31321655555556, 23.069279333333334], [120.31623544444444, 23.070574666666666], [120.31925433333333, 23.07187], [120.32227322222222, 23.073165333333332], [120.32529211111111, 23.074460666666667], [120.328311, 23.075756], [120.32779055555555, 23.07768122222222], [120.3272701111111, 23.079606444444444], [120.32674966666667, 23.081531666666667], [120.32622922222222, 23.08345688888889], [120.32570877777778, 23.08538211111111], [120.32518833333333, 23.08730733333333], [120.3246678888889, 23.089232555555554], [120.32414744444445, 23.091157777777777], [120.323627, 23.093083], [120.32221611111112, 23.0937], [120.32080522222222, 23.094317], [120.31939433333334, 23.094934], [120.31798344444445, 23.095551], [120.31657255555555, 23.096168], [120.31516166666667, 23.096785], [120.31375077777778, 23.097402], [120.31233988888889, 23.098019], [120.310929, 23.098636], [120.30593311111112, 23.098257333333333], [120.30093722222223, 23.097878666666666], [120.29594133333333, 23.0975], [120.29094544444445, 23.097121333333334], [120.28594955555556, 23.096742666666664], [120.28095366666668, 23.096363999999998], [120.27595777777778, 23.09598533333333], [120.27096188888889, 23.095606666666665], [120.265966, 23.095228], [120.26987433333333, 23.09176911111111], [120.27378266666668, 23.088310222222223], [120.277691, 23.084851333333333], [120.28159933333333, 23.081392444444443], [120.28550766666667, 23.077933555555557], [120.289416, 23.074474666666667], [120.29332433333333, 23.071015777777777], [120.29723266666667, 23.06755688888889], [120.301141, 23.064098]]], "type": "Polygon"}, "id": "29", "properties": {"name": "\u65b0\u5e02\u5340"}, "type": "Feature"}, {"bbox": [120.257515, 23.27186, 120.339327, 23.327651], "geometry": {"coordinates": [[[120.257515, 23.27186], [120.259259, 23.27208688888889], [120.261003, 23.27231377777778], [120.262747, 23.272540666666668], [120.264491, 23.272767555555557], [120.266235, 23.272994444444443], [120.267979, 23.273221333333332], [120.269723, 23.27344822222222], [120.271467, 23.27367511111111], [120.273211, 23.273902], [120.27941755555555, 23.277826555555556], [120.28562411111112, 23.28175111111111], [120.29183066666667, 23.285675666666666], [120.29803722222222, 23.289600222222223], [120.30424377777778, 23.293524777777776], [120.31045033333334, 23.297449333333333], [120.31665688888889, 23.30137388888889], [120.32286344444445, 23.305298444444443], [120.32907, 23.309223], [120.33020966666666, 23.310292444444443], [120.33134933333334, 23.31136188888889], [120.332489, 23.312431333333333], [120.33362866666667, 23.313500777777776], [120.33476833333333, 23.314570222222223], [120.335908, 23.315639666666666], [120.33704766666666, 23.31670911111111], [120.33818733333334, 23.317778555555556], [120.339327, 23.318848], [120.33718077777777, 23.31982611111111], [120.33503455555555, 23.320804222222222], [120.33288833333333, 23.32178233333333], [120.3307421111111, 23.322760444444445], [120.32859588888888, 23.323738555555554], [120.32644966666666, 23.324716666666667], [120.32430344444444, 23.325694777777777], [120.32215722222222, 23.32667288888889], [120.320011, 23.327651], [120.31702133333333, 23.327591555555554], [120.31403166666666, 23.32753211111111], [120.311042, 23.327472666666665], [120.30805233333334, 23.327413222222223], [120.30506266666666, 23.327353777777777], [120.302073, 23.327294333333334], [120.29908333333333, 23.32723488888889], [120.29609366666666, 23.327175444444446], [120.293104, 23.327116], [120.28914966666666, 23.320976444444444], [120.28519533333333, 23.314836888888888], [120.281241, 23.308697333333335], [120.27728666666667, 23.30255777777778], [120.27333233333333, 23.296418222222222], [120.269378, 23.290278666666666], [120.26542366666666, 23.284139111111113], [120.26146933333334, 23.277999555555557], [120.257515, 23.27186]]], "type": "Polygon"}, "id": "30", "properties": {"name": "\u65b0\u71df\u5340"}, "type": "Feature"}, {"bbox": [120.48227, 23.136843, 120.534272, 23.207176], "geometry": {"coordinates": [[[120.48227, 23.173755], [120.48281688888889, 23.17151022222222], [120.48336377777778, 23.169265444444445], [120.48391066666666, 23.167020666666666], [120.48445755555555, 23.16477588888889], [120.48500444444444, 23.16253111111111], [120.48555133333333, 23.160286333333335], [120.48609822222221, 23.158041555555556], [120.4866451111111, 23.15579677777778], [120.487192, 23.153552], [120.4905721111111, 23.151695444444446], [120.49395222222222, 23.14983888888889], [120.49733233333333, 23.147982333333335], [120.50071244444445, 23.14612577777778], [120.50409255555554, 23.14426922222222], [120.50747266666666, 23.142412666666665], [120.51085277777777, 23.14055611111111], [120.51423288888888, 23.138699555555554], [120.517613, 23.136843], [120.51913144444444, 23.140715555555555], [120.52064988888888, 23.144588111111112], [120.52216833333333, 23.148460666666665], [120.52368677777777, 23.15233322222222], [120.52520522222223, 23.156205777777778], [120.52672366666667, 23.160078333333335], [120.52824211111111, 23.163950888888888], [120.52976055555555, 23.167823444444444], [120.531279, 23.171696], [120.53161155555556, 23.175638222222222], [120.53194411111112, 23.179580444444444], [120.53227666666666, 23.18352266666667], [120.53260922222222, 23.18746488888889], [120.53294177777778, 23.19140711111111], [120.53327433333334, 23.195349333333333], [120.53360688888888, 23.199291555555558], [120.53393944444444, 23.20323377777778], [120.534272, 23.207176], [120.528494, 23.203462555555557], [120.522716, 23.19974911111111], [120.516938, 23.196035666666667], [120.51116, 23.192322222222224], [120.505382, 23.188608777777777], [120.499604, 23.184895333333333], [120.493826, 23.18118188888889], [120.488048, 23.177468444444443], [120.48227, 23.173755]]], "type": "Polygon"}, "id": "31", "properties": {"name": "\u6960\u897f\u5340"}, "type": "Feature"}, {"bbox": [120.155795, 23.214254, 120.217213, 23.281963], "geometry": {"coordinates": [[[120.18372, 23.214254], [120.18586611111111, 23.214994444444446], [120.18801222222221, 23.21573488888889], [120.19015833333333, 23.216475333333335], [120.19230444444445, 23.217215777777778], [120.19445055555555, 23.217956222222224], [120.19659666666666, 23.218696666666666], [120.19874277777778, 23.219437111111112], [120.20088888888888, 23.220177555555555], [120.203035, 23.220918], [120.20461033333333, 23.224614111111112], [120.20618566666667, 23.228310222222223], [120.207761, 23.232006333333334], [120.20933633333334, 23.235702444444446], [120.21091166666666, 23.239398555555557], [120.212487, 23.243094666666668], [120.21406233333333, 23.24679077777778], [120.21563766666667, 23.25048688888889], [120.217213, 23.254183], [120.214155, 23.25726966666667], [120.211097, 23.260356333333334], [120.208039, 23.263443000000002], [120.204981, 23.266529666666667], [120.201923, 23.269616333333335], [120.198865, 23.272703], [120.195807, 23.275789666666668], [120.19274899999999, 23.278876333333333], [120.189691, 23.281963], [120.18592477777777, 23.280375], [120.18215855555555, 23.278787], [120.17839233333333, 23.277199], [120.17462611111111, 23.275611], [120.17085988888888, 23.274023], [120.16709366666666, 23.272435], [120.16332744444445, 23.270847], [120.15956122222222, 23.269259], [120.155795, 23.267671], [120.15889777777778, 23.261735777777776], [120.16200055555555, 23.255800555555556], [120.16510333333333, 23.249865333333332], [120.1682061111111, 23.243930111111112], [120.17130888888889, 23.23799488888889], [120.17441166666666, 23.232059666666668], [120.17751444444444, 23.226124444444444], [120.18061722222221, 23.220189222222224], [120.18372, 23.214254]]], "type": "Polygon"}, "id": "32", "properties": {"name": "\u5b78\u7532\u5340"}, "type": "Feature"}, {"bbox": [120.368368, 22.926433, 120.41638, 22.992276], "geometry": {"coordinates": [[[120.368368, 22.926433], [120.37348655555556, 22.92664222222222], [120.37860511111111, 22.926851444444445], [120.38372366666667, 22.927060666666666], [120.38884222222222, 22.927269888888887], [120.39396077777778, 22.92747911111111], [120.39907933333333, 22.927688333333332], [120.40419788888889, 22.927897555555553], [120.40931644444444, 22.928106777777778], [120.414435, 22.928316], [120.41465111111111, 22.93045411111111], [120.41486722222223, 22.932592222222222], [120.41508333333333, 22.93473033333333], [120.41529944444444, 22.936868444444443], [120.41551555555556, 22.939006555555554], [120.41573166666667, 22.941144666666666], [120.41594777777777, 22.943282777777775], [120.41616388888889, 22.945420888888886], [120.41638, 22.947559], [120.41239211111112, 22.952527555555555], [120.40840422222223, 22.95749611111111], [120.40441633333333, 22.962464666666666], [120.40042844444444, 22.967433222222223], [120.39644055555556, 22.972401777777776], [120.39245266666667, 22.977370333333333], [120.38846477777777, 22.98233888888889], [120.38447688888888, 22.987307444444443], [120.380489, 22.992276], [120.37914222222221, 22.98496011111111], [120.37779544444444, 22.97764422222222], [120.37644866666666, 22.970328333333335], [120.37510188888889, 22.963012444444445], [120.37375511111111, 22.955696555555555], [120.37240833333334, 22.948380666666665], [120.37106155555556, 22.94106477777778], [120.36971477777779, 22.93374888888889], [120.368368, 22.926433]]], "type": "Polygon"}, "id": "33", "properties": {"name": "\u9f8d\u5d0e\u5340"}, "type": "Feature"}, {"bbox": [120.277555, 22.908223, 120.311327, 23.005018], "geometry": {"coordinates": [[[120.277555, 22.926362], [120.279408, 22.924346555555555], [120.281261, 22.922331111111113], [120.283114, 22.920315666666667], [120.284967, 22.91830022222222], [120.28682, 22.91628477777778], [120.288673, 22.914269333333333], [120.290526, 22.912253888888888], [120.292379, 22.910238444444445], [120.294232, 22.908223], [120.29574444444444, 22.911111333333334], [120.29725688888888, 22.913999666666665], [120.29876933333333, 22.916888], [120.30028177777777, 22.919776333333335], [120.30179422222223, 22.922664666666666], [120.30330666666667, 22.925553], [120.30481911111112, 22.928441333333335], [120.30633155555556, 22.931329666666667], [120.307844, 22.934218], [120.308231, 22.936534444444444], [120.30861800000001, 22.93885088888889], [120.309005, 22.941167333333333], [120.309392, 22.94348377777778], [120.309779, 22.94580022222222], [120.31016600000001, 22.948116666666667], [120.310553, 22.95043311111111], [120.31094, 22.952749555555556], [120.311327, 22.955066], [120.30915333333334, 22.96010233333333], [120.30697966666668, 22.965138666666665], [120.304806, 22.970174999999998], [120.30263233333334, 22.97521133333333], [120.30045866666667, 22.980247666666667], [120.298285, 22.985284], [120.29611133333333, 22.990320333333333], [120.29393766666666, 22.995356666666666], [120.291764, 23.000393], [120.29135266666667, 23.00090688888889], [120.29094133333334, 23.001420777777778], [120.29053, 23.001934666666667], [120.29011866666667, 23.002448555555556], [120.28970733333333, 23.002962444444442], [120.289296, 23.00347633333333], [120.28888466666666, 23.00399022222222], [120.28847333333333, 23.00450411111111], [120.288062, 23.005018], [120.28710099999999, 23.00453511111111], [120.28614, 23.00405222222222], [120.285179, 23.003569333333335], [120.284218, 23.003086444444445], [120.283257, 23.002603555555556], [120.282296, 23.002120666666666], [120.281335, 23.00163777777778], [120.28037400000001, 23.00115488888889], [120.279413, 23.000672], [120.27920655555556, 22.992415333333334], [120.27900011111112, 22.98415866666667], [120.27879366666667, 22.975902], [120.27858722222223, 22.967645333333333], [120.27838077777778, 22.95938866666667], [120.27817433333334, 22.951132], [120.2779678888889, 22.942875333333333], [120.27776144444445, 22.93461866666667], [120.277555, 22.926362]]], "type": "Polygon"}, "id": "34", "properties": {"name": "\u6b78\u4ec1\u5340"}, "type": "Feature"}, {"bbox": [120.315054, 22.899127, 120.356541, 23.001128], "geometry": {"coordinates": [[[120.3164402, 22.941236], [120.31955106666666, 22.936557222222223], [120.32266193333334, 22.931878444444443], [120.3257728, 22.927199666666667], [120.32888366666667, 22.92252088888889], [120.33199453333333, 22.91784211111111], [120.3351054, 22.913163333333333], [120.33821626666666, 22.908484555555557], [120.34132713333334, 22.903805777777777], [120.344438, 22.899127], [120.34578277777777, 22.908137888888888], [120.34712755555556, 22.91714877777778], [120.34847233333333, 22.926159666666667], [120.34981711111111, 22.935170555555555], [120.3511618888889, 22.944181444444446], [120.35250666666667, 22.953192333333334], [120.35385144444444, 22.96220322222222], [120.35519622222223, 22.971214111111113], [120.356541, 22.980225], [120.35193133333334, 22.982547555555556], [120.34732166666667, 22.98487011111111], [120.342712, 22.98719266666667], [120.33810233333334, 22.989515222222224], [120.33349266666667, 22.99183777777778], [120.328883, 22.994160333333333], [120.32427333333334, 22.99648288888889], [120.31966366666667, 22.998805444444447], [120.315054, 23.001128], [120.31520802222222, 22.994473333333335], [120.31536204444444, 22.98781866666667], [120.31551606666667, 22.981164], [120.3156700888889, 22.974509333333334], [120.31582411111111, 22.967854666666668], [120.31597813333333, 22.9612], [120.31613215555556, 22.954545333333332], [120.31628617777778, 22.947890666666666], [120.3164402, 22.941236]]], "type": "Polygon"}, "id": "35", "properties": {"name": "\u95dc\u5edf\u5340"}, "type": "Feature"}, {"bbox": [120.2397336, 23.030423, 120.4674459, 23.343498], "geometry": {"coordinates": [[[120.2397336, 23.26223], [120.24560095555555, 23.236473666666665], [120.25146831111111, 23.21071733333333], [120.25733566666666, 23.184960999999998], [120.26320302222221, 23.159204666666664], [120.26907037777778, 23.133448333333334], [120.27493773333333, 23.107692], [120.28080508888888, 23.081935666666666], [120.28667244444445, 23.056179333333333], [120.2925398, 23.030423], [120.31197381111112, 23.037408666666664], [120.33140782222222, 23.044394333333333], [120.35084183333333, 23.051379999999998], [120.37027584444445, 23.058365666666667], [120.38970985555555, 23.065351333333332], [120.40914386666667, 23.072337], [120.42857787777778, 23.079322666666666], [120.44801188888889, 23.086308333333335], [120.4674459, 23.093294], [120.44657635555555, 23.121094444444445], [120.42570681111111, 23.14889488888889], [120.40483726666666, 23.176695333333335], [120.38396772222222, 23.20449577777778], [120.36309817777777, 23.23229622222222], [120.34222863333333, 23.260096666666666], [120.32135908888888, 23.28789711111111], [120.30048954444445, 23.315697555555555], [120.27962, 23.343498], [120.27695977777778, 23.34166666666667], [120.27429955555556, 23.339835333333333], [120.27163933333333, 23.338004], [120.26897911111111, 23.336172666666666], [120.26631888888889, 23.334341333333334], [120.26365866666667, 23.33251], [120.26099844444444, 23.330678666666667], [120.25833822222222, 23.328847333333332], [120.255678, 23.327016], [120.2539064, 23.319817555555556], [120.25213480000001, 23.31261911111111], [120.2503632, 23.305420666666667], [120.2485916, 23.298222222222222], [120.24682, 23.291023777777777], [120.2450484, 23.283825333333333], [120.24327679999999, 23.276626888888888], [120.24150519999999, 23.269428444444443], [120.2397336, 23.26223]]], "type": "Polygon"}, "id": "36", "properties": {"name": "\u9e7d\u6c34\u5340"}, "type": "Feature"}], "type": "FeatureCollection"});
+            // 依目前縮放等級向伺服器取得預先簡化的行政區邊界,等級不變時不重新載入
+            // 有載入 topojson-client 時下載較小的 TopoJSON,再於瀏覽器還原為 GeoJSON
+            var geo_json_014c6a9120a5c11bc489ee475900b450_level = null;
+            var geo_json_014c6a9120a5c11bc489ee475900b450_topojson = typeof topojson !== 'undefined';
+            function geo_json_014c6a9120a5c11bc489ee475900b450_load() {
+                var zoom = Math.floor(map_f2afd72358c706652935c17e26a90203.getZoom());
+                var format = geo_json_014c6a9120a5c11bc489ee475900b450_topojson ? 'topojson' : 'geojson';
+                fetch('/api/boundaries?zoom=' + zoom + '&format=' + format)
+                    .then(response => {
+                        if (!response.ok) {
+                            throw new Error('無法載入行政區邊界');
+                        }
+                        var level = response.headers.get('X-Boundary-Level');
+                        if (level === geo_json_014c6a9120a5c11bc489ee475900b450_level) {
+                            return null;
+                        }
+                        geo_json_014c6a9120a5c11bc489ee475900b450_level = level;
+                        return response.json();
+                    })
+                    .then(data => {
+                        if (data === null) {
+                            return;
+                        }
+                        if (data.type === 'Topology') {
+                            data = topojson.feature(data, data.objects.districts);
+                        }
+                        geo_json_014c6a9120a5c11bc489ee475900b450.clearLayers();
+                        geo_json_014c6a9120a5c11bc489ee475900b450_add(data);
+                    })
+                    .catch(error => {
+                        console.error('載入行政區邊界失敗:', error);
+                    });
+            }
+            geo_json_014c6a9120a5c11bc489ee475900b450_load();
+            map_f2afd72358c706652935c17e26a90203.on('zoomend', geo_json_014c6a9120a5c11bc489ee475900b450_load);
 
         
     